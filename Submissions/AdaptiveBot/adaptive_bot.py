@@ -25,8 +25,14 @@ Shooting Strategy:
 
 from robocode_tank_royale.bot_api import Bot, BotInfo, Color
 import math
+import sys
+from pathlib import Path
 import numpy as np
 
+# Shared helpers (tank_utils) live in the repo root
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from tank_utils import AnytimeScheduler, AnytimeTask, compass, turn_budget_ms
+
 
 class FieldBasedMovement:
     """Calculates movement using field-based analysis"""
@@ -142,13 +148,11 @@ class FieldBasedMovement:
         # Check positions within max move distance
         search_radius = self.max_move_distance
         
-        for angle in range(0, 360, 15):  # Check every 15 degrees
-            angle_rad = math.radians(angle)
-            
+        for angle, sin_a, cos_a in compass(15):  # Check every 15 degrees
             # Check multiple distances
             for distance in [search_radius * 0.3, search_radius * 0.6, search_radius]:
-                test_x = my_x + distance * math.sin(angle_rad)
-                test_y = my_y + distance * math.cos(angle_rad)
+                test_x = my_x + distance * sin_a
+                test_y = my_y + distance * cos_a
                 
                 # Check if position is in bounds
                 if test_x < 20 or test_x >= width - 20 or test_y < 20 or test_y >= height - 20:
@@ -173,6 +177,23 @@ class FieldBasedMovement:
         
         return best_x, best_y, best_value
 
+    def plan_steps(self, my_x, my_y, my_direction, enemies, bullets, width, height):
+        """
+        The whole field + position search, in small pieces (for an AnytimeTask)
+
+        Yields None while the field is being built, then the best
+        (x, y, value) found so far while reachable positions are checked.
+        """
+        field = self.create_field(width, height)
+        for enemy_x, enemy_y, energy in enemies:
+            self.add_enemy_repulsion(field, my_x, my_y, [enemy_x], [enemy_y], [energy], width, height)
+            yield None
+        self.add_wall_penalties(field, width, height)
+        yield None
+        self.add_bullet_penalties(field, bullets, width, height)
+        yield None
+        yield self.find_best_reachable_position(field, my_x, my_y, my_direction, width, height)
+
 
 class PredictiveTargeting:
     """Predictive shooting with hit probability"""
@@ -270,6 +291,17 @@ class AdaptiveBot(Bot):
         # Movement state
         self.target_position = None
         self.ticks = 0
+
+        # The field is built a piece at a time within each turn's spare time,
+        # so a crowded arena slows down planning instead of making us skip turns
+        self.thinking = AnytimeScheduler()
+        self.plan = self.thinking.add(AnytimeTask(self.movement.plan_steps, inputs=self.plan_inputs))
+        
+    def plan_inputs(self):
+        """Snapshot of the battle for the next movement plan"""
+        enemies = [(e['x'], e['y'], e['energy']) for e in self.enemies.values()]
+        return (self.get_x(), self.get_y(), self.get_direction(), enemies,
+                self.bullet_tracker.get_active_bullets(), self.get_arena_width(), self.get_arena_height())
         
     async def run(self):
         """Main loop"""
@@ -279,35 +311,9 @@ class AdaptiveBot(Bot):
             # Update bullet tracker
             self.bullet_tracker.update(self.ticks)
             
-            # Create field and evaluate positions
-            field = self.movement.create_field(self.get_arena_width(), self.get_arena_height())
-            
-            # Get enemy data
-            enemies_x = [e['x'] for e in self.enemies.values()]
-            enemies_y = [e['y'] for e in self.enemies.values()]
-            enemies_energy = [e['energy'] for e in self.enemies.values()]
-            
-            # Apply forces to field
-            field = self.movement.add_enemy_repulsion(
-                field, self.get_x(), self.get_y(),
-                enemies_x, enemies_y, enemies_energy,
-                self.get_arena_width(), self.get_arena_height()
-            )
-            
-            field = self.movement.add_wall_penalties(
-                field, self.get_arena_width(), self.get_arena_height()
-            )
-            
-            field = self.movement.add_bullet_penalties(
-                field, self.bullet_tracker.get_active_bullets(),
-                self.get_arena_width(), self.get_arena_height()
-            )
-            
-            # Find best reachable position
-            best_x, best_y, value = self.movement.find_best_reachable_position(
-                field, self.get_x(), self.get_y(), self.get_direction(),
-                self.get_arena_width(), self.get_arena_height()
-            )
+            # Work on the movement plan for as long as this turn allows
+            self.thinking.run(turn_budget_ms(self))
+            best_x, best_y, value = self.plan.result or (self.get_x(), self.get_y(), 0)
             
             # Move toward best position
             angle_to_target = self.targeting.calculate_angle(
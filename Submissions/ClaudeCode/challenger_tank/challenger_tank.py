@@ -19,63 +19,31 @@ from robocode_tank_royale.bot_api import Bot, Color, BotInfo
 import numpy as np
 import math
 import random
+import sys
 from collections import deque
+from pathlib import Path
 
+# Shared helpers (tank_utils) live in the repo root
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from tank_utils import BulletWarning, EnemyTracker, TargetingSystem
 
-# ============= CORE SYSTEMS (From Tutorials) =============
-
-class _TargetingSystem:
-    """Advanced targeting with vectorized operations"""
-
-    def calculate_distance(self, from_x, from_y, to_x, to_y):
-        x_diff = to_x - from_x
-        y_diff = to_y - from_y
-        return math.sqrt(x_diff**2 + y_diff**2)
-
-    def calculate_distances(self, my_x, my_y, enemy_x, enemy_y):
-        x_diff = enemy_x - my_x
-        y_diff = enemy_y - my_y
-        return np.sqrt(x_diff**2 + y_diff**2)
-
-    def calculate_angle(self, from_x, from_y, to_x, to_y):
-        x_diff = to_x - from_x
-        y_diff = to_y - from_y
-        return math.degrees(math.atan2(x_diff, y_diff))
 
-    def calculate_angles(self, my_x, my_y, enemy_x, enemy_y):
-        x_diff = enemy_x - my_x
-        y_diff = enemy_y - my_y
-        return np.degrees(np.arctan2(x_diff, y_diff))
-
-    def predict_positions(self, x, y, vx, vy, time):
-        future_x = x + vx * time
-        future_y = y + vy * time
-        return future_x, future_y
-
-    def calculate_bullet_speed(self, power):
-        return 20 - 3 * power
+# ============= CORE SYSTEMS (From Tutorials) =============
 
+# TargetingSystem and EnemyTracker come from tank_utils (repo root)
 
-class _EnemyTracker:
+class _EnemyTracker(EnemyTracker):
     """Multi-enemy tracking with pattern history"""
 
     def __init__(self, max_enemies=50):
-        self.max_enemies = max_enemies
-        self.enemy_ids = []
-        self.x = np.array([])
-        self.y = np.array([])
-        self.vx = np.array([])
-        self.vy = np.array([])
-        self.energy = np.array([])
-        self.last_seen = np.array([])
+        super().__init__(max_enemies)
 
         # EXTRA: Pattern history for learning
         self.pattern_history = {}
 
     def update(self, enemy_id, x, y, vx, vy, energy, tick):
-        if enemy_id in self.enemy_ids:
-            idx = self.enemy_ids.index(enemy_id)
-
+        idx = self.index_of(enemy_id)
+        if idx is not None:
             # EXTRA: Track pattern changes
             old_vx, old_vy = self.vx[idx], self.vy[idx]
             if enemy_id not in self.pattern_history:
@@ -85,50 +53,15 @@ class _EnemyTracker:
                 'dvy': vy - old_vy,
                 'tick': tick
             })
-
-            self.x[idx] = x
-            self.y[idx] = y
-            self.vx[idx] = vx
-            self.vy[idx] = vy
-            self.energy[idx] = energy
-            self.last_seen[idx] = tick
-        else:
-            if len(self.enemy_ids) < self.max_enemies:
-                self.enemy_ids.append(enemy_id)
-                self.x = np.append(self.x, x)
-                self.y = np.append(self.y, y)
-                self.vx = np.append(self.vx, vx)
-                self.vy = np.append(self.vy, vy)
-                self.energy = np.append(self.energy, energy)
-                self.last_seen = np.append(self.last_seen, tick)
-                self.pattern_history[enemy_id] = deque(maxlen=20)
+        elif len(self.enemy_ids) < self.max_enemies:
+            self.pattern_history[enemy_id] = deque(maxlen=20)
+        super().update(enemy_id, x, y, vx, vy, energy, tick)
 
     def cleanup(self, current_tick, max_age=200):
-        if len(self.enemy_ids) == 0:
-            return
-
-        age = current_tick - self.last_seen
-        keep = age < max_age
-
-        if not np.any(keep):
-            self.__init__(self.max_enemies)
-            return
-
-        keep_idx = np.where(keep)[0]
-        removed = [self.enemy_ids[i] for i in range(len(self.enemy_ids)) if i not in keep_idx]
+        removed = super().cleanup(current_tick, max_age)
         for enemy_id in removed:
             self.pattern_history.pop(enemy_id, None)
-
-        self.enemy_ids = [self.enemy_ids[i] for i in keep_idx]
-        self.x = self.x[keep]
-        self.y = self.y[keep]
-        self.vx = self.vx[keep]
-        self.vy = self.vy[keep]
-        self.energy = self.energy[keep]
-        self.last_seen = self.last_seen[keep]
-
-    def count(self):
-        return len(self.enemy_ids)
+        return removed
 
 
 # ============= ADVANCED ANTI-GRAVITY WITH PREDICTION =============
@@ -336,24 +269,15 @@ class _BulletDodgeSystem:
             # Predict bullet trajectory (assume aimed at us)
             angle = math.degrees(math.atan2(my_x - enemy_x, my_y - enemy_y))
 
-            self.bullet_warnings.append({
-                'power': bullet_power,
-                'angle': angle,
-                'enemy_x': enemy_x,
-                'enemy_y': enemy_y,
-                'age': 0
-            })
+            self.bullet_warnings.append(BulletWarning(bullet_power, enemy_x, enemy_y, angle))
 
     def should_dodge(self, my_x, my_y):
         """Check if we should dodge now"""
         for bullet in self.bullet_warnings:
-            bullet['age'] += 1
+            bullet.age += 1
 
             # Calculate bullet position
-            speed = 20 - 3 * bullet['power']
-            angle_rad = math.radians(bullet['angle'])
-            bullet_x = bullet['enemy_x'] + speed * bullet['age'] * math.sin(angle_rad)
-            bullet_y = bullet['enemy_y'] + speed * bullet['age'] * math.cos(angle_rad)
+            bullet_x, bullet_y = bullet.position()
 
             # Check if close to us
             dist = math.sqrt((bullet_x - my_x)**2 + (bullet_y - my_y)**2)
@@ -361,7 +285,7 @@ class _BulletDodgeSystem:
                 return True
 
         # Clean old warnings
-        self.bullet_warnings = [b for b in self.bullet_warnings if b['age'] < 50]
+        self.bullet_warnings = [b for b in self.bullet_warnings if b.age < 50]
 
         return False
 
@@ -438,7 +362,7 @@ class ChallengerTank(Bot):
 
         # Core systems
         self.enemies = _EnemyTracker(max_enemies=50)
-        self.targeting = _TargetingSystem()
+        self.targeting = TargetingSystem()
 
         # Advanced systems
         self.anti_gravity = _PredictiveAntiGravity(base_force=1500)
@@ -654,8 +578,8 @@ class ChallengerTank(Bot):
 
         # EXTRA: Detect bullet fired
         prev_energy = None
-        if event.scanned_bot_id in self.enemies.enemy_ids:
-            idx = self.enemies.enemy_ids.index(event.scanned_bot_id)
+        idx = self.enemies.index_of(event.scanned_bot_id)
+        if idx is not None:
             prev_energy = self.enemies.energy[idx]
 
         self.bullet_dodge.detect_bullet_fired(
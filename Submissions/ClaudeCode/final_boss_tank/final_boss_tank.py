@@ -18,115 +18,17 @@ from robocode_tank_royale.bot_api import Bot, BotInfo, Color
 import numpy as np
 import math
 import random
+import sys
+from pathlib import Path
 
+# Shared helpers (tank_utils) live in the repo root
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from tank_utils import EnemyTracker, TargetingSystem
 
-# ============= WEEK 6: MODULAR ARCHITECTURE =============
-
-class _TargetingSystem:
-    """Week 2 & 7: Math utilities with NumPy optimization"""
-
-    def calculate_distance(self, from_x, from_y, to_x, to_y):
-        """Calculate distance using Pythagorean theorem"""
-        x_diff = to_x - from_x
-        y_diff = to_y - from_y
-        return math.sqrt(x_diff**2 + y_diff**2)
-
-    def calculate_distances(self, my_x, my_y, enemy_x, enemy_y):
-        """Calculate distance to ALL enemies at once (vectorized)"""
-        x_diff = enemy_x - my_x
-        y_diff = enemy_y - my_y
-        return np.sqrt(x_diff**2 + y_diff**2)
-
-    def calculate_angle(self, from_x, from_y, to_x, to_y):
-        """Calculate angle to target"""
-        x_diff = to_x - from_x
-        y_diff = to_y - from_y
-        return math.degrees(math.atan2(x_diff, y_diff))
-
-    def calculate_angles(self, my_x, my_y, enemy_x, enemy_y):
-        """Calculate angles to ALL enemies at once"""
-        x_diff = enemy_x - my_x
-        y_diff = enemy_y - my_y
-        return np.degrees(np.arctan2(x_diff, y_diff))
-
-    def predict_position(self, x, y, velocity, heading, time):
-        """Predict future position of moving target"""
-        heading_rad = math.radians(heading)
-        future_x = x + velocity * time * math.sin(heading_rad)
-        future_y = y + velocity * time * math.cos(heading_rad)
-        return future_x, future_y
-
-    def predict_positions(self, x, y, vx, vy, time):
-        """Predict future positions of ALL enemies"""
-        future_x = x + vx * time
-        future_y = y + vy * time
-        return future_x, future_y
-
-    def calculate_bullet_speed(self, power):
-        """Calculate bullet speed from power"""
-        return 20 - 3 * power
-
-
-# ============= WEEK 7: MULTI-ENEMY TRACKING =============
-
-class _EnemyTracker:
-    """Efficiently track multiple enemies using NumPy arrays"""
-
-    def __init__(self, max_enemies=50):
-        self.max_enemies = max_enemies
-        self.enemy_ids = []
-        self.x = np.array([])
-        self.y = np.array([])
-        self.vx = np.array([])
-        self.vy = np.array([])
-        self.energy = np.array([])
-        self.last_seen = np.array([])
-
-    def update(self, enemy_id, x, y, vx, vy, energy, tick):
-        """Add or update enemy in tracking system"""
-        if enemy_id in self.enemy_ids:
-            idx = self.enemy_ids.index(enemy_id)
-            self.x[idx] = x
-            self.y[idx] = y
-            self.vx[idx] = vx
-            self.vy[idx] = vy
-            self.energy[idx] = energy
-            self.last_seen[idx] = tick
-        else:
-            if len(self.enemy_ids) < self.max_enemies:
-                self.enemy_ids.append(enemy_id)
-                self.x = np.append(self.x, x)
-                self.y = np.append(self.y, y)
-                self.vx = np.append(self.vx, vx)
-                self.vy = np.append(self.vy, vy)
-                self.energy = np.append(self.energy, energy)
-                self.last_seen = np.append(self.last_seen, tick)
-
-    def cleanup(self, current_tick, max_age=200):
-        """Remove stale enemy data"""
-        if len(self.enemy_ids) == 0:
-            return
-
-        age = current_tick - self.last_seen
-        keep = age < max_age
-
-        if not np.any(keep):
-            self.__init__(self.max_enemies)
-            return
-
-        keep_idx = np.where(keep)[0]
-        self.enemy_ids = [self.enemy_ids[i] for i in keep_idx]
-        self.x = self.x[keep]
-        self.y = self.y[keep]
-        self.vx = self.vx[keep]
-        self.vy = self.vy[keep]
-        self.energy = self.energy[keep]
-        self.last_seen = self.last_seen[keep]
-
-    def count(self):
-        """Number of tracked enemies"""
-        return len(self.enemy_ids)
 
+# ============= WEEKS 6 & 7: SHARED SYSTEMS =============
+# TargetingSystem (vectorized math) and EnemyTracker (NumPy multi-enemy
+# tracking) come from tank_utils in the repo root, shared with other tanks
 
 # ============= WEEK 8: ANTI-GRAVITY & CLUSTER DETECTION =============
 
@@ -343,7 +245,7 @@ class _AdvancedTargetingSystem:
     """Hit probability, shot simulation, optimal power selection"""
 
     def __init__(self):
-        self.targeting = _TargetingSystem()
+        self.targeting = TargetingSystem()
 
     def calculate_hit_probability(self, distance, velocity, power):
         """Estimate hit probability based on distance and velocity"""
@@ -466,10 +368,10 @@ class FinalBossTank(Bot):
 
 
         # Week 7: Enemy tracking
-        self.enemies = _EnemyTracker(max_enemies=50)
+        self.enemies = EnemyTracker(max_enemies=50)
 
         # Week 6: Modular systems
-        self.targeting = _TargetingSystem()
+        self.targeting = TargetingSystem()
         self.advanced_targeting = _AdvancedTargetingSystem()
         self.boundary = _BoundaryValidator()
 
@@ -663,8 +565,33 @@ class FinalBossTank(Bot):
 
     async def engage_best_target(self):
         """Week 5 & 7: Advanced target selection and engagement"""
-        if self.enemies.count() == 0:
+        shot = self.choose_shot()
+        if shot is None:
             return
+        _, angle, bullet_power, good_shot = shot
+
+        # Always aim gun at predicted position
+        gun_turn = self.calc_gun_turn(angle)
+        self.gun_turn_rate = gun_turn
+
+        # ONLY FIRE if: good shot AND gun is accurately aimed
+        if good_shot and abs(gun_turn) < 12:
+            await self.fire(bullet_power)
+            self.shots_fired += 1
+
+    def choose_shot(self):
+        """
+        Pick the best target and work out the shot - without turning or firing
+
+        scripts/targeting_benchmark.py calls this too, so every change to
+        the gun can be checked against recorded battles.
+
+        Returns:
+            (enemy id, gun angle, bullet power, good shot?) or None if no
+            enemy is tracked
+        """
+        if self.enemies.count() == 0:
+            return None
 
         # Calculate distances to all enemies
         distances = self.targeting.calculate_distances(
@@ -674,7 +601,7 @@ class FinalBossTank(Bot):
 
         # Target selection: close + weak enemies
         scores = (1000 / (distances + 1)) + (100 - self.enemies.energy) * 2
-        best_idx = np.argmax(scores)
+        best_idx = int(np.argmax(scores))
 
         # Get target info
         target_x = self.enemies.x[best_idx]
@@ -706,12 +633,9 @@ class FinalBossTank(Bot):
                                              self.get_arena_height()):
             future_x[0], future_y[0] = target_x, target_y
 
-        # Always aim gun at predicted position
         angle = self.targeting.calculate_angle(
             self.get_x(), self.get_y(), future_x[0], future_y[0]
         )
-        gun_turn = self.calc_gun_turn(angle)
-        self.gun_turn_rate = gun_turn
 
         # Week 5: Calculate hit probability
         hit_prob = self.advanced_targeting.calculate_hit_probability(
@@ -724,10 +648,8 @@ class FinalBossTank(Bot):
             bullet_power, self.get_arena_width(), self.get_arena_height()
         )
 
-        # ONLY FIRE if: good shot AND gun is accurately aimed AND actually have valid enemies
-        if self.enemies.count() > 0 and (will_hit or hit_prob > 0.35 or target_distance < 150) and abs(gun_turn) < 12:
-            await self.fire(bullet_power)
-            self.shots_fired += 1
+        good_shot = bool(will_hit or hit_prob > 0.35 or target_distance < 150)
+        return self.enemies.enemy_ids[best_idx], angle, bullet_power, good_shot
 
     async def on_hit_by_bullet(self, event):
         """Week 4: Reactive dodging"""
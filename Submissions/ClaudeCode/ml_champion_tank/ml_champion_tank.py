@@ -8,12 +8,17 @@ import random
 import pickle
 import json
 import os
+import sys
 from pathlib import Path
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import Optional
 import numpy as np
 
+# Shared helpers (tank_utils) live in the repo root
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from tank_utils import EnemyRecord
+
 
 @dataclass
 class EvolvableParameters:
@@ -133,8 +138,8 @@ class MLChampionTank(Bot):
                 self.turn_rate = 10
             else:
                 # Lock radar on enemy
-                dx = self.enemy['x'] - self.get_x()
-                dy = self.enemy['y'] - self.get_y()
+                dx = self.enemy.x - self.get_x()
+                dy = self.enemy.y - self.get_y()
                 angle_to_enemy = math.degrees(math.atan2(dy, dx))
                 radar_turn = self.normalize_angle(angle_to_enemy - self.get_radar_direction())
                 if radar_turn < 0:
@@ -149,13 +154,13 @@ class MLChampionTank(Bot):
     async def execute_qlearning_action(self):
         """Execute action using Q-learning"""
         # Calculate distance
-        dx = self.enemy['x'] - self.get_x()
-        dy = self.enemy['y'] - self.get_y()
+        dx = self.enemy.x - self.get_x()
+        dy = self.enemy.y - self.get_y()
         distance = math.sqrt(dx*dx + dy*dy)
 
         # Create state
         new_state = CombatState.from_data(
-            self.get_energy(), self.enemy['energy'], distance, self.params
+            self.get_energy(), self.enemy.energy, distance, self.params
         )
 
         # Update Q-value
@@ -192,12 +197,12 @@ class MLChampionTank(Bot):
         time_to_hit = distance / bullet_speed
 
         # Use enemy velocity for proper linear prediction
-        if self.enemy and 'speed' in self.enemy and 'direction' in self.enemy:
+        if self.enemy:
             # Linear prediction based on current velocity
-            enemy_x = self.enemy['x']
-            enemy_y = self.enemy['y']
-            enemy_speed = self.enemy['speed']
-            enemy_heading = self.enemy['direction']
+            enemy_x = self.enemy.x
+            enemy_y = self.enemy.y
+            enemy_speed = self.enemy.speed
+            enemy_heading = self.enemy.direction
 
             # Predict where they'll be when bullet arrives
             heading_rad = math.radians(enemy_heading)
@@ -304,8 +309,8 @@ class MLChampionTank(Bot):
         reward = 0.0
 
         # Reward for damaging enemy
-        if self.enemy['energy'] < self.last_enemy_energy:
-            damage = self.last_enemy_energy - self.enemy['energy']
+        if self.enemy.energy < self.last_enemy_energy:
+            damage = self.last_enemy_energy - self.enemy.energy
             reward += damage * self.params.damage_dealt_weight
 
         # Penalty for taking damage
@@ -314,14 +319,14 @@ class MLChampionTank(Bot):
             reward += damage * self.params.damage_taken_weight
 
         # Small reward for being close (encourages aggression)
-        dx = self.enemy['x'] - self.get_x()
-        dy = self.enemy['y'] - self.get_y()
+        dx = self.enemy.x - self.get_x()
+        dy = self.enemy.y - self.get_y()
         distance = math.sqrt(dx*dx + dy*dy)
         if distance < 200:
             reward += 1.0  # Reward for closing distance
 
         self.last_my_energy = self.get_energy()
-        self.last_enemy_energy = self.enemy['energy']
+        self.last_enemy_energy = self.enemy.energy
         return reward
 
     def normalize_angle(self, angle):
@@ -332,13 +337,9 @@ class MLChampionTank(Bot):
         return angle
 
     async def on_scanned_bot(self, event):
-        self.enemy = {
-            'x': event.x,
-            'y': event.y,
-            'energy': event.energy,
-            'speed': event.speed,
-            'direction': event.direction,
-        }
+        if self.enemy is None:
+            self.enemy = EnemyRecord(event.scanned_bot_id)
+        self.enemy.update(event, self.get_x(), self.get_y(), self.tick)
         if self.last_enemy_energy is None or self.last_enemy_energy == 100.0:
             self.last_enemy_energy = event.energy
 
@@ -4,6 +4,7 @@ Training script for evolving ML Champion Tank parameters
 This script runs a genetic algorithm to evolve the meta-parameters
 that control the bot's Q-learning behavior and combat strategy.
 """
+import sys
 import json
 import random
 import numpy as np
@@ -11,6 +12,15 @@ from pathlib import Path
 from dataclasses import asdict
 from ml_champion_tank import EvolvableParameters
 
+# Shared evaluation log lives next to tank_utils/ in the repo root
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from fitness_store import FitnessStore, generation_seeds
+
+
+# Opponents every individual is evaluated against, with new seeds every generation
+TRAINING_OPPONENTS = ["simulated"]
+SEEDS_PER_GENERATION = 3
+
 
 class EvolutionEngine:
     """Manages genetic algorithm evolution of parameters"""
@@ -137,7 +147,7 @@ class EvolutionEngine:
         return True
 
 
-def simulate_battle_fitness(params: EvolvableParameters) -> float:
+def simulate_battle_fitness(params: EvolvableParameters, opponent: str = "simulated", seed: int = 0) -> float:
     """
     Placeholder fitness function
 
@@ -169,8 +179,8 @@ def simulate_battle_fitness(params: EvolvableParameters) -> float:
     if 0.85 < params.discount_factor < 0.95:
         fitness += 40
 
-    # Add randomness to simulate battle variance
-    fitness += random.gauss(0, 30)
+    # Add randomness to simulate battle variance (repeatable per seed)
+    fitness += random.Random(f"{opponent}:{seed}").gauss(0, 30)
 
     return fitness
 
@@ -181,6 +191,7 @@ def train_evolution(generations: int = 20):
     print(f"   Generations: {generations}")
 
     engine = EvolutionEngine(population_size=15)
+    store = FitnessStore("ml_champion_evaluations.jsonl")
 
     if not engine.load_population():
         engine.initialize_population()
@@ -190,11 +201,12 @@ def train_evolution(generations: int = 20):
         print(f"GENERATION {gen + 1}/{generations}")
         print(f"{'='*60}")
 
-        # Evaluate fitness for each individual
+        # Evaluate fitness for each individual (battles already in the store are skipped)
         print("\n🎮 Running battles...")
+        seeds = generation_seeds(engine.generation, SEEDS_PER_GENERATION)
         for i, params in enumerate(engine.population):
             # In real implementation, run actual battles here
-            params.fitness = simulate_battle_fitness(params)
+            params.fitness = store.evaluate(params, TRAINING_OPPONENTS, seeds, simulate_battle_fitness)
             print(f"  Individual {i+1}: fitness={params.fitness:.1f}")
 
         # Evolve
@@ -206,6 +218,7 @@ def train_evolution(generations: int = 20):
 
     print(f"\n✅ Training complete!")
     print(f"   Best fitness: {engine.best_fitness:.1f}")
+    store.print_statistics()
     engine.save_population()
     engine.save_best()
 
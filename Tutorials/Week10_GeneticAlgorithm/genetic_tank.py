@@ -17,6 +17,7 @@ import math
 import random
 import json
 import os
+import sys
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from typing import List, Tuple, Optional
@@ -565,6 +566,17 @@ class GeneticTank(Bot):
 
 # ============= TRAINING MODE =============
 
+# Opponents every genome is evaluated against, with new seeds every generation
+TRAINING_OPPONENTS = ["sitting_duck", "spin_bot", "walls"]
+SEEDS_PER_GENERATION = 2
+
+
+def placeholder_battle(genome: CombatGenome, opponent: str, seed: int) -> float:
+    """Stand-in for a real battle against one opponent (random score for demonstration)"""
+    # This should be replaced with actual battle results
+    return random.uniform(-100, 500)
+
+
 def train_genetic_algorithm(generations: int = 50, population_size: int = 20):
     """
     Train the genetic algorithm over multiple generations
@@ -576,7 +588,12 @@ def train_genetic_algorithm(generations: int = 50, population_size: int = 20):
     print(f"   Generations: {generations}")
     print(f"   Population size: {population_size}")
     
+    # Shared evaluation log lives next to tank_utils/ in the repo root
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+    from fitness_store import FitnessStore, generation_seeds
+    
     engine = GeneticEvolutionEngine(population_size)
+    store = FitnessStore("genetic_evaluations.jsonl")
     
     # Try to load existing population or create new
     if not engine.load_population():
@@ -595,10 +612,12 @@ def train_genetic_algorithm(generations: int = 50, population_size: int = 20):
         # 2. Call engine.evolve_generation()
         # 3. Save progress
         
-        # Placeholder: Random fitness for demonstration
+        # Every battle is remembered, so elites carried over from the last
+        # generation keep their old battles and add this generation's new ones
+        seeds = generation_seeds(engine.generation, SEEDS_PER_GENERATION)
         for genome in engine.population:
-            # This should be replaced with actual battle results
-            genome.fitness = random.uniform(-100, 500)
+            genome.fitness = store.evaluate(genome, TRAINING_OPPONENTS, seeds, placeholder_battle)
+            genome.battles_fought = len(store.evaluations(genome))
         
         # Evolve to next generation
         engine.evolve_generation()
@@ -614,6 +633,7 @@ def train_genetic_algorithm(generations: int = 50, population_size: int = 20):
     
     print(f"\n✅ Training complete!")
     print(f"   Best fitness achieved: {engine.best_fitness:.1f}")
+    store.print_statistics()
     engine.save_population()
 
 
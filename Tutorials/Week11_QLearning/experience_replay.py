@@ -0,0 +1,347 @@
+"""
+Experience Replay - Offline Training for Q-Learning Tanks
+Week 11: Q-Learning - Learning From Old Battles
+
+During a live battle the tank can only do one Q-update per tick, so it
+learns exactly as fast as the game runs. This module lets the tank write
+every (state, action, reward, next_state, done) transition it sees into a
+small append-only binary file. Later, the offline trainer can sweep over
+millions of those transitions with vectorized NumPy TD updates and write
+the improved Q-table back to disk - no game server needed!
+
+Replay file layout:
+    header : 8-byte magic, state size (uint8), action count (uint8), 2 spare bytes
+    records: fixed-size packed rows (see record_dtype), appended in blocks
+
+Usage:
+    # Record transitions while battling
+    python qlearning_tank.py --replay-log qlearning_replay.bin
+
+    # Train offline from one or more replay files
+    python experience_replay.py qlearning_replay.bin --qtable qlearning_qtable.pkl --epochs 10
+    python experience_replay.py runs/*.bin --prioritized
+"""
+import os
+import struct
+import argparse
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from selfplay import merge_into_file, read_table
+
+
+REPLAY_MAGIC = b"QREPLAY1"
+HEADER_FORMAT = "<8sBBH"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+
+def record_dtype(state_size: int) -> np.dtype:
+    """
+    Packed on-disk layout of one transition
+
+    With the 5-bucket CombatState each record is only 16 bytes,
+    so a million transitions fit in about 16 MB.
+    """
+    return np.dtype([
+        ('state', np.uint8, (state_size,)),
+        ('action', np.uint8),
+        ('reward', np.float32),
+        ('next_state', np.uint8, (state_size,)),
+        ('done', np.uint8),
+    ])
+
+
+def read_header(path: str) -> Tuple[int, int]:
+    """Read (state_size, n_actions) from a replay file header"""
+    with open(path, 'rb') as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError(f"{path} is too short to be a replay file")
+    magic, state_size, n_actions, _ = struct.unpack(HEADER_FORMAT, raw)
+    if magic != REPLAY_MAGIC:
+        raise ValueError(f"{path} is not a replay file (bad magic {magic!r})")
+    return state_size, n_actions
+
+
+class ReplayLogWriter:
+    """
+    Append-only transition logger used by the tank during battles
+
+    Transitions are collected in a preallocated NumPy buffer and written
+    in one block per flush, so logging costs almost nothing per tick.
+    Each flush opens the file in append mode, which keeps whole blocks
+    intact even when several tanks log to the same file.
+    """
+
+    def __init__(self, path: str, state_size: int, n_actions: int, buffer_size: int = 4096):
+        self.path = path
+        self.state_size = state_size
+        self.n_actions = n_actions
+        self.dtype = record_dtype(state_size)
+        self._buffer = np.zeros(buffer_size, dtype=self.dtype)
+        self._count = 0
+        self.total_logged = 0
+
+        # Refuse to mix incompatible transitions in one file
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            existing = read_header(path)
+            if existing != (state_size, n_actions):
+                raise ValueError(
+                    f"{path} holds transitions with state size {existing[0]} and "
+                    f"{existing[1]} actions, expected {state_size} and {n_actions}"
+                )
+
+    def append(self, state: Tuple, action: int, reward: float, next_state: Tuple, done: bool):
+        """Buffer one transition, flushing when the buffer is full"""
+        row = self._buffer[self._count]
+        row['state'] = state
+        row['action'] = action
+        row['reward'] = reward
+        row['next_state'] = next_state
+        row['done'] = done
+        self._count += 1
+        self.total_logged += 1
+
+        if self._count == len(self._buffer):
+            self.flush()
+
+    def flush(self):
+        """Write buffered transitions to disk"""
+        if self._count == 0:
+            return
+
+        with open(self.path, 'ab') as f:
+            if f.tell() == 0:
+                f.write(struct.pack(HEADER_FORMAT, REPLAY_MAGIC, self.state_size, self.n_actions, 0))
+            f.write(self._buffer[:self._count].tobytes())
+        self._count = 0
+
+    def close(self):
+        """Flush any remaining transitions"""
+        self.flush()
+
+
+def open_replay(path: str) -> np.ndarray:
+    """
+    Memory-map a replay file as a structured array
+
+    A partially written trailing record (e.g. the bot was killed mid-flush)
+    is ignored rather than treated as an error.
+    """
+    state_size, _ = read_header(path)
+    dtype = record_dtype(state_size)
+    count = (os.path.getsize(path) - HEADER_SIZE) // dtype.itemsize
+    if count <= 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=HEADER_SIZE, shape=(count,))
+
+
+class OfflineReplayTrainer:
+    """
+    Vectorized Q-learning over logged transitions
+
+    States are mapped to dense row indices once, then each batch applies
+    the usual TD rule to all of its transitions at the same time:
+
+        Q(s,a) ← Q(s,a) + α · mean[r + γ·max Q(s',a') - Q(s,a)]
+
+    where the mean is taken over every transition in the batch that hit
+    the same (s, a) pair.
+    """
+
+    def __init__(self,
+                 q_table: Dict[Tuple, np.ndarray],
+                 n_actions: int,
+                 learning_rate: float = 0.1,
+                 discount_factor: float = 0.9):
+        self.initial_q_table = q_table
+        self.n_actions = n_actions
+        self.alpha = learning_rate
+        self.gamma = discount_factor
+
+        self.states: Optional[np.ndarray] = None   # unique states, one per Q row
+        self.q: Optional[np.ndarray] = None         # dense Q-table
+        self.s_idx = self.a = self.r = self.ns_idx = self.done = None
+        self.total_updates = 0
+
+    def load(self, paths: Iterable[str]) -> int:
+        """Load transitions from replay files and build the dense Q-table"""
+        chunks = [open_replay(path) for path in paths]
+        chunks = [c for c in chunks if len(c) > 0]
+        if not chunks:
+            raise ValueError("No transitions found in the replay files")
+
+        state_size = chunks[0].dtype['state'].shape[0]
+        if any(c.dtype['state'].shape[0] != state_size for c in chunks):
+            raise ValueError("Replay files have different state sizes")
+
+        states = np.concatenate([c['state'] for c in chunks])
+        next_states = np.concatenate([c['next_state'] for c in chunks])
+        self.a = np.concatenate([c['action'] for c in chunks]).astype(np.intp)
+        self.r = np.concatenate([c['reward'] for c in chunks]).astype(np.float64)
+        self.done = np.concatenate([c['done'] for c in chunks]).astype(bool)
+
+        if self.a.max() >= self.n_actions:
+            raise ValueError(f"Replay contains action {self.a.max()} but only {self.n_actions} actions exist")
+
+        # Existing Q-table states keep their learned values
+        known = [k for k in self.initial_q_table if len(k) == state_size]
+        known_rows = np.array(known, dtype=np.uint8).reshape(-1, state_size)
+
+        n = len(states)
+        all_rows = np.concatenate([states, next_states, known_rows])
+        self.states, inverse = np.unique(all_rows, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        self.s_idx = inverse[:n]
+        self.ns_idx = inverse[n:2 * n]
+
+        self.q = np.zeros((len(self.states), self.n_actions))
+        for row, q_values in zip(inverse[2 * n:], (self.initial_q_table[k] for k in known)):
+            self.q[row] = q_values
+
+        return n
+
+    def _td_update(self, idx: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+        """Apply one batched TD update and return the per-transition TD errors"""
+        s = self.s_idx[idx]
+        a = self.a[idx]
+
+        max_next_q = self.q[self.ns_idx[idx]].max(axis=1)
+        target = self.r[idx] + self.gamma * max_next_q * ~self.done[idx]
+        td_error = target - self.q[s, a]
+
+        step = td_error if weights is None else td_error * weights
+        flat = s * self.n_actions + a
+        sums = np.bincount(flat, weights=step, minlength=self.q.size)
+        counts = np.bincount(flat, minlength=self.q.size)
+        touched = counts > 0
+
+        q_flat = self.q.reshape(-1)
+        q_flat[touched] += self.alpha * sums[touched] / counts[touched]
+
+        self.total_updates += len(idx)
+        return td_error
+
+    def sweep(self,
+              epochs: int = 1,
+              batch_size: int = 4096,
+              prioritized: bool = False,
+              priority_alpha: float = 0.6,
+              priority_beta: float = 0.4,
+              seed: Optional[int] = None) -> List[float]:
+        """
+        Run training sweeps over all loaded transitions
+
+        Args:
+            epochs: Number of passes over the replay data
+            batch_size: Transitions updated together in one vectorized step
+            prioritized: Sample transitions in proportion to their last TD error
+            priority_alpha: How strongly priorities skew sampling (0 = uniform)
+            priority_beta: Importance-sampling correction strength (0-1)
+            seed: Random seed for reproducible sweeps
+
+        Returns:
+            Mean absolute TD error for each epoch
+        """
+        if self.q is None:
+            raise RuntimeError("Call load() before sweep()")
+
+        rng = np.random.default_rng(seed)
+        n = len(self.s_idx)
+        priorities = np.ones(n)
+        history = []
+
+        for _ in range(epochs):
+            weights = None
+            if prioritized:
+                # Priorities are refreshed once per sweep so sampling stays O(N)
+                probs = priorities ** priority_alpha
+                probs /= probs.sum()
+                order = rng.choice(n, size=n, p=probs)
+                weights = (n * probs) ** -priority_beta
+                weights /= weights.max()
+            else:
+                order = rng.permutation(n)
+
+            abs_td_total = 0.0
+            for start in range(0, n, batch_size):
+                idx = order[start:start + batch_size]
+                td_error = self._td_update(idx, None if weights is None else weights[idx])
+                abs_td = np.abs(td_error)
+                abs_td_total += abs_td.sum()
+                if prioritized:
+                    priorities[idx] = abs_td + 1e-3
+
+            history.append(abs_td_total / n)
+
+        return history
+
+    def replay_visits(self) -> Dict[Tuple, np.ndarray]:
+        """
+        How many logged transitions tried each action in each state
+
+        Used as the visit counts of the offline learning, so it is weighed
+        against other learners' visits when tables are merged.
+        """
+        counts = np.bincount(self.s_idx * self.n_actions + self.a, minlength=self.q.size)
+        counts = counts.reshape(self.q.shape)
+        return {
+            tuple(int(v) for v in self.states[i]): counts[i].astype(float)
+            for i in np.flatnonzero(counts.any(axis=1))
+        }
+
+    def to_q_table(self) -> Dict[Tuple, np.ndarray]:
+        """Convert the dense Q-table back to the tank's dictionary format"""
+        return {
+            tuple(int(v) for v in state): self.q[i].copy()
+            for i, state in enumerate(self.states)
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline experience-replay trainer for Q-learning tanks')
+    parser.add_argument('replay', nargs='+', help='Replay files written with --replay-log')
+    parser.add_argument('--qtable', default='qlearning_qtable.pkl',
+                        help='Q-table pickle to train (merged with whatever self-play saved meanwhile)')
+    parser.add_argument('--epochs', type=int, default=5, help='Passes over the replay data')
+    parser.add_argument('--batch-size', type=int, default=4096, help='Transitions per vectorized update')
+    parser.add_argument('--alpha', type=float, default=0.1, help='Learning rate (0.0-1.0)')
+    parser.add_argument('--gamma', type=float, default=0.9, help='Discount factor (0.0-1.0)')
+    parser.add_argument('--prioritized', action='store_true',
+                        help='Replay surprising transitions (large TD error) more often')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed')
+    args = parser.parse_args()
+
+    _, n_actions = read_header(args.replay[0])
+    base = read_table(args.qtable)
+
+    trainer = OfflineReplayTrainer(base.q_table, n_actions, learning_rate=args.alpha, discount_factor=args.gamma)
+    count = trainer.load(args.replay)
+    print(f"📂 Loaded {count:,} transitions covering {len(trainer.states)} states")
+
+    history = trainer.sweep(
+        epochs=args.epochs,
+        batch_size=args.batch_size,
+        prioritized=args.prioritized,
+        seed=args.seed
+    )
+    for epoch, mean_td in enumerate(history, 1):
+        print(f"   Epoch {epoch}/{args.epochs}: mean |TD error| = {mean_td:.3f}")
+
+    table = base.copy()
+    table.q_table = trainer.to_q_table()
+    for state, visits in trainer.replay_visits().items():
+        table.visit_counts[state] = base.visit_counts.get(state, 0) + visits
+    if table.meta is not None:
+        table.meta['states_visited'] = set(table.meta.get('states_visited', set())) | set(table.q_table)
+        table.meta['total_updates'] = table.meta.get('total_updates', 0) + trainer.total_updates
+
+    # Training takes a while: self-play may have saved the table since we read it.
+    # Merge with what is on disk now (under the lock) instead of overwriting it.
+    merge_into_file(args.qtable, base, table)
+    print(f"💾 Saved Q-table to {args.qtable} ({trainer.total_updates:,} offline updates)")
+
+
+if __name__ == '__main__':
+    main()
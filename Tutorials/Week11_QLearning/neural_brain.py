@@ -0,0 +1,293 @@
+"""
+Neural Q-Brain - A Tiny NumPy Network Instead of a Q-Table
+Week 11: Q-Learning - From Tables to Function Approximation
+
+CombatState squeezes energy and distance into 3 buckets each so the
+Q-table stays small. That throws information away: 31 energy and 59
+energy look exactly the same to the tank!
+
+NeuralQBrain keeps the real (continuous) numbers and feeds them to a
+small multi-layer perceptron written in plain NumPy:
+
+    features (6) → hidden (32, tanh) → Q-value per action (8)
+
+One forward pass for a single tick is a couple of tiny matrix multiplies,
+so the cost per tick is a few microseconds and always the same. Learning
+happens in mini-batches taken from a small memory of recent transitions,
+and all weights are saved in one .npz file. No PyTorch needed!
+
+Usage:
+    python qlearning_tank.py --brain neural
+    python qlearning_tank.py --brain neural --mode analyze
+"""
+import os
+import math
+import random
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+class CombatFeatures:
+    """Continuous combat features, scaled to roughly -1..1"""
+
+    SIZE = 6
+
+    @staticmethod
+    def from_combat_data(my_energy, enemy_energy, distance, angle, speed) -> np.ndarray:
+        """
+        Build the network input from raw combat data
+
+        The angle is given as sin/cos so that -179° and +179° (almost the
+        same direction) produce almost the same input.
+        """
+        angle_rad = math.radians(angle)
+        return np.array([
+            my_energy / 100.0,
+            enemy_energy / 100.0,
+            min(distance, 1200.0) / 1000.0,
+            math.sin(angle_rad),
+            math.cos(angle_rad),
+            speed / 8.0,
+        ])
+
+
+class TinyMLP:
+    """
+    Two-layer perceptron with batched forward and backward passes
+
+    All methods work on a batch of inputs shaped (batch, n_inputs), so
+    training on 32 transitions costs about the same Python overhead as
+    training on one.
+    """
+
+    def __init__(self, n_inputs: int, n_hidden: int, n_outputs: int, seed: Optional[int] = None):
+        rng = np.random.default_rng(seed)
+        # Xavier-style initialization keeps tanh units out of saturation
+        self.W1 = rng.normal(0.0, 1.0 / math.sqrt(n_inputs), (n_inputs, n_hidden))
+        self.b1 = np.zeros(n_hidden)
+        self.W2 = rng.normal(0.0, 1.0 / math.sqrt(n_hidden), (n_hidden, n_outputs))
+        self.b2 = np.zeros(n_outputs)
+
+    def forward(self, X: np.ndarray) -> Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """Return outputs for a batch and the cache needed by backward()"""
+        hidden = np.tanh(X @ self.W1 + self.b1)
+        return hidden @ self.W2 + self.b2, (X, hidden)
+
+    def predict(self, x: np.ndarray) -> np.ndarray:
+        """Outputs for a single input vector (the per-tick fast path)"""
+        return np.tanh(x @ self.W1 + self.b1) @ self.W2 + self.b2
+
+    def backward(self, cache: Tuple[np.ndarray, np.ndarray], d_out: np.ndarray) -> Dict[str, np.ndarray]:
+        """Gradients of the loss given dLoss/dOutput for the batch"""
+        X, hidden = cache
+        d_hidden = (d_out @ self.W2.T) * (1.0 - hidden ** 2)
+        return {
+            'W2': hidden.T @ d_out,
+            'b2': d_out.sum(axis=0),
+            'W1': X.T @ d_hidden,
+            'b1': d_hidden.sum(axis=0),
+        }
+
+    def apply_gradients(self, grads: Dict[str, np.ndarray], learning_rate: float):
+        """Plain gradient descent step"""
+        for name, grad in grads.items():
+            param = getattr(self, name)
+            param -= learning_rate * grad
+
+    def get_weights(self) -> Dict[str, np.ndarray]:
+        return {'W1': self.W1, 'b1': self.b1, 'W2': self.W2, 'b2': self.b2}
+
+    def set_weights(self, weights: Dict[str, np.ndarray]):
+        for name in ('W1', 'b1', 'W2', 'b2'):
+            setattr(self, name, np.array(weights[name], dtype=float))
+
+
+class NeuralQBrain:
+    """
+    Drop-in alternative to QLearningBrain using a TinyMLP
+
+    It has the same get_action/update/save_qtable/print_statistics methods,
+    so QLearningTank can use either brain. The difference is the state:
+    encode_state() returns a feature vector instead of a CombatState.
+    """
+
+    # Same action space as QLearningBrain
+    ACTIONS = {
+        0: "forward_shoot_heavy",
+        1: "forward_shoot_light",
+        2: "turn_left_shoot",
+        3: "turn_right_shoot",
+        4: "retreat_shoot",
+        5: "circle_left_shoot",
+        6: "circle_right_shoot",
+        7: "stop_shoot_heavy"
+    }
+
+    def __init__(self,
+                 learning_rate: float = 0.01,
+                 discount_factor: float = 0.9,
+                 epsilon: float = 0.1,
+                 save_path: str = "qlearning_weights.npz",
+                 hidden_size: int = 32,
+                 batch_size: int = 32,
+                 memory_size: int = 5000,
+                 train_every: int = 4,
+                 seed: Optional[int] = None):
+        """
+        Initialize the neural brain
+
+        Args:
+            learning_rate: Gradient step size (much smaller than a table's α)
+            discount_factor (γ): Value of future rewards (0.0-1.0)
+            epsilon (ε): Exploration rate (0.0-1.0)
+            save_path: Where to save/load the network weights (.npz)
+            hidden_size: Number of hidden units
+            batch_size: Transitions per training step
+            memory_size: How many recent transitions to remember
+            train_every: Train once every this many updates
+            seed: Random seed for the initial weights
+        """
+        self.alpha = learning_rate
+        self.gamma = discount_factor
+        self.epsilon = epsilon
+        self.save_path = save_path
+        self.batch_size = batch_size
+        self.train_every = train_every
+
+        self.net = TinyMLP(CombatFeatures.SIZE, hidden_size, len(self.ACTIONS), seed=seed)
+
+        # Ring buffer of recent transitions, preallocated so update() never allocates
+        self.memory_states = np.zeros((memory_size, CombatFeatures.SIZE))
+        self.memory_next_states = np.zeros((memory_size, CombatFeatures.SIZE))
+        self.memory_actions = np.zeros(memory_size, dtype=np.intp)
+        self.memory_rewards = np.zeros(memory_size)
+        self.memory_done = np.zeros(memory_size, dtype=bool)
+        self.memory_count = 0
+        self.memory_next = 0
+
+        # Statistics
+        self.total_updates = 0
+        self.training_steps = 0
+        self.last_loss = 0.0
+
+        self.load_weights()
+
+    def encode_state(self, my_energy, enemy_energy, distance, angle, speed) -> np.ndarray:
+        """Turn raw combat data into the network's input features"""
+        return CombatFeatures.from_combat_data(my_energy, enemy_energy, distance, angle, speed)
+
+    def q_values(self, state: np.ndarray) -> np.ndarray:
+        """Predicted Q-value for every action in one state"""
+        return self.net.predict(state)
+
+    def get_action(self, state: np.ndarray, explore: bool = True) -> int:
+        """Choose action using epsilon-greedy strategy"""
+        if explore and random.random() < self.epsilon:
+            return random.randint(0, len(self.ACTIONS) - 1)
+        return int(np.argmax(self.net.predict(state)))
+
+    def update(self,
+               state: np.ndarray,
+               action: int,
+               reward: float,
+               next_state: np.ndarray,
+               done: bool = False):
+        """
+        Remember a transition and train on a mini-batch every few updates
+        """
+        i = self.memory_next
+        self.memory_states[i] = state
+        self.memory_next_states[i] = next_state
+        self.memory_actions[i] = action
+        self.memory_rewards[i] = reward
+        self.memory_done[i] = done
+        self.memory_next = (i + 1) % len(self.memory_actions)
+        self.memory_count = min(self.memory_count + 1, len(self.memory_actions))
+
+        self.total_updates += 1
+        if self.total_updates % self.train_every == 0 and self.memory_count >= self.batch_size:
+            idx = np.random.randint(0, self.memory_count, size=self.batch_size)
+            self.train_batch(
+                self.memory_states[idx], self.memory_actions[idx], self.memory_rewards[idx],
+                self.memory_next_states[idx], self.memory_done[idx]
+            )
+
+    def train_batch(self, states, actions, rewards, next_states, done) -> float:
+        """
+        One gradient step on a batch of transitions
+
+        The loss is the Huber loss of the TD error, which behaves like
+        squared error for small mistakes but does not explode on the huge
+        +200/-100 win/death rewards.
+
+        Returns:
+            Mean Huber loss for the batch
+        """
+        next_q, _ = self.net.forward(next_states)
+        targets = rewards + self.gamma * next_q.max(axis=1) * ~done
+
+        q, cache = self.net.forward(states)
+        rows = np.arange(len(actions))
+        td_error = q[rows, actions] - targets
+
+        # Huber loss gradient is the TD error clipped to [-1, 1]
+        d_out = np.zeros_like(q)
+        d_out[rows, actions] = np.clip(td_error, -1.0, 1.0) / len(actions)
+
+        self.net.apply_gradients(self.net.backward(cache, d_out), self.alpha)
+
+        abs_td = np.abs(td_error)
+        self.last_loss = float(np.mean(np.where(abs_td < 1.0, 0.5 * td_error ** 2, abs_td - 0.5)))
+        self.training_steps += 1
+        return self.last_loss
+
+    def save_qtable(self):
+        """Save network weights to one .npz file (name kept for QLearningTank)"""
+        tmp_path = f"{self.save_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, total_updates=self.total_updates, training_steps=self.training_steps,
+                     **self.net.get_weights())
+        os.replace(tmp_path, self.save_path)
+        print(f"💾 Saved network weights, {self.total_updates} updates, {self.training_steps} training steps")
+
+    def load_weights(self):
+        """Load network weights from disk"""
+        if not os.path.exists(self.save_path):
+            print("📋 No existing network weights found, starting fresh")
+            return
+
+        try:
+            with np.load(self.save_path) as data:
+                self.net.set_weights(data)
+                self.total_updates = int(data['total_updates'])
+                self.training_steps = int(data['training_steps'])
+            print(f"📂 Loaded network weights, {self.total_updates} updates")
+        except Exception as e:
+            print(f"⚠️  Failed to load network weights: {e}")
+
+    def print_statistics(self):
+        """Print learning statistics"""
+        print("\n" + "="*60)
+        print("NEURAL Q-LEARNING STATISTICS")
+        print("="*60)
+        print(f"Network: {CombatFeatures.SIZE} → {len(self.net.b1)} → {len(self.ACTIONS)}")
+        print(f"Total updates: {self.total_updates}")
+        print(f"Training steps: {self.training_steps}")
+        print(f"Last batch loss: {self.last_loss:.3f}")
+        print(f"Current epsilon: {self.epsilon:.3f}")
+        print(f"Learning rate: {self.alpha:.4f}")
+        print(f"Discount factor (γ): {self.gamma:.3f}")
+
+        # Show what the network thinks of a few example situations
+        print("\nBest action for example situations:")
+        examples = {
+            "Healthy, enemy close ahead": (90, 90, 150, 0, 5),
+            "Healthy, enemy far behind": (90, 50, 700, 170, 2),
+            "Hurt, enemy strong and close": (20, 90, 180, 30, 6),
+        }
+        for label, combat in examples.items():
+            q = self.q_values(self.encode_state(*combat))
+            best = int(np.argmax(q))
+            print(f"  {label}: {self.ACTIONS[best]} (Q={q[best]:.2f})")
+        print("="*60)
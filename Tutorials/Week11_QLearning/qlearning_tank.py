@@ -100,7 +100,8 @@ class QLearningBrain:
                  learning_rate: float = 0.1,
                  discount_factor: float = 0.9,
                  epsilon: float = 0.1,
-                 save_path: str = "qlearning_qtable.pkl"):
+                 save_path: str = "qlearning_qtable.pkl",
+                 replay_path: Optional[str] = None):
         """
         Initialize Q-Learning brain
         
@@ -109,23 +110,40 @@ class QLearningBrain:
             discount_factor (γ): Value of future rewards (0.0-1.0)
             epsilon (ε): Exploration rate (0.0-1.0)
             save_path: Where to save/load Q-table
+            replay_path: Optional file to log every transition for offline training
         """
         self.alpha = learning_rate
         self.gamma = discount_factor
         self.epsilon = epsilon
         self.save_path = save_path
         
+        # Experience replay log (see experience_replay.py)
+        self.replay_log = None
+        if replay_path:
+            from experience_replay import ReplayLogWriter
+            self.replay_log = ReplayLogWriter(replay_path, state_size=5, n_actions=len(self.ACTIONS))
+        
         # Q-table: maps (state, action) → Q-value
         # Use defaultdict so unseen states start at 0
         self.q_table: Dict[Tuple, np.ndarray] = defaultdict(lambda: np.zeros(len(self.ACTIONS)))
         
+        # Visit counts per (state, action) - used to merge tables from parallel tanks
+        self.visit_counts: Dict[Tuple, np.ndarray] = defaultdict(lambda: np.zeros(len(self.ACTIONS)))
+        
         # Statistics
         self.states_visited = set()
         self.total_updates = 0
         
+        # Snapshot of the table as loaded, so saves can merge with other tanks
+        self._baseline = None
+        
         # Load existing Q-table if available
         self.load_qtable()
     
+    def encode_state(self, my_energy, enemy_energy, distance, angle, speed) -> CombatState:
+        """Turn raw combat data into this brain's state representation"""
+        return CombatState.from_combat_data(my_energy, enemy_energy, distance, angle, speed)
+    
     def get_action(self, state: CombatState, explore: bool = True) -> int:
         """
         Choose action using epsilon-greedy strategy
@@ -189,18 +207,32 @@ class QLearningBrain:
         # Update: Q(s,a) ← Q(s,a) + α·TD_error
         self.q_table[state_tuple][action] += self.alpha * td_error
         
+        self.visit_counts[state_tuple][action] += 1
         self.total_updates += 1
+        
+        # Remember this experience so it can be replayed offline later
+        if self.replay_log is not None:
+            self.replay_log.append(state_tuple, action, reward, next_state_tuple, done)
     
     def save_qtable(self):
-        """Save Q-table to disk"""
-        with open(self.save_path, 'wb') as f:
-            # Convert defaultdict to regular dict for pickling
-            q_dict = dict(self.q_table)
-            pickle.dump({
-                'q_table': q_dict,
-                'states_visited': self.states_visited,
-                'total_updates': self.total_updates
-            }, f)
+        """Save Q-table to disk (and flush any buffered replay transitions)"""
+        if self.replay_log is not None:
+            self.replay_log.flush()
+        
+        from selfplay import QTableData, merge_into_file
+        
+        # Convert defaultdicts to regular dicts for pickling
+        mine = QTableData(
+            q_table=dict(self.q_table),
+            visit_counts=dict(self.visit_counts),
+            meta={'states_visited': self.states_visited, 'total_updates': self.total_updates}
+        )
+        
+        # Other tanks may have saved to the same file since we loaded it -
+        # merge with their learning instead of overwriting it
+        baseline = self._baseline if self._baseline is not None else QTableData()
+        merged = merge_into_file(self.save_path, baseline, mine)
+        self._adopt(merged)
         print(f"💾 Saved Q-table with {len(self.q_table)} states, {self.total_updates} updates")
     
     def load_qtable(self):
@@ -216,13 +248,32 @@ class QLearningBrain:
             # Convert back to defaultdict
             q_dict = data['q_table']
             self.q_table = defaultdict(lambda: np.zeros(len(self.ACTIONS)), q_dict)
+            self.visit_counts = defaultdict(lambda: np.zeros(len(self.ACTIONS)), data.get('visit_counts', {}))
             self.states_visited = data.get('states_visited', set())
             self.total_updates = data.get('total_updates', 0)
+            self._snapshot_baseline()
             
             print(f"📂 Loaded Q-table with {len(self.q_table)} states, {self.total_updates} updates")
         except Exception as e:
             print(f"⚠️  Failed to load Q-table: {e}")
     
+    def _snapshot_baseline(self):
+        """Remember the table as it is on disk right now"""
+        from selfplay import QTableData
+        self._baseline = QTableData(
+            q_table=dict(self.q_table),
+            visit_counts=dict(self.visit_counts),
+            meta={'states_visited': set(self.states_visited), 'total_updates': self.total_updates}
+        ).copy()
+    
+    def _adopt(self, table):
+        """Continue learning from a merged table"""
+        self.q_table = defaultdict(lambda: np.zeros(len(self.ACTIONS)), table.q_table)
+        self.visit_counts = defaultdict(lambda: np.zeros(len(self.ACTIONS)), table.visit_counts)
+        self.states_visited = set(table.meta.get('states_visited', set()))
+        self.total_updates = table.meta.get('total_updates', 0)
+        self._snapshot_baseline()
+    
     def print_statistics(self):
         """Print learning statistics"""
         print("\n" + "="*60)
@@ -257,14 +308,14 @@ class QLearningTank(Bot):
     5. Updates Q-values to learn from experience
     """
     
-    def __init__(self, bot_info: BotInfo, brain: Optional[QLearningBrain] = None):
+    def __init__(self, bot_info: BotInfo, brain=None):
         super().__init__(bot_info)
         
-        # Q-Learning brain
+        # Q-Learning brain (QLearningBrain or neural_brain.NeuralQBrain)
         self.brain = brain if brain else QLearningBrain()
         
-        # Combat tracking
-        self.current_state: Optional[CombatState] = None
+        # Combat tracking (state is a CombatState or a feature vector)
+        self.current_state = None
         self.current_action: Optional[int] = None
         self.last_energy = 100.0
         self.last_enemy_energy = 100.0
@@ -291,7 +342,8 @@ class QLearningTank(Bot):
         """
         print("🤖 Q-Learning Tank activated!")
         print(f"   Exploration (ε): {self.brain.epsilon:.2f}")
-        print(f"   Q-table size: {len(self.brain.q_table)} states")
+        if isinstance(self.brain, QLearningBrain):
+            print(f"   Q-table size: {len(self.brain.q_table)} states")
         
         while self.is_running():
             self.episode_steps += 1
@@ -325,7 +377,7 @@ class QLearningTank(Bot):
         angle = self.calculate_angle_to_enemy(enemy)
         
         # Create current state
-        new_state = CombatState.from_combat_data(
+        new_state = self.brain.encode_state(
             my_energy=self.get_energy(),
             enemy_energy=enemy['energy'],
             distance=distance,
@@ -525,7 +577,7 @@ class QLearningTank(Bot):
         self.wall_hits += 1
         
         # Immediate negative reward for wall hit
-        if self.current_state and self.current_action is not None:
+        if self.current_state is not None and self.current_action is not None:
             self.brain.update(
                 state=self.current_state,
                 action=self.current_action,
@@ -538,7 +590,7 @@ class QLearningTank(Bot):
         """Track enemy death"""
         if event.victim_id == self.current_target:
             # Huge reward for killing enemy!
-            if self.current_state and self.current_action is not None:
+            if self.current_state is not None and self.current_action is not None:
                 self.brain.update(
                     state=self.current_state,
                     action=self.current_action,
@@ -553,7 +605,7 @@ class QLearningTank(Bot):
         print(f"\n💀 Episode ended in death")
         
         # Large negative reward for dying
-        if self.current_state and self.current_action is not None:
+        if self.current_state is not None and self.current_action is not None:
             self.brain.update(
                 state=self.current_state,
                 action=self.current_action,
@@ -569,7 +621,7 @@ class QLearningTank(Bot):
         print(f"\n🏆 Episode ended in victory!")
         
         # Bonus reward for winning
-        if self.current_state and self.current_action is not None:
+        if self.current_state is not None and self.current_action is not None:
             self.brain.update(
                 state=self.current_state,
                 action=self.current_action,
@@ -590,7 +642,8 @@ class QLearningTank(Bot):
         print(f"   Damage taken: {self.damage_taken:.1f}")
         print(f"   Hit rate: {self.hits_landed}/{self.shots_fired} ({hit_rate:.1%})")
         print(f"   Wall hits: {self.wall_hits}")
-        print(f"   States visited this episode: {len(self.brain.states_visited)}")
+        if isinstance(self.brain, QLearningBrain):
+            print(f"   States visited this episode: {len(self.brain.states_visited)}")
 
 
 # ============= MAIN =============
@@ -601,16 +654,38 @@ if __name__ == '__main__':
                        help='battle: Run bot, analyze: Show Q-table stats')
     parser.add_argument('--epsilon', type=float, default=0.1,
                        help='Exploration rate (0.0-1.0)')
-    parser.add_argument('--alpha', type=float, default=0.1,
-                       help='Learning rate (0.0-1.0)')
+    parser.add_argument('--alpha', type=float, default=None,
+                       help='Learning rate (default 0.1 for the table brain, 0.01 for the neural brain)')
     parser.add_argument('--gamma', type=float, default=0.9,
                        help='Discount factor (0.0-1.0)')
+    parser.add_argument('--replay-log', default=None,
+                       help='Append transitions to this file for experience_replay.py')
+    parser.add_argument('--brain', choices=['table', 'neural'], default='table',
+                       help='table: Q-table over CombatState buckets, neural: NumPy network (neural_brain.py)')
     
     args = parser.parse_args()
     
+    # Create Q-Learning brain
+    if args.brain == 'neural':
+        from neural_brain import NeuralQBrain
+        if args.replay_log:
+            print("⚠️  --replay-log only works with the table brain, ignoring it")
+        # Network weights need much smaller steps than Q-table entries
+        brain = NeuralQBrain(
+            learning_rate=args.alpha if args.alpha is not None else 0.01,
+            discount_factor=args.gamma,
+            epsilon=args.epsilon
+        )
+    else:
+        brain = QLearningBrain(
+            learning_rate=args.alpha if args.alpha is not None else 0.1,
+            discount_factor=args.gamma,
+            epsilon=args.epsilon,
+            replay_path=args.replay_log if args.mode == 'battle' else None
+        )
+    
     if args.mode == 'analyze':
-        # Just show Q-table statistics
-        brain = QLearningBrain(epsilon=args.epsilon, learning_rate=args.alpha, discount_factor=args.gamma)
+        # Just show learning statistics
         brain.print_statistics()
     else:
         # Battle mode
@@ -618,13 +693,6 @@ if __name__ == '__main__':
         import sys
         import json
         
-        # Create Q-Learning brain
-        brain = QLearningBrain(
-            learning_rate=args.alpha,
-            discount_factor=args.gamma,
-            epsilon=args.epsilon
-        )
-        
         # Load bot info
         script_dir = Path(__file__).parent
         bot_info_path = script_dir / "qlearning_tank.json"
@@ -641,9 +709,12 @@ if __name__ == '__main__':
         bot = QLearningTank(bot_info=bot_info, brain=brain)
         
         print("🤖 Starting Q-Learning Tank...")
+        print(f"   Brain: {args.brain}")
         print(f"   ε (exploration): {args.epsilon}")
-        print(f"   α (learning rate): {args.alpha}")
+        print(f"   α (learning rate): {brain.alpha}")
         print(f"   γ (discount): {args.gamma}")
+        if args.replay_log:
+            print(f"   Replay log: {args.replay_log}")
         
         try:
             asyncio.run(bot.start())
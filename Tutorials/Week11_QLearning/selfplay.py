@@ -0,0 +1,351 @@
+"""
+Parallel Self-Play - Many Q-Learning Tanks, One Shared Brain
+Week 11: Q-Learning - Learning Faster Together
+
+One tank can only play one game at a time. This module runs N copies of a
+Q-learning tank in separate processes, each in its own working folder with
+its own copy of the Q-table. Every few minutes the coordinator stops the
+workers and merges what they learned back into the shared Q-table:
+
+    Q(s,a) = Σ nᵢ·Qᵢ(s,a) / Σ nᵢ
+
+where nᵢ is how many times worker i visited (s, a) since it got its copy.
+State/action pairs nobody visited keep their old value.
+
+The same merge is used when a tank saves its Q-table: the file is locked,
+re-read and merged, so two tanks sharing one file no longer overwrite each
+other's learning.
+
+Usage:
+    # 4 QLearningTanks against a running Tank Royale server, merge every 5 minutes
+    python selfplay.py qlearning_tank.py --workers 4 --sync-interval 300 --generations 12
+
+    # The ML Champion keeps its table in ml_champion_qtable.pkl
+    python selfplay.py ../../Submissions/ClaudeCode/ml_champion_tank/ml_champion_tank.py \\
+        --table ml_champion_qtable.pkl --workers 6
+"""
+import os
+import sys
+import copy
+import time
+import pickle
+import signal
+import argparse
+import subprocess
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass
+class QTableData:
+    """
+    Everything stored in a Q-table pickle
+
+    meta is None for tables saved as a bare dictionary (MLChampionTank);
+    otherwise it holds the extra QLearningTank fields such as
+    'states_visited' and 'total_updates'.
+    """
+    q_table: Dict[Tuple, np.ndarray] = field(default_factory=dict)
+    visit_counts: Dict[Tuple, np.ndarray] = field(default_factory=dict)
+    meta: Optional[dict] = field(default_factory=dict)
+
+    def copy(self) -> 'QTableData':
+        """Deep copy (Q-value arrays are updated in place during learning)"""
+        return copy.deepcopy(self)
+
+
+class QTableLock:
+    """
+    Lock file that serializes read-merge-write of a Q-table
+
+    Uses an exclusive-create ``<table>.lock`` file, which works the same
+    on Linux, macOS and Windows. Locks left behind by a crashed process
+    are broken after ``stale_after`` seconds.
+    """
+
+    def __init__(self, table_path: str, timeout: float = 30.0, stale_after: float = 120.0):
+        self.lock_path = f"{table_path}.lock"
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self._fd = None
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self._fd, str(os.getpid()).encode())
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.lock_path) > self.stale_after:
+                        os.remove(self.lock_path)
+                        continue
+                except OSError:
+                    continue  # Lock vanished between checks - just retry
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {self.lock_path}")
+                time.sleep(0.05)
+
+    def __exit__(self, exc_type, exc, tb):
+        os.close(self._fd)
+        self._fd = None
+        try:
+            os.remove(self.lock_path)
+        except OSError:
+            pass
+        return False
+
+
+def read_table(path: str) -> QTableData:
+    """Load a Q-table pickle written by either Q-learning tank"""
+    if not os.path.exists(path):
+        return QTableData()
+
+    with open(path, 'rb') as f:
+        data = pickle.load(f)
+
+    if isinstance(data, dict) and 'q_table' in data:
+        meta = {k: v for k, v in data.items() if k not in ('q_table', 'visit_counts')}
+        return QTableData(dict(data['q_table']), dict(data.get('visit_counts', {})), meta)
+    return QTableData(dict(data), {}, None)
+
+
+def write_table(path: str, data: QTableData):
+    """
+    Atomically write a Q-table in the format it was loaded from
+
+    The pickle goes to a temporary file first and is then renamed over the
+    target, so readers never see a half-written table.
+    """
+    if data.meta is None:
+        payload = data.q_table
+    else:
+        payload = dict(data.meta)
+        payload['q_table'] = data.q_table
+        payload['visit_counts'] = data.visit_counts
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(payload, f)
+    os.replace(tmp_path, path)
+
+
+def merge_qtables(base: QTableData, contributions: List[QTableData]) -> QTableData:
+    """
+    Merge Q-tables that all started from the same base table
+
+    Each contribution is weighted per (state, action) by the visits it made
+    since the base was taken. Tables saved without visit counts get one vote
+    for every Q-value that changed.
+
+    Args:
+        base: The table every contributor started from
+        contributions: Tables learned independently from that base
+
+    Returns:
+        The merged table, with visit counts summed
+    """
+    merged = QTableData(meta=None if base.meta is None else dict(base.meta))
+
+    states = set(base.q_table)
+    for table in contributions:
+        states.update(table.q_table)
+
+    for state in states:
+        base_q = base.q_table.get(state)
+        contrib_qs = [t.q_table[state] for t in contributions if state in t.q_table]
+        n_actions = len(base_q) if base_q is not None else len(contrib_qs[0])
+        if base_q is None:
+            base_q = np.zeros(n_actions)
+        base_n = base.visit_counts.get(state, np.zeros(n_actions))
+
+        weighted_sum = np.zeros(n_actions)
+        total_weight = np.zeros(n_actions)
+        for table in contributions:
+            if state not in table.q_table:
+                continue
+            q_values = table.q_table[state]
+            counts = table.visit_counts.get(state)
+            if counts is None:
+                weight = (q_values != base_q).astype(float)
+            else:
+                weight = np.maximum(counts - base_n, 0).astype(float)
+            weighted_sum += weight * q_values
+            total_weight += weight
+
+        merged.q_table[state] = np.where(
+            total_weight > 0, weighted_sum / np.maximum(total_weight, 1e-12), base_q
+        )
+        merged.visit_counts[state] = base_n + total_weight
+
+    if merged.meta is not None:
+        base_updates = base.meta.get('total_updates', 0)
+        visited = set(base.meta.get('states_visited', set()))
+        new_updates = 0
+        for table in contributions:
+            if table.meta is not None:
+                visited |= set(table.meta.get('states_visited', set()))
+                new_updates += max(0, table.meta.get('total_updates', 0) - base_updates)
+        merged.meta['states_visited'] = visited
+        merged.meta['total_updates'] = base_updates + new_updates
+
+    return merged
+
+
+def merge_into_file(path: str, base: QTableData, mine: QTableData) -> QTableData:
+    """
+    Safely save a table learned from ``base`` into a possibly shared file
+
+    Whatever other processes saved since ``base`` was read is merged with
+    ``mine`` instead of being overwritten.
+    """
+    with QTableLock(path):
+        on_disk = read_table(path)
+        merged = merge_qtables(base, [on_disk, mine]) if os.path.exists(path) else mine.copy()
+        write_table(path, merged)
+    return merged
+
+
+class SelfPlayCoordinator:
+    """
+    Runs N tank processes and periodically merges their Q-tables
+
+    Each worker gets its own folder (the tanks save their tables relative to
+    the current directory) seeded with a copy of the shared table. After
+    ``sync_interval`` seconds the workers are stopped, their tables are
+    merged into the shared file, and a new generation starts.
+    """
+
+    def __init__(self,
+                 tank_script: str,
+                 table_name: str = "qlearning_qtable.pkl",
+                 workers: int = 4,
+                 sync_interval: float = 300.0,
+                 workdir: str = "selfplay",
+                 tank_args: Optional[List[str]] = None,
+                 server_url: Optional[str] = None):
+        self.tank_script = Path(tank_script).resolve()
+        self.table_name = table_name
+        self.shared_path = str(Path(table_name).resolve())
+        self.workers = workers
+        self.sync_interval = sync_interval
+        self.workdir = Path(workdir)
+        self.tank_args = tank_args or []
+        self.server_url = server_url
+
+    def worker_dir(self, index: int) -> Path:
+        return self.workdir / f"worker_{index}"
+
+    def launch_workers(self) -> List[subprocess.Popen]:
+        """Start one tank process per worker folder"""
+        env = dict(os.environ)
+        if self.server_url:
+            env['SERVER_URL'] = self.server_url
+
+        # Windows needs its own process group to receive CTRL_BREAK
+        flags = subprocess.CREATE_NEW_PROCESS_GROUP if sys.platform == 'win32' else 0
+
+        processes = []
+        for i in range(self.workers):
+            log = open(self.worker_dir(i) / "worker.log", 'a')
+            processes.append(subprocess.Popen(
+                [sys.executable, str(self.tank_script), *self.tank_args],
+                cwd=self.worker_dir(i),
+                env=env,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                creationflags=flags
+            ))
+            log.close()
+        return processes
+
+    def stop_workers(self, processes: List[subprocess.Popen], grace: float = 15.0):
+        """Interrupt workers so they save their tables, then wait for them"""
+        for proc in processes:
+            if proc.poll() is None:
+                if sys.platform == 'win32':
+                    proc.send_signal(signal.CTRL_BREAK_EVENT)
+                else:
+                    proc.send_signal(signal.SIGINT)
+
+        deadline = time.monotonic() + grace
+        for proc in processes:
+            try:
+                proc.wait(timeout=max(0.1, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+
+    def run_generation(self, generation: int) -> QTableData:
+        """Seed workers, let them play, and merge their tables"""
+        with QTableLock(self.shared_path):
+            has_shared = os.path.exists(self.shared_path)
+            base = read_table(self.shared_path)
+
+        for i in range(self.workers):
+            self.worker_dir(i).mkdir(parents=True, exist_ok=True)
+            worker_table = self.worker_dir(i) / self.table_name
+            if has_shared:
+                write_table(str(worker_table), base)
+            elif worker_table.exists():
+                worker_table.unlink()  # Start fresh; the tank picks its own file format
+
+        print(f"\n🚀 Generation {generation}: {self.workers} workers for {self.sync_interval:.0f}s")
+        processes = self.launch_workers()
+
+        deadline = time.monotonic() + self.sync_interval
+        while time.monotonic() < deadline and any(p.poll() is None for p in processes):
+            time.sleep(1.0)
+        self.stop_workers(processes)
+
+        contributions = [read_table(str(self.worker_dir(i) / self.table_name)) for i in range(self.workers)]
+        if not has_shared and any(c.meta is None for c in contributions):
+            base.meta = None  # Workers wrote bare tables, so the shared file should too
+        merged = merge_into_file(self.shared_path, base, merge_qtables(base, contributions))
+
+        new_visits = sum(int(c.sum()) for c in merged.visit_counts.values()) - \
+            sum(int(c.sum()) for c in base.visit_counts.values())
+        print(f"💾 Merged {len(contributions)} tables into {self.table_name}: "
+              f"{len(merged.q_table)} states, {new_visits:,} new visits")
+        return merged
+
+    def run(self, generations: int):
+        for generation in range(1, generations + 1):
+            self.run_generation(generation)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parallel self-play for Q-learning tanks')
+    parser.add_argument('tank', help='Tank script to run in each worker')
+    parser.add_argument('--table', default='qlearning_qtable.pkl',
+                        help='Q-table file name the tank saves (shared copy lives in the current folder)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4,
+                        help='Number of tank processes to run at once')
+    parser.add_argument('--sync-interval', type=float, default=300.0,
+                        help='Seconds each generation plays before tables are merged')
+    parser.add_argument('--generations', type=int, default=10, help='Number of merge rounds')
+    parser.add_argument('--workdir', default='selfplay', help='Folder for per-worker files')
+    parser.add_argument('--server-url', default=None, help='Tank Royale server (sets SERVER_URL)')
+    args, tank_args = parser.parse_known_args()
+
+    coordinator = SelfPlayCoordinator(
+        tank_script=args.tank,
+        table_name=args.table,
+        workers=args.workers,
+        sync_interval=args.sync_interval,
+        workdir=args.workdir,
+        tank_args=tank_args,
+        server_url=args.server_url
+    )
+    try:
+        coordinator.run(args.generations)
+    except KeyboardInterrupt:
+        print("\n👋 Self-play stopped")
+
+
+if __name__ == '__main__':
+    main()
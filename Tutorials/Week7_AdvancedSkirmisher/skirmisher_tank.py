@@ -397,13 +397,36 @@ class SkirmisherTank(Bot):
         
         Uses sophisticated target selection algorithm
         """
+        shot = self.choose_shot()
+        if shot is None:
+            return
+        target, angle, bullet_power = shot
+        
+        # Aim gun
+        self.turn_gun_to(angle)
+        
+        # Fire if we have a good shot
+        if self.should_fire(target):
+            self.fire(bullet_power)
+            self.shots_fired += 1
+    
+    def choose_shot(self):
+        """
+        Pick the best target and work out where to aim - without moving anything
+        
+        scripts/targeting_benchmark.py calls this too, so you can check
+        every change to your gun against recorded battles.
+        
+        Returns:
+            (target, aim angle, bullet power), or None if there is no target
+        """
         # Select best target
         target = self.target_selector.select_best_target(
             self.x, self.y, self.enemies
         )
         
         if target is None:
-            return
+            return None
         
         # Predict where target will be when bullet arrives
         bullet_power = self.choose_bullet_power(target["distance"], target["energy"])
@@ -424,13 +447,7 @@ class SkirmisherTank(Bot):
             self.x, self.y, future_x, future_y
         )[0]
         
-        # Aim gun
-        self.turn_gun_to(angle)
-        
-        # Fire if we have a good shot
-        if self.should_fire(target):
-            self.fire(bullet_power)
-            self.shots_fired += 1
+        return target, angle, bullet_power
     
     def choose_bullet_power(self, distance, enemy_energy):
         """
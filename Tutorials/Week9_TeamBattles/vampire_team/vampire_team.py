@@ -24,9 +24,15 @@ Mechanics:
 
 import asyncio
 import math
+import sys
+from pathlib import Path
 from robocode_tank_royale.bot_api import Bot, BotInfo
 from robocode_tank_royale.bot_api.events import ScannedBotEvent, HitBotEvent
 
+# Shared helpers (tank_utils) live in the repo root
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from tank_utils import update_enemy
+
 
 class VampireBot(Bot):
     """Base class for vampire team members"""
@@ -35,7 +41,7 @@ class VampireBot(Bot):
         super().__init__(bot_info=bot_info)
         self.role = self.get_role()
         self.master_position = None
-        self.servants = {}
+        self.servants = {}    # scanned_bot_id -> EnemyRecord (x, y, energy, distance...)
         self.enemies = {}
         self.farming_mode = False
         self.target_servant = None
@@ -91,7 +97,7 @@ class VampireBot(Bot):
             min_distance = float('inf')
             
             for servant_id, servant in self.servants.items():
-                distance = math.sqrt((servant['x'] - self.x)**2 + (servant['y'] - self.y)**2)
+                distance = math.sqrt((servant.x - self.x)**2 + (servant.y - self.y)**2)
                 if distance < min_distance:
                     min_distance = distance
                     closest_servant = servant
@@ -100,8 +106,8 @@ class VampireBot(Bot):
             if closest_servant:
                 # Move toward servant
                 angle = math.degrees(math.atan2(
-                    closest_servant['x'] - self.x,
-                    closest_servant['y'] - self.y
+                    closest_servant.x - self.x,
+                    closest_servant.y - self.y
                 ))
                 
                 turn = (angle - self.direction + 360) % 360
@@ -134,16 +140,16 @@ class VampireBot(Bot):
             if self.enemies:
                 # Find best target (closest or weakest)
                 target = min(self.enemies.values(), 
-                           key=lambda e: e['distance'] if e['energy'] > 20 else e['energy'])
+                           key=lambda e: e.distance if e.energy > 20 else e.energy)
                 
                 # Calculate angle to target
                 angle = math.degrees(math.atan2(
-                    target['x'] - self.x,
-                    target['y'] - self.y
+                    target.x - self.x,
+                    target.y - self.y
                 ))
                 
                 # Advanced movement - stay at optimal range
-                distance = target['distance']
+                distance = target.distance
                 if distance > 300:
                     # Close in
                     turn = (angle - self.direction + 360) % 360
@@ -193,16 +199,16 @@ class VampireBot(Bot):
             
             # Stay defensive, conserve energy
             if self.enemies:
-                target = min(self.enemies.values(), key=lambda e: e['distance'])
+                target = min(self.enemies.values(), key=lambda e: e.distance)
                 
                 # Maintain distance
                 angle = math.degrees(math.atan2(
-                    target['x'] - self.x,
-                    target['y'] - self.y
+                    target.x - self.x,
+                    target.y - self.y
                 ))
                 
                 # Keep distance
-                if target['distance'] < 250:
+                if target.distance < 250:
                     turn = (angle - self.direction + 180 + 360) % 360
                     if turn > 180:
                         turn -= 360
@@ -261,12 +267,12 @@ class VampireBot(Bot):
             
             # If enemies nearby, evade!
             if self.enemies:
-                closest_enemy = min(self.enemies.values(), key=lambda e: e['distance'])
-                if closest_enemy['distance'] < 200:
+                closest_enemy = min(self.enemies.values(), key=lambda e: e.distance)
+                if closest_enemy.distance < 200:
                     # Run away from enemy
                     angle = math.degrees(math.atan2(
-                        closest_enemy['x'] - self.x,
-                        closest_enemy['y'] - self.y
+                        closest_enemy.x - self.x,
+                        closest_enemy.y - self.y
                     ))
                     turn = (angle - self.direction + 180 + 360) % 360
                     if turn > 180:
@@ -287,34 +293,19 @@ class VampireBot(Bot):
     
     async def on_scanned_bot(self, event: ScannedBotEvent):
         """Track all bots"""
-        # Enemy position is directly from event
-        scanned_x = event.x
-        scanned_y = event.y
-        
-        # Calculate distance from coordinates
-        dx = event.x - self.x
-        dy = event.y - self.y
-        distance = math.sqrt(dx**2 + dy**2)
-        
-        bot_data = {
-            'x': scanned_x,
-            'y': scanned_y,
-            'energy': event.energy,
-            'distance': distance
-        }
-        
+        # One small record per bot, updated in place (not a new dictionary every scan)
         if event.is_teammate:
             # Check if master or servant
             # This is a simplification - in real implementation, 
             # you'd need to identify which teammate
             if self.role == "MASTER":
-                self.servants[event.scanned_bot_id] = bot_data
+                update_enemy(self.servants, event, self.x, self.y)
             else:
                 # Servant tracking master
-                self.master_position = (scanned_x, scanned_y)
+                self.master_position = (event.x, event.y)
         else:
             # Enemy
-            self.enemies[event.scanned_bot_id] = bot_data
+            update_enemy(self.enemies, event, self.x, self.y)
     
     async def on_hit_by_bullet(self, event):
         """React to being hit"""
@@ -0,0 +1,156 @@
+"""
+Fitness Store - Remember Every Battle a Genome Has Fought
+Shared by Week 10 (Genetic Algorithm) and the ML Champion trainer
+
+The population files only keep the latest fitness of each individual, so
+elites that survive to the next generation get re-evaluated from scratch
+and one lucky (or unlucky) battle decides their fate.
+
+FitnessStore keeps an append-only log with one line per evaluation:
+
+    {"genome": "<hash>", "opponent": "walls", "seed": 3, "score": 212.5}
+
+Identical genomes (same parameter values) get the same hash, so
+evaluating one again against the same opponent and seed is a cache hit.
+A genome's fitness is the average over all its stored evaluations. Give
+every generation new seeds (generation_seeds) and a survivor fights new
+battles each generation on top of the old ones, so its fitness gets more
+accurate the longer it survives.
+
+Usage:
+    from fitness_store import FitnessStore, generation_seeds
+
+    store = FitnessStore("genetic_evaluations.jsonl")
+    genome.fitness = store.evaluate(genome, ["walls", "spinbot"], seeds=generation_seeds(generation, 3),
+                                    run_battle=my_battle_function)
+"""
+import os
+import json
+import hashlib
+from dataclasses import asdict, is_dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# Bookkeeping fields that are not part of a genome's "DNA"
+NON_GENE_FIELDS = ('fitness', 'battles_fought')
+
+
+def genome_hash(genome) -> str:
+    """
+    Stable hash of a genome's parameter values
+
+    Works with dataclasses (CombatGenome, EvolvableParameters) and plain
+    dictionaries. Fitness bookkeeping fields are ignored, so a genome keeps
+    its hash as its score changes.
+    """
+    genes = asdict(genome) if is_dataclass(genome) else dict(genome)
+    for name in NON_GENE_FIELDS:
+        genes.pop(name, None)
+    encoded = json.dumps(genes, sort_keys=True).encode()
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+def generation_seeds(generation: int, count: int) -> range:
+    """
+    The battle seeds for one generation: new ones every generation
+
+    Generation 0 gets seeds 0..count-1, generation 1 the next count, and so
+    on. Survivors keep their old battles and add these new ones.
+    """
+    return range(generation * count, (generation + 1) * count)
+
+
+class FitnessStore:
+    """
+    Append-only log of (genome hash, opponent, seed, score) evaluations
+
+    The whole log is indexed in memory when the store is opened, so
+    lookups are dictionary hits. New evaluations are appended one line at a
+    time and never rewrite the file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._scores: Dict[Tuple[str, str, int], float] = {}
+        self._by_genome: Dict[str, List[Tuple[str, int, float]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        """Index every evaluation already in the log"""
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Half-written last line from a crashed run
+                self._index(entry['genome'], entry['opponent'], entry['seed'], entry['score'])
+
+    def _index(self, key: str, opponent: str, seed: int, score: float):
+        if (key, opponent, seed) not in self._scores:
+            self._by_genome.setdefault(key, []).append((opponent, seed, score))
+        self._scores[(key, opponent, seed)] = score
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def lookup(self, genome, opponent: str, seed: int) -> Optional[float]:
+        """Stored score for this genome/opponent/seed, or None"""
+        key = genome if isinstance(genome, str) else genome_hash(genome)
+        return self._scores.get((key, opponent, seed))
+
+    def record(self, genome, opponent: str, seed: int, score: float):
+        """Append one evaluation to the log"""
+        key = genome if isinstance(genome, str) else genome_hash(genome)
+        with open(self.path, 'a') as f:
+            f.write(json.dumps({'genome': key, 'opponent': opponent, 'seed': seed, 'score': score}) + "\n")
+        self._index(key, opponent, seed, score)
+
+    def evaluations(self, genome) -> List[Tuple[str, int, float]]:
+        """All (opponent, seed, score) evaluations stored for a genome"""
+        key = genome if isinstance(genome, str) else genome_hash(genome)
+        return list(self._by_genome.get(key, []))
+
+    def fitness(self, genome, default: float = 0.0) -> float:
+        """Average score over every stored evaluation of a genome"""
+        scores = [score for _, _, score in self.evaluations(genome)]
+        return sum(scores) / len(scores) if scores else default
+
+    def evaluate(self,
+                 genome,
+                 opponents: Iterable[str],
+                 seeds: Iterable[int],
+                 run_battle: Callable[[object, str, int], float]) -> float:
+        """
+        Score a genome against every opponent/seed, skipping cached battles
+
+        Args:
+            genome: The genome to evaluate
+            opponents: Opponent names to fight
+            seeds: Random seeds to fight each opponent with
+            run_battle: Function (genome, opponent, seed) → score
+
+        Returns:
+            Aggregate fitness over all stored evaluations of the genome
+        """
+        key = genome_hash(genome)
+        seeds = list(seeds)
+        for opponent in opponents:
+            for seed in seeds:
+                if (key, opponent, seed) in self._scores:
+                    self.hits += 1
+                    continue
+                self.misses += 1
+                self.record(key, opponent, seed, float(run_battle(genome, opponent, seed)))
+        return self.fitness(key)
+
+    def print_statistics(self):
+        """Show how much work the cache saved"""
+        total = self.hits + self.misses
+        hit_rate = self.hits / total if total else 0.0
+        print(f"🗂️  Fitness store: {len(self._scores)} evaluations of {len(self._by_genome)} genomes")
+        print(f"   This run: {self.misses} battles run, {self.hits} cache hits ({hit_rate:.0%})")
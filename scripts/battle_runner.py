@@ -20,6 +20,8 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 import time
 
+from bot_catalog import BotCatalog, REPO_ROOT, scan_source
+
 # Color codes for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -217,6 +219,9 @@ class TankLoader:
         print_info(f"Loading tank from: {tank_path.name}")
 
         try:
+            # Read which class is the tank before running anything
+            wanted = scan_source(tank_path.read_text(encoding='utf-8'), str(tank_path))['bot_class']
+
             # Load the module
             spec = importlib.util.spec_from_file_location("tank_module", tank_path)
             if spec is None or spec.loader is None:
@@ -227,9 +232,9 @@ class TankLoader:
             sys.modules["tank_module"] = module
             spec.loader.exec_module(module)
 
-            # Find the tank class (should be the first class defined)
-            tank_class = None
-            for item_name in dir(module):
+            # Find the tank class (the Bot subclass, or else the first class defined)
+            tank_class = getattr(module, wanted, None) if wanted else None
+            for item_name in ([] if tank_class else dir(module)):
                 item = getattr(module, item_name)
                 if isinstance(item, type) and item_name != 'Bot' and not item_name.startswith('_'):
                     tank_class = item
@@ -384,7 +389,7 @@ def main():
     if len(sys.argv) < 2:
         print_error("Usage: python battle_runner.py <your_tank.py> <opponent_tank.py>")
         print_info("Examples:")
-        print("  python battle_runner.py my_tank.py Samples/sitting_duck.py")
+        print("  python battle_runner.py my_tank.py Samples/sitting_duck/sitting_duck.py")
         print("  python battle_runner.py my_tank.py --all-samples")
         sys.exit(1)
 
@@ -408,12 +413,11 @@ def main():
     # Load second tank or run against all samples
     if len(sys.argv) > 2 and sys.argv[2] == '--all-samples':
         # Battle against all sample tanks
-        sample_dir = Path('Samples')
-        if not sample_dir.exists():
-            print_error("Samples directory not found!")
+        sample_files = [REPO_ROOT / bot.path for bot in BotCatalog(folders=('Samples',)).entries]
+        if not sample_files:
+            print_error("No sample tanks found in the Samples directory!")
             sys.exit(1)
 
-        sample_files = list(sample_dir.glob('*.py'))
         print_info(f"Found {len(sample_files)} sample tanks")
 
         for sample_file in sample_files:
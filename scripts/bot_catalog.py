@@ -0,0 +1,326 @@
+"""
+Bot Catalog for Python Tank Wars
+
+Finds every bot in the repository WITHOUT importing (running) any of them.
+Importing a bot file runs its code: slow (numpy, the bot API...) and
+sometimes surprising (prints, files written, a crash). The catalog only
+reads files instead:
+
+- A bot is a .py file with a .json of the same name next to it
+- The .json gives the bot's name, version and authors
+- The tank class is found by reading the Python code's structure (its
+  "AST"): classes that build on Bot, directly or through another class
+  in the same file. The .json "botClass" or the class created in the
+  ``if __name__ == "__main__":`` block picks the main one
+
+How it stays fast:
+- The tree is walked once per catalog, and only when it is first used
+- Results are cached in data/bot_catalog_cache.json. A bot is only read
+  again when its files change size or modified time, and only parsed
+  again when their contents (SHA-1) really changed
+- With hundreds of submissions, listing or picking bots takes
+  milliseconds
+
+Usage:
+    python scripts/bot_catalog.py                    # List every bot
+    python scripts/bot_catalog.py spin               # Bots matching "spin"
+    python scripts/bot_catalog.py --paths Samples    # Just the file paths (for shell scripts)
+
+    from bot_catalog import BotCatalog
+    for bot in BotCatalog().find("champion"):
+        print(bot.name, bot.path, bot.bot_class)
+"""
+
+import os
+import ast
+import sys
+import json
+import time
+import hashlib
+import argparse
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BOT_FOLDERS = ('Samples', 'Tutorials', 'Submissions')
+CACHE_PATH = REPO_ROOT / 'data' / 'bot_catalog_cache.json'
+CACHE_VERSION = 1      # Bump when scan_source() finds things differently
+BOT_BASES = {'Bot', 'BaseBot'}
+SKIP_DIRS = {'__pycache__', 'deps', 'venv', '.venv', 'node_modules'}
+
+
+@dataclass
+class BotEntry:
+    """One bot found in the tree"""
+    path: str                       # .py file, relative to the repository
+    name: str                       # From the .json (or the file name)
+    version: str = ''
+    authors: List[str] = field(default_factory=list)
+    classes: List[str] = field(default_factory=list)   # Tank classes (team files have several)
+    bot_class: Optional[str] = None                    # The main one, if there is one
+    takes_bot_info: bool = False    # Whether bot_class(bot_info=...) works
+    error: Optional[str] = None     # Why the file could not be read
+
+    @property
+    def folder(self) -> str:
+        return str(Path(self.path).parent)
+
+    @property
+    def json_path(self) -> str:
+        return str(Path(self.path).with_suffix('.json'))
+
+
+def _base_names(node: ast.ClassDef) -> List[str]:
+    names = []
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            names.append(base.id)
+        elif isinstance(base, ast.Attribute):  # e.g. bot_api.Bot
+            names.append(base.attr)
+    return names
+
+
+def tank_classes(classes: Dict[str, ast.ClassDef]) -> Set[str]:
+    """Names of the classes that are tanks: they build on Bot, or on another tank class"""
+    bots: Set[str] = set()
+    changed = True
+    while changed:
+        changed = False
+        for name, node in classes.items():
+            if name not in bots and any(base in BOT_BASES or base in bots for base in _base_names(node)):
+                bots.add(name)
+                changed = True
+    return bots
+
+
+def _takes_bot_info(name: str, classes: Dict[str, ast.ClassDef]) -> bool:
+    """Follow a class (and its bases in the same file) to the first __init__"""
+    seen: Set[str] = set()
+    while name in classes and name not in seen:
+        seen.add(name)
+        node = classes[name]
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef) and item.name == '__init__':
+                args = item.args
+                names = [a.arg for a in args.args + args.kwonlyargs]
+                return 'bot_info' in names or args.kwarg is not None
+        bases = _base_names(node)
+        name = bases[0] if bases else ''
+    return True  # Bot's own __init__ takes bot_info
+
+
+def _main_block_classes(tree: ast.Module, bot_classes: Set[str]) -> List[str]:
+    """Tank classes created in the ``if __name__ == "__main__":`` block"""
+    created = []
+    for node in tree.body:
+        if isinstance(node, ast.If) and '__main__' in ast.dump(node.test):
+            for call in ast.walk(node):
+                if (isinstance(call, ast.Call) and isinstance(call.func, ast.Name)
+                        and call.func.id in bot_classes and call.func.id not in created):
+                    created.append(call.func.id)
+    return created
+
+
+def scan_source(source: str, path: str = '<bot>', preferred: Optional[str] = None) -> Dict:
+    """
+    Read a bot file's structure without running it
+
+    Args:
+        source: The bot file's code
+        path: File name for error messages
+        preferred: Main class to use if the file has it (e.g. the .json "botClass")
+
+    Returns:
+        classes (tank classes, leaves only - like a team's members),
+        bot_class (main class or None) and takes_bot_info
+    """
+    tree = ast.parse(source, filename=path)
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    bots = tank_classes(classes)
+
+    parents = {base for name in bots for base in _base_names(classes[name])}
+    leaves = [name for name in classes if name in bots and name not in parents and not name.startswith('_')]
+    created = _main_block_classes(tree, bots)
+    main = created[0] if len(created) == 1 else (leaves[0] if len(leaves) == 1 else None)
+    if preferred in leaves:
+        main = preferred
+    return {
+        'classes': leaves,
+        'bot_class': main,
+        'takes_bot_info': _takes_bot_info(main, classes) if main else False,
+    }
+
+
+def read_bot(py_file: Path, root: Path = REPO_ROOT) -> BotEntry:
+    """Build the catalog entry for one bot file (reads it, never imports it)"""
+    entry = BotEntry(path=py_file.relative_to(root).as_posix(), name=py_file.stem)
+    try:
+        info = json.loads(py_file.with_suffix('.json').read_text(encoding='utf-8'))
+        entry.name = info.get('name') or entry.name
+        entry.version = str(info.get('version', ''))
+        entry.authors = list(info.get('authors') or [])
+    except (OSError, ValueError) as e:
+        entry.error = f"{py_file.with_suffix('.json').name}: {e}"
+        info = {}
+    try:
+        found = scan_source(py_file.read_text(encoding='utf-8'), str(py_file), info.get('botClass'))
+    except (OSError, SyntaxError, ValueError) as e:
+        entry.error = f"{py_file.name}: {type(e).__name__}: {e}"
+        return entry
+    entry.classes = found['classes']
+    entry.bot_class = found['bot_class']
+    entry.takes_bot_info = found['takes_bot_info']
+    return entry
+
+
+def _walk(folder: Path):
+    """Every .json with a same-named .py next to it, skipping virtualenvs and caches"""
+    try:
+        items = sorted(os.scandir(folder), key=lambda item: item.name)
+    except OSError:
+        return
+    names = {item.name for item in items}
+    for item in items:
+        if item.is_dir(follow_symlinks=False):
+            if item.name not in SKIP_DIRS and not item.name.startswith('.'):
+                yield from _walk(Path(item.path))
+        elif item.name.endswith('.json') and item.name[:-5] + '.py' in names:
+            yield Path(item.path[:-5] + '.py')
+
+
+def _stamp(py_file: Path) -> List[int]:
+    """Size and modified time of a bot's .py and .json - cheap to check"""
+    py, js = py_file.stat(), py_file.with_suffix('.json').stat()
+    return [py.st_size, py.st_mtime_ns, js.st_size, js.st_mtime_ns]
+
+
+def _digest(py_file: Path) -> str:
+    sha = hashlib.sha1(py_file.read_bytes())
+    sha.update(py_file.with_suffix('.json').read_bytes())
+    return sha.hexdigest()
+
+
+class BotCatalog:
+    """
+    Every bot in the tree, found lazily and cached on disk
+
+    Args:
+        root: Repository folder
+        folders: Folders (inside root) to look in
+        cache_path: Cache file, or None to never read or write one
+    """
+
+    def __init__(self, root: Path = REPO_ROOT, folders=BOT_FOLDERS, cache_path: Optional[Path] = CACHE_PATH):
+        self.root = Path(root)
+        self.folders = folders
+        self.cache_path = cache_path
+        self._entries: Optional[List[BotEntry]] = None
+        self.parsed = 0   # Bots actually parsed (not from the cache) by the last scan
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            cache = json.loads(self.cache_path.read_text())
+        except ValueError:
+            return {}
+        return cache.get('bots', {}) if cache.get('version') == CACHE_VERSION else {}
+
+    def _save_cache(self, bots: Dict[str, Dict]):
+        if not self.cache_path:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_suffix('.tmp')
+            tmp.write_text(json.dumps({'version': CACHE_VERSION, 'bots': bots}))
+            tmp.replace(self.cache_path)
+        except OSError:
+            pass  # A read-only tree just means no cache
+
+    def scan(self) -> List[BotEntry]:
+        """Walk the tree now (using the cache for unchanged bots)"""
+        cached = self._load_cache()
+        bots: Dict[str, Dict] = {}
+        entries = []
+        self.parsed = 0
+        for folder in self.folders:
+            for py_file in _walk(self.root / folder):
+                key = py_file.relative_to(self.root).as_posix()
+                try:
+                    stamp = _stamp(py_file)
+                    old = cached.get(key)
+                    if old and old['stamp'] == stamp:
+                        record = old
+                    else:
+                        digest = _digest(py_file)
+                        if old and old['sha1'] == digest:  # Touched, not changed
+                            record = dict(old, stamp=stamp)
+                        else:
+                            record = {'stamp': stamp, 'sha1': digest, 'entry': asdict(read_bot(py_file, self.root))}
+                            self.parsed += 1
+                except OSError:
+                    continue  # Deleted while we were looking
+                bots[key] = record
+                entries.append(BotEntry(**record['entry']))
+        if bots != cached:
+            self._save_cache(bots)
+        self._entries = entries
+        return entries
+
+    @property
+    def entries(self) -> List[BotEntry]:
+        """Every bot (the tree is only walked the first time)"""
+        if self._entries is None:
+            self.scan()
+        return self._entries
+
+    def find(self, text: str = '') -> List[BotEntry]:
+        """Bots whose name, class or path contains ``text`` (any case)"""
+        text = text.lower()
+        return [entry for entry in self.entries
+                if text in entry.name.lower() or text in entry.path.lower()
+                or any(text in name.lower() for name in entry.classes)]
+
+    def get(self, text: str) -> Optional[BotEntry]:
+        """The bot with exactly this name, class or path - or the only match"""
+        for entry in self.entries:
+            if text in (entry.name, entry.path, entry.folder, entry.bot_class):
+                return entry
+        matches = self.find(text)
+        return matches[0] if len(matches) == 1 else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='List the bots in the repository (without running them)')
+    parser.add_argument('search', nargs='?', default='', help='Only bots whose name, class or path contains this')
+    parser.add_argument('--folder', action='append', default=None,
+                        help=f"Folder to look in (default: {', '.join(BOT_FOLDERS)})")
+    parser.add_argument('--paths', action='store_true', help='Only print the .py paths, one per line')
+    parser.add_argument('--no-cache', action='store_true', help="Don't read or write the cache")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    catalog = BotCatalog(folders=args.folder or BOT_FOLDERS, cache_path=None if args.no_cache else CACHE_PATH)
+    bots = catalog.find(args.search)
+    took = (time.perf_counter() - started) * 1000
+
+    if args.paths:
+        for bot in bots:
+            print(bot.path)
+        return
+
+    print(f"{'Name':<22} {'Class':<22} {'Version':<8} Path")
+    for bot in bots:
+        classes = ', '.join(bot.classes) if len(bot.classes) > 1 else bot.bot_class or '-'
+        print(f"{bot.name[:22]:<22} {classes[:22]:<22} {bot.version[:8]:<8} {bot.path}")
+        if bot.error:
+            print(f"   ⚠️  {bot.error}")
+    print(f"\n📂 {len(bots)} bot(s) in {took:.1f} ms "
+          f"({catalog.parsed} read, {len(catalog.entries) - catalog.parsed} from the cache)")
+    if not bots:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,568 @@
+"""
+Compact Recording Format for Python Tank Wars
+
+Tank Royale recordings repeat every field of every bot as JSON text on
+every tick ("isDebuggingEnabled": false, 17-digit floats...). This tool
+converts them to a compact binary ".tkr" file that is about 10× smaller
+than the .battle.gz and can jump straight to any turn.
+
+How it shrinks:
+- Bot numbers are stored as fixed-point integers (1/100 of a unit or degree)
+- Ticks are grouped in blocks; inside a block each bot's values are stored
+  as changes from the previous tick, which are mostly tiny or zero
+- Bullets fly in straight lines, so a bullet is stored once when it is
+  fired and after that only by its id
+- Scan events that just repeat the scanned bot's state are stored as a
+  pair of bot ids
+- Each block is zlib-compressed on its own
+
+How it seeks:
+- A footer index lists every block's round, first/last turn and byte
+  offset, so reading turn 250 only decompresses the one block holding it
+
+File layout:
+    "TKREC001" | header length (u32) | header JSON
+    block, block, block...       (zlib: u32 JSON length | JSON | present | deltas)
+    index (zlib JSON)
+    index offset (u64) | index length (u32) | "TKRIDX01"
+
+Usage:
+    python scripts/compact_recording.py convert recordings/ --output-dir compact/
+    python scripts/compact_recording.py info compact/game-2025-12-16-00-53-39.tkr
+    python scripts/compact_recording.py show compact/game-2025-12-16-00-53-39.tkr --round 1 --turn 250
+    python scripts/compact_recording.py export compact/game.tkr game.battle.gz
+"""
+
+import os
+import sys
+import gzip
+import json
+import math
+import zlib
+import bisect
+import struct
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from recording_reader import TICK_EVENT, find_recordings, iter_messages
+
+FILE_MAGIC = b"TKREC001"
+INDEX_MAGIC = b"TKRIDX01"
+TRAILER_FORMAT = "<QI8s"
+TRAILER_SIZE = struct.calcsize(TRAILER_FORMAT)
+
+# Numeric bot fields stored as fixed-point columns: (name, scale, type)
+BOT_FIELDS = [
+    ('energy', 100, float), ('x', 100, float), ('y', 100, float),
+    ('direction', 100, float), ('gunDirection', 100, float), ('radarDirection', 100, float),
+    ('radarSweep', 100, float), ('speed', 100, float), ('turnRate', 100, float),
+    ('gunTurnRate', 100, float), ('radarTurnRate', 100, float), ('gunHeat', 100, float),
+    ('enemyCount', 1, int), ('isDroid', 1, bool), ('isDebuggingEnabled', 1, bool),
+]
+BOT_FIELD_NAMES = {name for name, _, _ in BOT_FIELDS}
+
+# Bullet fields, in the order they are packed
+BULLET_FIELDS = ('bulletId', 'ownerId', 'power', 'x', 'y', 'direction')
+BULLET_TOLERANCE = 0.005  # Same as the 1/100 fixed-point rounding of bot positions
+
+SCAN_FIELDS = ('energy', 'x', 'y', 'direction', 'speed')
+
+# Preset zlib dictionary: text that shows up in almost every block, so even
+# a small block compresses well on its own
+BLOCK_DICTIONARY = (
+    '{"type":"BulletHitWallEvent","bullet":{"bulletId":"ownerId":"power":"x":"y":"direction":'
+    '{"type":"BulletFiredEvent","bullet":{"type":"BulletHitBotEvent","victimId":"damage":"energy":'
+    '{"type":"BulletHitBulletEvent","hitBullet":{"type":"BotHitWallEvent","botId":'
+    '{"type":"BotHitBotEvent","victimBotId":"rammed":false,"rammed":true,'
+    '{"type":"BotDeathEvent","victimId":{"type":"WonRoundEvent","isDebuggingEnabled":'
+    '"turns":[{"round":1,"slots":[1,2,3,4,5,6,7,8],"extras":{"0":{"1":0,"2":1,"3":2,"4":3,'
+    '"bullets":[[[],[],[]],"events":[[[],[],"tick_extras":{}}'
+).encode()
+EVENT_DIGITS = 2  # Decimal places kept for floats inside events
+
+
+def _fixed(value, scale: int) -> int:
+    return int(round(float(value) * scale))
+
+
+def _unfixed(value: int, scale: int, kind):
+    if kind is float:
+        return value / scale
+    return kind(value)
+
+
+def _bullet_position(anchor: list, turns: int) -> Tuple[float, float]:
+    """Where a bullet will be ``turns`` turns after ``anchor`` (straight line, speed 20 - 3 × power)"""
+    _, _, power, x, y, direction = anchor[:6]
+    distance = (20 - 3 * power) * turns
+    angle = math.radians(direction)
+    return x + distance * math.cos(angle), y + distance * math.sin(angle)
+
+
+def _fired_anchors(events: list, turn: int) -> Dict[int, list]:
+    """
+    Bullets fired this turn, as anchors for _pack_bullets
+
+    A new bullet has already moved one step when it first shows up in
+    bulletStates, so its BulletFiredEvent (position at turn - 1) predicts it.
+    """
+    anchors = {}
+    for event in events:
+        if isinstance(event, dict) and event.get('type') == 'BulletFiredEvent' and 'turnNumber' not in event:
+            bullet = event['bullet']
+            entry = [bullet.get(name) for name in BULLET_FIELDS]
+            extra = {k: v for k, v in bullet.items() if k not in BULLET_FIELDS}
+            if extra:
+                entry.append(extra)
+            anchors[entry[0]] = [turn - 1, entry]
+    return anchors
+
+
+def _pack_bullets(bullets: List[dict], turn: int, seen: Dict[int, list]) -> list:
+    """
+    Pack one tick's bullets
+
+    Bullets fly in straight lines at a constant speed, so a bullet is
+    stored in full once ([bulletId, ownerId, power, x, y, direction]) and
+    after that only its id, for as long as it is where the physics says it
+    should be. ``seen`` carries [turn, full entry] between ticks.
+    """
+    packed_tick = []
+    current = {}
+    for bullet in bullets:
+        entry = [bullet[name] for name in BULLET_FIELDS]
+        extra = {k: v for k, v in bullet.items() if k not in BULLET_FIELDS}
+        if extra:
+            entry.append(extra)
+        anchor = seen.get(entry[0])
+        if anchor and anchor[1][:3] + anchor[1][5:] == entry[:3] + entry[5:]:
+            x, y = _bullet_position(anchor[1], turn - anchor[0])
+            if abs(x - entry[3]) < BULLET_TOLERANCE and abs(y - entry[4]) < BULLET_TOLERANCE:
+                packed_tick.append(entry[0])
+                current[entry[0]] = anchor
+                continue
+        packed_tick.append(entry)
+        current[entry[0]] = [turn, entry]
+    seen.clear()
+    seen.update(current)
+    return packed_tick
+
+
+def _unpack_bullets(packed_tick: list, turn: int, seen: Dict[int, list]) -> List[dict]:
+    """Reverse of _pack_bullets"""
+    bullets = []
+    current = {}
+    for entry in packed_tick:
+        if isinstance(entry, int):
+            anchor = seen[entry]
+            current[entry] = anchor
+            entry = list(anchor[1])
+            entry[3], entry[4] = _bullet_position(anchor[1], turn - anchor[0])
+        else:
+            current[entry[0]] = [turn, entry]
+        bullet = dict(zip(BULLET_FIELDS, entry))
+        if len(entry) > len(BULLET_FIELDS):
+            bullet.update(entry[-1])
+        bullets.append(bullet)
+    seen.clear()
+    seen.update(current)
+    return bullets
+
+
+def _round_floats(obj, digits: int = EVENT_DIGITS):
+    """Round every float inside a JSON value"""
+    if isinstance(obj, float):
+        return round(obj, digits)
+    if isinstance(obj, dict):
+        return {k: _round_floats(v, digits) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_round_floats(v, digits) for v in obj]
+    return obj
+
+
+class CompactWriter:
+    """
+    Writes tick messages into a .tkr file, one block at a time
+
+    Blocks end every ``block_size`` ticks and at every new round, so a
+    round always starts at a block boundary.
+    """
+
+    def __init__(self, path: str, block_size: int = 256, arena: Tuple[int, int] = (800, 600)):
+        self.path = path
+        self.block_size = block_size
+        self.file = open(path, 'wb')
+        header = json.dumps({'version': 1, 'block_size': block_size, 'arena': list(arena)}).encode()
+        self.file.write(FILE_MAGIC + struct.pack("<I", len(header)) + header)
+
+        self.index: List[list] = []        # [round, first_turn, last_turn, offset, length, ticks]
+        self.messages: List[list] = []     # [tick count before it, message] for non-tick messages
+        self.extras: List[dict] = []       # Distinct non-numeric bot fields (sessionId, colors...)
+        self._extra_ids: Dict[str, int] = {}
+        self.tick_count = 0
+        self._block: List[dict] = []
+
+    def add(self, message: dict):
+        """Add one recording message (ticks go into blocks, others into the index)"""
+        if message.get('type') != TICK_EVENT:
+            self.messages.append([self.tick_count + len(self._block), message])
+            return
+        if self._block and (len(self._block) >= self.block_size or
+                            message.get('roundNumber') != self._block[0].get('roundNumber')):
+            self._flush_block()
+        self._block.append(message)
+
+    def _extra_id(self, extra: dict) -> int:
+        """Number of this set of non-numeric bot fields in the shared table"""
+        key = json.dumps(extra, sort_keys=True)
+        if key not in self._extra_ids:
+            self._extra_ids[key] = len(self.extras)
+            self.extras.append(extra)
+        return self._extra_ids[key]
+
+    def _flush_block(self):
+        ticks = self._block
+        slots = sorted({bot['id'] for tick in ticks for bot in tick.get('botStates', [])})
+        slot_of = {bot_id: i for i, bot_id in enumerate(slots)}
+        n_ticks, n_slots = len(ticks), len(slots)
+
+        present = np.zeros((n_ticks, n_slots), dtype=np.uint8)
+        values = np.zeros((n_ticks, n_slots, len(BOT_FIELDS)), dtype=np.int32)
+        extras: Dict[str, Dict[str, dict]] = {}
+        last_extra: Dict[int, int] = {}
+        bullets, events, tick_extras = [], [], {}
+        seen_bullets: Dict[int, list] = {}
+
+        for row, tick in enumerate(ticks):
+            if row > 0:
+                values[row] = values[row - 1]  # Absent bots keep their last values (delta 0)
+            states = {}
+            for bot in tick.get('botStates', []):
+                slot = slot_of[bot['id']]
+                present[row, slot] = 1
+                values[row, slot] = [_fixed(bot.get(name, 0), scale) for name, scale, _ in BOT_FIELDS]
+                states[bot['id']] = bot
+
+                extra = {k: v for k, v in bot.items() if k != 'id' and k not in BOT_FIELD_NAMES}
+                extra_id = self._extra_id(extra)
+                if extra_id != last_extra.get(bot['id']):
+                    extras.setdefault(str(row), {})[str(bot['id'])] = extra_id
+                    last_extra[bot['id']] = extra_id
+
+            tick_events = []
+            for event in tick.get('events', []):
+                if event.get('turnNumber') == tick.get('turnNumber'):
+                    event = {k: v for k, v in event.items() if k != 'turnNumber'}
+                else:
+                    event = dict(event, turnNumber=event.get('turnNumber'))
+                if event.get('type') == 'ScannedBotEvent' and 'turnNumber' not in event:
+                    scanned = states.get(event['scannedBotId'])
+                    if scanned and all(_fixed(event[k], 100) == _fixed(scanned[k], 100) for k in SCAN_FIELDS):
+                        tick_events.append([event['scannedByBotId'], event['scannedBotId']])
+                        continue
+                # Fired bullets keep full precision: they anchor the bullet's flight
+                tick_events.append(event if event.get('type') == 'BulletFiredEvent' else _round_floats(event))
+            events.append(tick_events)
+
+            seen_bullets.update(_fired_anchors(tick_events, tick.get('turnNumber')))
+            bullets.append(_pack_bullets(tick.get('bulletStates', []), tick.get('turnNumber'), seen_bullets))
+
+            other = {k: v for k, v in tick.items()
+                     if k not in ('roundNumber', 'turnNumber', 'type', 'botStates', 'bulletStates', 'events')}
+            if other:
+                tick_extras[str(row)] = other
+
+        turns = [tick.get('turnNumber') for tick in ticks]
+        contiguous = None not in turns and turns == list(range(turns[0], turns[0] + n_ticks))
+        meta = json.dumps({
+            'round': ticks[0].get('roundNumber'),
+            'turns': [turns[0], n_ticks] if contiguous else turns,
+            'contiguous': contiguous,
+            'slots': slots,
+            'extras': extras,
+            'bullets': bullets,
+            'events': events,
+            'tick_extras': tick_extras,
+        }, separators=(',', ':')).encode()
+
+        # Deltas along time, laid out field by field so similar numbers sit together
+        deltas = np.diff(values, axis=0, prepend=np.zeros((1, n_slots, len(BOT_FIELDS)), dtype=np.int32))
+        payload = struct.pack("<I", len(meta)) + meta + present.tobytes() + \
+            np.ascontiguousarray(deltas.transpose(2, 1, 0)).astype('<i4').tobytes()
+        compressor = zlib.compressobj(9, zdict=BLOCK_DICTIONARY)
+        compressed = compressor.compress(payload) + compressor.flush()
+
+        offset = self.file.tell()
+        self.file.write(compressed)
+        self.index.append([ticks[0].get('roundNumber'), ticks[0].get('turnNumber'),
+                           ticks[-1].get('turnNumber'), offset, len(compressed), n_ticks])
+        self.tick_count += n_ticks
+        self._block = []
+
+    def close(self):
+        """Write the last block, the index and the trailer"""
+        if self._block:
+            self._flush_block()
+        index = zlib.compress(json.dumps({
+            'blocks': self.index,
+            'messages': self.messages,
+            'extras': self.extras,
+            'ticks': self.tick_count,
+        }, separators=(',', ':')).encode(), 9)
+        offset = self.file.tell()
+        self.file.write(index)
+        self.file.write(struct.pack(TRAILER_FORMAT, offset, len(index), INDEX_MAGIC))
+        self.file.close()
+
+
+class _Block:
+    """
+    One decompressed block
+
+    Bot values are rebuilt for the whole block at once with numpy; tick
+    dicts are only built for the rows that are asked for.
+    """
+
+    def __init__(self, data: bytes, extras_table: List[dict]):
+        decompressor = zlib.decompressobj(zdict=BLOCK_DICTIONARY)
+        payload = decompressor.decompress(data) + decompressor.flush()
+        meta_len = struct.unpack_from("<I", payload)[0]
+        self.meta = json.loads(payload[4:4 + meta_len])
+        self.extras_table = extras_table
+        self.slots = self.meta['slots']
+        self.turns = self.meta['turns']
+        if self.meta['contiguous']:
+            self.turns = list(range(self.turns[0], self.turns[0] + self.turns[1]))
+        n_ticks, n_slots, n_fields = len(self.turns), len(self.slots), len(BOT_FIELDS)
+
+        pos = 4 + meta_len
+        self.present = np.frombuffer(payload, dtype=np.uint8, count=n_ticks * n_slots,
+                                     offset=pos).reshape(n_ticks, n_slots)
+        pos += n_ticks * n_slots
+        deltas = np.frombuffer(payload, dtype='<i4', count=n_ticks * n_slots * n_fields, offset=pos)
+        self.values = np.cumsum(deltas.reshape(n_fields, n_slots, n_ticks), axis=2).transpose(2, 1, 0)
+
+    def rows(self) -> Iterator[dict]:
+        """Yield every tick of the block in order"""
+        extra_state: Dict[str, int] = {}
+        seen_bullets: Dict[int, list] = {}
+        for row in range(len(self.turns)):
+            turn = self.turns[row]
+            extra_state.update(self.meta['extras'].get(str(row), {}))
+            seen_bullets.update(_fired_anchors(self.meta['events'][row], turn))
+            bullets = _unpack_bullets(self.meta['bullets'][row], turn, seen_bullets)
+            yield self._tick(row, extra_state, bullets)
+
+    def row(self, row: int) -> dict:
+        """Build a single tick; earlier rows only replay their bullets and extras"""
+        extra_state: Dict[str, int] = {}
+        seen_bullets: Dict[int, list] = {}
+        bullets: List[dict] = []
+        for r in range(row + 1):
+            extra_state.update(self.meta['extras'].get(str(r), {}))
+            seen_bullets.update(_fired_anchors(self.meta['events'][r], self.turns[r]))
+            bullets = _unpack_bullets(self.meta['bullets'][r], self.turns[r], seen_bullets)
+        return self._tick(row, extra_state, bullets)
+
+    def _tick(self, row: int, extra_state: Dict[str, int], bullets: List[dict]) -> dict:
+        bots = []
+        states = {}
+        for slot, bot_id in enumerate(self.slots):
+            if not self.present[row, slot]:
+                continue
+            bot = {'id': bot_id}
+            if str(bot_id) in extra_state:
+                bot.update(self.extras_table[extra_state[str(bot_id)]])
+            for (name, scale, kind), value in zip(BOT_FIELDS, self.values[row, slot].tolist()):
+                bot[name] = _unfixed(value, scale, kind)
+            bots.append(bot)
+            states[bot_id] = bot
+
+        events = []
+        for event in self.meta['events'][row]:
+            if isinstance(event, list):
+                by, scanned_id = event
+                scanned = states[scanned_id]
+                event = {'scannedByBotId': by, 'scannedBotId': scanned_id}
+                event.update({k: scanned[k] for k in SCAN_FIELDS})
+                event['type'] = 'ScannedBotEvent'
+            else:
+                event = dict(event)
+            if 'turnNumber' not in event:
+                event['turnNumber'] = self.turns[row]
+            elif event['turnNumber'] is None:
+                del event['turnNumber']
+            events.append(event)
+
+        tick = {'roundNumber': self.meta['round'], 'botStates': bots, 'bulletStates': bullets,
+                'events': events, 'turnNumber': self.turns[row], 'type': TICK_EVENT}
+        tick.update(self.meta['tick_extras'].get(str(row), {}))
+        return tick
+
+
+class CompactRecording:
+    """
+    Reads a .tkr file
+
+    Only the footer index is read when the file is opened; blocks are
+    decompressed when they are needed (the last one is cached).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            if f.read(len(FILE_MAGIC)) != FILE_MAGIC:
+                raise ValueError(f"{path} is not a compact recording")
+            header_len = struct.unpack("<I", f.read(4))[0]
+            self.header = json.loads(f.read(header_len))
+
+            f.seek(-TRAILER_SIZE, os.SEEK_END)
+            index_offset, index_len, magic = struct.unpack(TRAILER_FORMAT, f.read(TRAILER_SIZE))
+            if magic != INDEX_MAGIC:
+                raise ValueError(f"{path} has no index (was the conversion interrupted?)")
+            f.seek(index_offset)
+            index = json.loads(zlib.decompress(f.read(index_len)))
+
+        self.blocks: List[list] = index['blocks']
+        self.messages: List[list] = index['messages']
+        self.extras: List[dict] = index['extras']
+        self.tick_count: int = index['ticks']
+        self._keys = [(block[0], block[1]) for block in self.blocks]
+        self._cache: Tuple[Optional[int], Optional[_Block]] = (None, None)
+
+    def block(self, i: int) -> _Block:
+        """Decompressed block ``i``"""
+        if self._cache[0] != i:
+            _, _, _, offset, length, _ = self.blocks[i]
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                self._cache = (i, _Block(f.read(length), self.extras))
+        return self._cache[1]
+
+    def rounds(self) -> List[int]:
+        return sorted({block[0] for block in self.blocks})
+
+    def tick(self, round_number: int, turn: int) -> Optional[dict]:
+        """Jump straight to one turn (decompresses a single block)"""
+        i = bisect.bisect_right(self._keys, (round_number, turn)) - 1
+        if i < 0 or self.blocks[i][0] != round_number:
+            return None
+        block = self.block(i)
+        if turn not in block.turns:
+            return None
+        return block.row(block.turns.index(turn))
+
+    def ticks(self) -> Iterator[dict]:
+        for i in range(len(self.blocks)):
+            yield from self.block(i).rows()
+
+    def iter_messages(self) -> Iterator[dict]:
+        """Every message in original order, including non-tick messages"""
+        pending = list(self.messages)
+        count = 0
+        for tick in self.ticks():
+            while pending and pending[0][0] <= count:
+                yield pending.pop(0)[1]
+            yield tick
+            count += 1
+        for _, message in pending:
+            yield message
+
+
+def convert(source: str, destination: str, block_size: int = 256) -> Tuple[int, int, int]:
+    """
+    Convert a .battle.gz recording to .tkr
+
+    Returns:
+        (source bytes, destination bytes, ticks)
+    """
+    writer = CompactWriter(destination, block_size)
+    try:
+        for message in iter_messages(source):
+            writer.add(message)
+    finally:
+        writer.close()
+    return os.path.getsize(source), os.path.getsize(destination), writer.tick_count
+
+
+def export(source: str, destination: str):
+    """Write a .tkr file back out as a normal .battle.gz recording"""
+    with gzip.open(destination, 'wt', encoding='utf-8') as f:
+        for message in CompactRecording(source).iter_messages():
+            f.write(json.dumps(message, separators=(',', ':')) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compact binary recordings with fast seeking')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p = commands.add_parser('convert', help='Convert .battle.gz recordings to .tkr')
+    p.add_argument('recordings', nargs='*', default=['recordings'])
+    p.add_argument('--output-dir', default='compact', help='Where to write .tkr files')
+    p.add_argument('--block-size', type=int, default=256, help="Ticks per compressed block")
+    p.add_argument('--workers', type=int, default=os.cpu_count() or 2)
+
+    p = commands.add_parser('info', help='Show what is inside a .tkr file')
+    p.add_argument('file')
+
+    p = commands.add_parser('show', help='Print one tick as JSON')
+    p.add_argument('file')
+    p.add_argument('--round', type=int, default=1)
+    p.add_argument('--turn', type=int, required=True)
+
+    p = commands.add_parser('export', help='Convert a .tkr file back to .battle.gz')
+    p.add_argument('file')
+    p.add_argument('output')
+
+    args = parser.parse_args()
+
+    if args.command == 'convert':
+        paths = [p for p in find_recordings(args.recordings) if p.suffix != '.tkr']
+        if not paths:
+            print("❌ No recordings found")
+            sys.exit(1)
+        output_dir = Path(args.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        total_in = total_out = 0
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = {}
+            for path in paths:
+                output = output_dir / (path.name.replace('.battle.gz', '').replace('.battle', '') + '.tkr')
+                futures[pool.submit(convert, str(path), str(output), args.block_size)] = output
+            for future in as_completed(futures):
+                size_in, size_out, ticks = future.result()
+                total_in += size_in
+                total_out += size_out
+                print(f"✅ {futures[future]}: {ticks} ticks, {size_in:,} → {size_out:,} bytes "
+                      f"({size_in / max(1, size_out):.1f}× smaller)")
+        print(f"📦 Total: {total_in:,} → {total_out:,} bytes ({total_in / max(1, total_out):.1f}× smaller)")
+
+    elif args.command == 'info':
+        recording = CompactRecording(args.file)
+        print(f"📂 {args.file}")
+        print(f"   Ticks: {recording.tick_count} in {len(recording.blocks)} blocks")
+        print(f"   Rounds: {', '.join(map(str, recording.rounds()))}")
+        for round_number, first, last, offset, length, ticks in recording.blocks:
+            print(f"   Round {round_number} turns {first}-{last}: {ticks} ticks, {length:,} bytes @ {offset}")
+        for _, message in recording.messages:
+            print(f"   Message: {message.get('type')}")
+
+    elif args.command == 'show':
+        tick = CompactRecording(args.file).tick(args.round, args.turn)
+        if tick is None:
+            print(f"❌ Round {args.round} turn {args.turn} is not in {args.file}")
+            sys.exit(1)
+        print(json.dumps(tick, indent=2))
+
+    elif args.command == 'export':
+        export(args.file, args.output)
+        print(f"💾 Wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
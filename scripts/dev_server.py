@@ -0,0 +1,260 @@
+"""
+Hot-Reload Dev Server for Python Tank Wars
+
+Normally every change to your tank means: stop the bot, start it again,
+wait for Python, numpy and the bot API to load, wait for it to connect,
+and start a new battle. That's a lot of waiting for changing one number!
+
+The dev server keeps your tank connected and swaps in your new code
+while the battle goes on:
+
+1. Start the server and a battle with your tank in it (keep it running
+   for many rounds)
+2. Start your tank through the dev server (instead of its .sh file)
+3. Edit your tank and save - the dev server notices
+4. When the current round ends, your file is run again and your tank is
+   set up fresh (its __init__ runs again) with the new code
+5. The next round already uses your change - no restart, no reconnect
+
+What stays the same: the connection to the server, and everything
+already imported (numpy, the bot API, tank_utils). Only your tank's own
+file is reloaded. Helper files it imports are not - restart for those.
+
+If your new code has a mistake (a SyntaxError, a crash in __init__),
+the dev server says so and keeps playing with the old code until you
+save a fixed version.
+
+Usage:
+    python scripts/dev_server.py Samples/spin_bot
+    python scripts/dev_server.py my_tanks/my_tank.py:MyTank --server-url ws://localhost:7654
+"""
+
+import os
+import sys
+import time
+import asyncio
+import inspect
+import argparse
+import threading
+import traceback
+from pathlib import Path
+
+from multi_bot_launcher import BotLoader, BotSpec, host_bot
+
+API_PACKAGE = 'robocode_tank_royale'
+
+
+def _keep_connection(self, *args, **kwargs):
+    """Stands in for the bot API's __init__ while a tank is set up again (it is already connected)"""
+
+
+def _forwarder(name, is_async):
+    """
+    A handler that calls the tank's CURRENT code
+
+    The bot API remembers a tank's handlers when the tank is created, so
+    swapping the class alone would keep calling the old ones. These look
+    the handler up again on every call.
+    """
+    if is_async:
+        async def handler(self, *args, **kwargs):
+            result = getattr(type(self).tank_class, name)(self, *args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+    else:
+        def handler(self, *args, **kwargs):
+            return getattr(type(self).tank_class, name)(self, *args, **kwargs)
+    handler.__name__ = handler.__qualname__ = name
+    return handler
+
+
+def _after_handler(name, is_async, after):
+    """Like _forwarder, then call after(bot) (even if the tank's handler crashed)"""
+    forward = _forwarder(name, is_async)
+    if is_async:
+        async def handler(self, *args, **kwargs):
+            try:
+                return await forward(self, *args, **kwargs)
+            finally:
+                after(self)
+    else:
+        def handler(self, *args, **kwargs):
+            try:
+                return forward(self, *args, **kwargs)
+            finally:
+                after(self)
+    handler.__name__ = handler.__qualname__ = name
+    return handler
+
+
+class HotReloader:
+    """
+    Keeps one connected tank running the latest code of its file
+
+    Args:
+        spec: The tank (from BotLoader.specs)
+        interval: Seconds between checks of the file for changes
+    """
+
+    def __init__(self, spec: BotSpec, interval: float = 0.5):
+        from robocode_tank_royale.bot_api import BaseBot
+        self.base_class = BaseBot
+        self.spec = spec
+        self.tank_class = spec.bot_class
+        self.module = sys.modules[self.tank_class.__module__]
+        self.path = Path(self.module.__file__).resolve()
+        self.interval = interval
+        self.stamp = self._stamp()
+        self.reloads = 0
+        self.lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _stamp(self):
+        try:
+            stat = self.path.stat()
+        except OSError:  # Being saved right now
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def changed(self) -> bool:
+        stamp = self._stamp()
+        return stamp is not None and stamp != self.stamp
+
+    def host_class(self, tank_class: type) -> type:
+        """
+        The tank class with handlers that always call the current code
+
+        The round-end and game-start handlers also check for a new version
+        of the file once the tank's own handler is done.
+        """
+        namespace = {'tank_class': tank_class, 'hot_reloader': self}
+        names = {name for name in dir(tank_class) if name.startswith('on_') and callable(getattr(tank_class, name))}
+        for name in names | {'run'}:
+            is_async = inspect.iscoroutinefunction(getattr(tank_class, name))
+            if name in ('on_round_ended', 'on_game_started'):
+                namespace[name] = _after_handler(name, is_async, self.reload_if_changed)
+            else:
+                namespace[name] = _forwarder(name, is_async)
+        namespace['__module__'] = tank_class.__module__
+        namespace['__qualname__'] = tank_class.__qualname__
+        namespace['__doc__'] = tank_class.__doc__
+        return type(tank_class.__name__, (tank_class,), namespace)
+
+    def create(self):
+        """Create (but don't start) the tank"""
+        host = BotSpec(self.spec.label, self.host_class(self.tank_class), self.spec.bot_info, self.spec.folder)
+        return host.create()
+
+    def reload_if_changed(self, bot):
+        if self.changed():
+            self.reload(bot)
+
+    def reload(self, bot) -> bool:
+        """
+        Run the tank's file again and set the tank up with the new code
+
+        Returns:
+            True if the new code is now in use
+        """
+        with self.lock:
+            started = time.perf_counter()
+            self.stamp = self._stamp()  # A broken file is only tried again once it is saved again
+            old_host = type(bot)
+            try:
+                code = compile(self.path.read_bytes(), str(self.path), 'exec')
+                exec(code, self.module.__dict__)  # Like importlib.reload: same module, new contents
+                tank_class = getattr(self.module, self.tank_class.__name__, None)
+                if not (isinstance(tank_class, type) and issubclass(tank_class, self.base_class)):
+                    raise ValueError(f"{self.tank_class.__name__} is no longer a tank class in {self.path.name}")
+                bot.__class__ = self.host_class(tank_class)
+                self._init_again(bot, tank_class)
+            except Exception as e:
+                bot.__class__ = old_host
+                print(f"💥 Could not reload {self.path.name}: {type(e).__name__}: {e}")
+                traceback.print_exc(limit=-2)
+                print("   Still playing with the old code - fix it and save again", flush=True)
+                return False
+            self.tank_class = tank_class
+            self.reloads += 1
+            print(f"♻️  Reloaded {tank_class.__name__} in {(time.perf_counter() - started) * 1000:.0f} ms "
+                  f"(reload #{self.reloads})", flush=True)
+            return True
+
+    def _init_again(self, bot, tank_class: type):
+        """Run the tank's __init__ again on the connected tank, skipping the bot API's own __init__"""
+        takes_bot_info = 'bot_info' in inspect.signature(tank_class).parameters
+        kwargs = {'bot_info': self.spec.bot_info} if self.spec.bot_info is not None and takes_bot_info else {}
+        api_inits = [(klass, vars(klass)['__init__']) for klass in tank_class.__mro__
+                     if klass.__module__.startswith(API_PACKAGE) and '__init__' in vars(klass)]
+        here = os.getcwd()
+        os.chdir(self.spec.folder)  # Like BotSpec.create: bots may read files next to them
+        try:
+            for klass, _ in api_inits:
+                klass.__init__ = _keep_connection
+            tank_class.__init__(bot, **kwargs)
+        finally:
+            for klass, init in api_inits:
+                klass.__init__ = init
+            os.chdir(here)
+
+    def watch(self):
+        """Tell the student as soon as a save is noticed (the reload itself waits for the round to end)"""
+        def loop():
+            noticed = self.stamp
+            while not self._stop.wait(self.interval):
+                stamp = self._stamp()
+                if stamp is not None and stamp != self.stamp and stamp != noticed:
+                    noticed = stamp
+                    print(f"✏️  {self.path.name} changed - the new code starts next round", flush=True)
+        threading.Thread(target=loop, name=f"watch-{self.path.name}", daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a tank and reload its code between rounds when you save')
+    parser.add_argument('bot', help='Bot folder or file (file.py:Class to pick one class of a team file)')
+    parser.add_argument('--server-url', default=None, help='Server to connect to (default: ws://localhost:7654)')
+    parser.add_argument('--secret', default=None, help='Server secret for bots')
+    parser.add_argument('--interval', type=float, default=0.5, help='Seconds between checks for a saved file')
+    args = parser.parse_args()
+
+    if args.server_url:
+        os.environ['SERVER_URL'] = args.server_url
+    if args.secret:
+        os.environ['SERVER_SECRET'] = args.secret
+
+    started = time.perf_counter()
+    try:
+        loader = BotLoader()
+    except ImportError:
+        print("❌ robocode-tank-royale is not installed: pip install -r requirements.txt")
+        sys.exit(1)
+
+    try:
+        specs = loader.specs(args.bot)
+        if len(specs) > 1:
+            names = ', '.join(spec.bot_class.__name__ for spec in specs)
+            raise ValueError(f"{args.bot} has several tanks ({names}) - pick one with file.py:Class")
+        reloader = HotReloader(specs[0], args.interval)
+        bot = reloader.create()
+    except Exception as e:
+        print(f"❌ {type(e).__name__}: {e}")
+        sys.exit(1)
+
+    print(f"🛠️  {reloader.tank_class.__name__} ready in {time.perf_counter() - started:.2f}s - "
+          f"watching {reloader.path.name}")
+    print("   Save your file and the new code starts at the next round. Ctrl+C to stop.", flush=True)
+    reloader.watch()
+    try:
+        asyncio.run(host_bot(reloader.spec, restart=False, bot=bot))
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    finally:
+        reloader.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -3,8 +3,11 @@
 Fix all bot entry points to properly load BotInfo from JSON files
 """
 import re
+import ast
 from pathlib import Path
 
+from bot_catalog import BotCatalog, REPO_ROOT
+
 # Standard entry point template
 ENTRY_POINT_TEMPLATE = '''
 
@@ -50,25 +53,19 @@ def fix_bot_file(bot_path, class_name):
     bot_path.write_text(content)
     print(f"✓ Fixed {bot_path}")
 
-# List of bots to fix
-bots = [
-    ("Samples/sitting_duck.py", "SittingDuck"),
-    ("Samples/spin_bot.py", "SpinBot"),
-    ("Samples/walls_bot.py", "WallsBot"),
-    ("Samples/tracker_bot.py", "TrackerBot"),
-    ("Samples/champion_bot.py", "ChampionBot"),
-    ("Tutorials/Week1_MyFirstTank/my_first_tank.py", "MyFirstTank"),
-    ("Tutorials/Week2_Trigonometry/predictor_bot.py", "PredictorBot"),
-    ("Tutorials/Week3_BoundaryChecking/boundary_bot.py", "BoundaryBot"),
-    ("Tutorials/Week4_Strategy/trickster_bot.py", "TricksterBot"),
-    ("Tutorials/Week5_AdvancedTargeting/sniper_bot.py", "SniperBot"),
-    ("Tutorials/Week6_AdvancedPython/professional_tank.py", "ProfessionalTank"),
-    ("Tutorials/Week7_AdvancedSkirmisher/skirmisher_tank.py", "SkirmisherTank"),
-    ("Tutorials/Week8_AntiGravitySwarms/anti_gravity_tank.py", "AntiGravityTank"),
-    ("Submissions/ExampleSubmission/example_tank.py", "ExampleTank"),
-    ("Submissions/ClaudeCode/final_boss_tank.py", "FinalBossTank"),
-    ("Submissions/ClaudeCode/challenger_tank.py", "ChallengerTank"),
-]
+def needs_fix(bot_path):
+    """True if the __main__ block doesn't already create the bot with bot_info=..."""
+    tree = ast.parse(Path(bot_path).read_text())
+    for node in tree.body:
+        if isinstance(node, ast.If) and '__main__' in ast.dump(node.test):
+            return not any(isinstance(call, ast.Call) and any(k.arg == 'bot_info' for k in call.keywords)
+                           for call in ast.walk(node))
+    return True
+
+# Bots to fix: single-tank bots whose class takes bot_info (team files start several tanks, leave them be)
+bots = [(REPO_ROOT / bot.path, bot.bot_class) for bot in BotCatalog().entries
+        if bot.bot_class and bot.takes_bot_info and len(bot.classes) == 1]
+bots = [(bot_file, class_name) for bot_file, class_name in bots if needs_fix(bot_file)]
 
 print("Fixing bot entry points...")
 for bot_file, class_name in bots:
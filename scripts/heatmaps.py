@@ -0,0 +1,213 @@
+"""
+Heat Maps for Python Tank Wars (Robocode Tank Royale)
+
+Where does my tank spend its time? Where does it get hit? This tool reads
+a folder of battle recordings and draws two heat maps for every tank:
+
+- 🚗 Where it drives: every turn adds one to the square the tank is in
+- 💥 Where it gets hit: every bullet that hits it adds one where it hit
+
+Bright squares are hotspots. A tank that spends most of its time in one
+corner, or keeps getting hit in the same place, is easy to predict!
+
+How it stays fast and small:
+- Recordings are streamed, and positions are counted into a fixed grid
+  with np.histogram2d in batches, so memory stays the same size no matter
+  how many games there are
+- Several recordings are counted at the same time and their grids are
+  simply added together at the end
+
+Recordings only know tanks by their id number (1, 2, 3...), so tell the
+tool who is who with --bot, or the tanks are called "Bot 1", "Bot 2"...
+
+Usage:
+    python scripts/heatmaps.py recordings/
+    python scripts/heatmaps.py recordings/ --bot 1=FinalBoss --bot 2=Rambo --cell 25
+    python scripts/heatmaps.py recordings/ --output-dir heatmaps --workers 4
+"""
+
+import os
+import sys
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import cv2
+
+from recording_reader import ARENA_WIDTH, ARENA_HEIGHT, TICK_EVENT, find_recordings, iter_messages
+from recording_stats import parse_bot_names
+
+BATCH_SIZE = 4096   # Positions collected before they are added to the grid
+WALL_ZONE = 50      # "Near a wall" means closer than this
+PANEL_TITLES = ("Where it drives", "Where it gets hit")
+
+
+class HeatmapCounter:
+    """
+    Counts positions into per-bot grids
+
+    Each bot has a (2, rows, columns) grid: layer 0 counts turns spent in
+    each square, layer 1 counts bullet hits taken there.
+    """
+
+    def __init__(self, cell_size: int = 20, width: int = ARENA_WIDTH, height: int = ARENA_HEIGHT):
+        self.x_edges = np.linspace(0, width, int(np.ceil(width / cell_size)) + 1)
+        self.y_edges = np.linspace(0, height, int(np.ceil(height / cell_size)) + 1)
+        self.grids: Dict[int, np.ndarray] = {}
+        self._pending: Dict[Tuple[int, int], List[Tuple[float, float]]] = {}
+
+    def add(self, bot_id: int, layer: int, x: float, y: float):
+        points = self._pending.setdefault((bot_id, layer), [])
+        points.append((x, y))
+        if len(points) >= BATCH_SIZE:
+            self._flush(bot_id, layer)
+
+    def _flush(self, bot_id: int, layer: int):
+        points = self._pending.pop((bot_id, layer), None)
+        if not points:
+            return
+        xy = np.asarray(points)
+        # Clip so bullets hitting right on the edge still land in the outer squares
+        x = np.clip(xy[:, 0], self.x_edges[0], self.x_edges[-1])
+        y = np.clip(xy[:, 1], self.y_edges[0], self.y_edges[-1])
+        counts, _, _ = np.histogram2d(y, x, bins=(self.y_edges, self.x_edges))
+        if bot_id not in self.grids:
+            self.grids[bot_id] = np.zeros((2, len(self.y_edges) - 1, len(self.x_edges) - 1))
+        self.grids[bot_id][layer] += counts
+
+    def finish(self) -> Dict[int, np.ndarray]:
+        """Count whatever is still waiting and return the grids"""
+        for bot_id, layer in list(self._pending):
+            self._flush(bot_id, layer)
+        return self.grids
+
+
+def count_recording(path: str, cell_size: int = 20) -> Dict[int, np.ndarray]:
+    """One streaming pass over a recording; returns {bot id: grid}"""
+    counter = HeatmapCounter(cell_size)
+    for message in iter_messages(path):
+        if message.get('type') != TICK_EVENT:
+            continue
+        for bot in message.get('botStates', []):
+            counter.add(bot['id'], 0, bot['x'], bot['y'])
+        for event in message.get('events', []):
+            if event.get('type') == 'BulletHitBotEvent':
+                bullet = event['bullet']
+                counter.add(event['victimId'], 1, bullet['x'], bullet['y'])
+    return counter.finish()
+
+
+def count_all(paths: List[Path], cell_size: int, workers: int) -> Dict[int, np.ndarray]:
+    """Count every recording (several at a time) and add the grids together"""
+    totals: Dict[int, np.ndarray] = {}
+    if workers <= 1 or len(paths) <= 1:
+        results = (count_recording(str(path), cell_size) for path in paths)
+        for grids in results:
+            _add_grids(totals, grids)
+        return totals
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for grids in pool.map(count_recording, map(str, paths), [cell_size] * len(paths)):
+            _add_grids(totals, grids)
+    return totals
+
+
+def _add_grids(totals: Dict[int, np.ndarray], grids: Dict[int, np.ndarray]):
+    for bot_id, grid in grids.items():
+        if bot_id in totals:
+            totals[bot_id] += grid
+        else:
+            totals[bot_id] = grid.copy()
+
+
+def hotspots(grid: np.ndarray, cell_size: int, top: int = 3) -> List[Tuple[float, float, float]]:
+    """The ``top`` busiest squares of a grid layer as (center x, center y, share of total)"""
+    total = grid.sum()
+    if not total:
+        return []
+    flat = np.argsort(grid, axis=None)[::-1][:top]
+    rows, cols = np.unravel_index(flat, grid.shape)
+    return [((c + 0.5) * cell_size, (r + 0.5) * cell_size, grid[r, c] / total)
+            for r, c in zip(rows, cols) if grid[r, c] > 0]
+
+
+def wall_share(grid: np.ndarray, cell_size: int) -> float:
+    """Share of counts in squares within WALL_ZONE of a wall"""
+    total = grid.sum()
+    if not total:
+        return 0.0
+    edge = max(1, int(np.ceil(WALL_ZONE / cell_size)))
+    inner = grid[edge:-edge, edge:-edge].sum()
+    return 1.0 - inner / total
+
+
+def render_heatmap(grid: np.ndarray, title: str, scale: float = 1.0) -> np.ndarray:
+    """Draw both layers of a bot's grid side by side as a BGR image"""
+    width, height = int(ARENA_WIDTH * scale), int(ARENA_HEIGHT * scale)
+    panels = []
+    for layer, panel_title in enumerate(PANEL_TITLES):
+        counts = grid[layer]
+        # Log scale so a few very busy squares don't hide everything else
+        levels = np.log1p(counts)
+        if levels.max() > 0:
+            levels = levels / levels.max()
+        image = (levels * 255).astype(np.uint8)
+        image = cv2.resize(image[::-1], (width, height), interpolation=cv2.INTER_NEAREST)  # y points up
+        panel = cv2.applyColorMap(image, cv2.COLORMAP_INFERNO)
+        cv2.rectangle(panel, (0, 0), (width - 1, height - 1), (90, 90, 90), 1)
+        label = f"{panel_title} ({int(counts.sum())})"
+        cv2.putText(panel, label, (8, 22), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1, cv2.LINE_AA)
+        panels.append(panel)
+
+    gap = np.full((height, 10, 3), 20, dtype=np.uint8)
+    body = np.hstack([panels[0], gap, panels[1]])
+    header = np.full((36, body.shape[1], 3), 20, dtype=np.uint8)
+    cv2.putText(header, title, (8, 26), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2, cv2.LINE_AA)
+    return np.vstack([header, body])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Movement and hit heat maps from battle recordings')
+    parser.add_argument('recordings', nargs='*', default=['recordings'],
+                        help='Recording files or folders (default: recordings/)')
+    parser.add_argument('--bot', action='append', default=[],
+                        help='Name a bot id: ID=Name (e.g. 1=FinalBoss)')
+    parser.add_argument('--output-dir', default='heatmaps', help='Where to save the PNG files')
+    parser.add_argument('--cell', type=int, default=20, help='Size of one heat map square in arena units')
+    parser.add_argument('--scale', type=float, default=1.0, help='Image size relative to the arena')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2,
+                        help='Recordings processed at the same time')
+    args = parser.parse_args()
+
+    paths = find_recordings(args.recordings)
+    if not paths:
+        print("❌ No recordings found")
+        sys.exit(1)
+
+    names = {bot_id: name for bot_id, (name, _) in parse_bot_names(args.bot).items()}
+    print(f"🔥 Counting {len(paths)} recording(s) with {min(args.workers, len(paths))} worker(s)")
+    grids = count_all(paths, args.cell, args.workers)
+    if not grids:
+        print("❌ No tanks found in the recordings")
+        sys.exit(1)
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    everyone = sum(grids.values())
+    for bot_id, grid in sorted(grids.items()) + [(None, everyone)]:
+        name = "All tanks" if bot_id is None else names.get(bot_id, f"Bot {bot_id}")
+        output = output_dir / f"heatmap_{name.lower().replace(' ', '_')}.png"
+        cv2.imwrite(str(output), render_heatmap(grid, name, args.scale))
+
+        print(f"\n📊 {name}: {int(grid[0].sum())} turns, {int(grid[1].sum())} hits taken → {output}")
+        print(f"   Near a wall {wall_share(grid[0], args.cell):.0%} of the time")
+        for x, y, share in hotspots(grid[0], args.cell):
+            print(f"   🚗 Hotspot around ({x:.0f}, {y:.0f}): {share:.0%} of the time")
+        for x, y, share in hotspots(grid[1], args.cell, top=2):
+            print(f"   💥 Hit around ({x:.0f}, {y:.0f}): {share:.0%} of hits")
+
+
+if __name__ == '__main__':
+    main()
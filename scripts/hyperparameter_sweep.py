@@ -0,0 +1,405 @@
+"""
+Hyperparameter Sweep Runner for ML Tanks
+
+Instead of changing one number in ml_champion_best_params.json and trying
+one battle per evening, this script tries many parameter sets at once on
+all your CPU cores and prints a ranked table of the best ones.
+
+Search strategies:
+- grid:   every combination of a few values per parameter
+- random: random samples from the search space
+- bayes:  later trials are picked near the best earlier ones (TPE)
+
+Poor trials are stopped early with successive halving: every trial gets a
+few battles, only the best third go on to get three times as many battles,
+and so on. Battle results are cached in a FitnessStore, so a promoted
+trial only fights the battles it hasn't fought yet.
+
+Usage:
+    # Random search over EvolvableParameters for the ML Champion
+    python scripts/hyperparameter_sweep.py ml_champion --trials 27 --workers 8
+
+    # Only tune two parameters, on a grid
+    python scripts/hyperparameter_sweep.py ml_champion --strategy grid \\
+        --param learning_rate=0.05:0.3 --param close_range=150,200,250
+
+    # QLearningBrain args, scored by your own battle command
+    # (the command gets SWEEP_PARAMS/SWEEP_SEED and prints a score as its last line)
+    python scripts/hyperparameter_sweep.py qlearning --strategy bayes --command "python my_trial.py"
+"""
+
+import os
+import sys
+import json
+import math
+import random
+import argparse
+import itertools
+import subprocess
+from pathlib import Path
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ML_CHAMPION_DIR = REPO_ROOT / "Submissions" / "ClaudeCode" / "ml_champion_tank"
+sys.path.append(str(REPO_ROOT))
+sys.path.append(str(ML_CHAMPION_DIR))
+
+from fitness_store import FitnessStore
+
+
+# Default search spaces: name → (kind, low, high) or a list of choices
+SEARCH_SPACES = {
+    'ml_champion': {  # EvolvableParameters fields
+        'learning_rate': ('log', 0.02, 0.5),
+        'discount_factor': ('uniform', 0.7, 0.99),
+        'epsilon_start': ('uniform', 0.05, 0.5),
+        'epsilon_decay': ('uniform', 0.98, 0.999),
+        'damage_dealt_weight': ('uniform', 2.0, 20.0),
+        'damage_taken_weight': ('uniform', -12.0, -1.0),
+        'close_range': ('uniform', 100.0, 300.0),
+        'far_range': ('uniform', 350.0, 700.0),
+    },
+    'qlearning': {  # QLearningBrain constructor args
+        'learning_rate': ('log', 0.01, 0.5),
+        'discount_factor': ('uniform', 0.7, 0.99),
+        'epsilon': ('uniform', 0.05, 0.5),
+    },
+}
+
+
+class Dimension:
+    """One tunable parameter: a continuous range or a list of choices"""
+
+    def __init__(self, name: str, spec):
+        self.name = name
+        if isinstance(spec, list):
+            self.kind, self.choices = 'choice', spec
+        else:
+            self.kind, self.low, self.high = spec
+
+    def sample(self, rng: random.Random):
+        return self.from_unit(rng.random())
+
+    def grid(self, points: int) -> list:
+        if self.kind == 'choice':
+            return list(self.choices)
+        return [self.from_unit(u) for u in np.linspace(0.0, 1.0, points)]
+
+    def to_unit(self, value) -> float:
+        """Map a value to 0..1 (used by the Bayesian search)"""
+        if self.kind == 'choice':
+            return self.choices.index(value) / max(1, len(self.choices) - 1)
+        if self.kind == 'log':
+            return math.log(value / self.low) / math.log(self.high / self.low)
+        return (value - self.low) / (self.high - self.low)
+
+    def from_unit(self, u: float):
+        u = min(1.0, max(0.0, float(u)))
+        if self.kind == 'choice':
+            return self.choices[round(u * (len(self.choices) - 1))]
+        if self.kind == 'log':
+            return self.low * (self.high / self.low) ** u
+        return self.low + u * (self.high - self.low)
+
+
+def parse_param(text: str) -> Tuple[str, object]:
+    """Parse --param name=low:high, name=log:low:high or name=a,b,c"""
+    name, _, spec = text.partition('=')
+    if ':' in spec:
+        parts = spec.split(':')
+        if parts[0] == 'log':
+            return name, ('log', float(parts[1]), float(parts[2]))
+        return name, ('uniform', float(parts[0]), float(parts[1]))
+    return name, [json.loads(v) for v in spec.split(',')]
+
+
+BUILTIN_BATTLES = {'ml_champion'}   # Targets run_trial can score without --command
+
+
+@dataclass
+class Trial:
+    """One parameter set and how it has scored so far"""
+    trial_id: int
+    params: Dict[str, object]
+    score: Optional[float] = None
+    budget: int = 0      # battles per opponent used for the current score
+    rung: int = 0        # how many halving rounds it survived
+
+
+def run_trial(target: str, params: dict, opponent: str, seed: int, command: Optional[str] = None) -> float:
+    """
+    Score one parameter set in one battle (runs in a worker process)
+
+    With a command, the command is run with SWEEP_PARAMS (JSON), SWEEP_SEED
+    and SWEEP_OPPONENT in its environment and must print the score as the
+    last line of its output.
+    """
+    if command:
+        env = dict(os.environ, SWEEP_PARAMS=json.dumps(params), SWEEP_SEED=str(seed),
+                   SWEEP_OPPONENT=opponent, SWEEP_TARGET=target)
+        result = subprocess.run(command, shell=True, env=env, capture_output=True, text=True, check=True)
+        return float(result.stdout.strip().splitlines()[-1])
+
+    if target == 'ml_champion':
+        from train_evolution import EvolvableParameters, simulate_battle_fitness
+        return simulate_battle_fitness(EvolvableParameters(**params), opponent, seed)
+
+    raise ValueError(f"No built-in battle for '{target}' - pass --command to score trials")
+
+
+class SweepRunner:
+    """
+    Runs trials in parallel with successive halving
+
+    Every battle result goes into a FitnessStore keyed by the parameter
+    set, opponent and seed, so re-running a sweep (or promoting a trial to
+    a bigger budget) never repeats a battle.
+    """
+
+    def __init__(self,
+                 target: str,
+                 space: Dict[str, object],
+                 opponents: List[str],
+                 store: FitnessStore,
+                 workers: int = 4,
+                 min_budget: int = 1,
+                 max_budget: int = 9,
+                 eta: int = 3,
+                 command: Optional[str] = None,
+                 seed: Optional[int] = None):
+        self.target = target
+        self.dimensions = [Dimension(name, spec) for name, spec in space.items()]
+        self.opponents = opponents
+        self.store = store
+        self.workers = workers
+        self.min_budget = min_budget
+        self.max_budget = max_budget
+        self.eta = eta
+        self.command = command
+        self.rng = random.Random(seed)
+        self.trials: List[Trial] = []
+
+    # ----- proposing parameter sets -----
+
+    def new_trial(self, params: dict) -> Trial:
+        trial = Trial(len(self.trials) + 1, params)
+        self.trials.append(trial)
+        return trial
+
+    def propose_grid(self, points: int) -> List[Trial]:
+        values = [d.grid(points) for d in self.dimensions]
+        return [self.new_trial({d.name: v for d, v in zip(self.dimensions, combo)})
+                for combo in itertools.product(*values)]
+
+    def propose_random(self, n: int) -> List[Trial]:
+        return [self.new_trial({d.name: d.sample(self.rng) for d in self.dimensions}) for _ in range(n)]
+
+    def propose_bayes(self, n: int, good_fraction: float = 0.25, candidates: int = 64) -> List[Trial]:
+        """
+        Tree-structured Parzen estimator, the simple version
+
+        Finished trials are split into "good" (top quarter) and "bad". New
+        candidates are drawn around good trials and the one most likely to
+        be good rather than bad is kept.
+        """
+        scored = sorted((t for t in self.trials if t.score is not None), key=lambda t: t.score, reverse=True)
+        if len(scored) < 8:
+            return self.propose_random(n)
+
+        points = np.array([[d.to_unit(t.params[d.name]) for d in self.dimensions] for t in scored])
+        n_good = max(2, int(len(scored) * good_fraction))
+        good, bad = points[:n_good], points[n_good:]
+        bandwidth = max(0.05, len(scored) ** (-1.0 / (len(self.dimensions) + 4)) * 0.3)
+        np_rng = np.random.default_rng(self.rng.randrange(2**32))
+
+        def density(x: np.ndarray, centers: np.ndarray) -> np.ndarray:
+            # Mean of Gaussian kernels, for all candidates at once: (candidates,)
+            sq = ((x[:, None, :] - centers[None, :, :]) / bandwidth) ** 2
+            return np.exp(-0.5 * sq.sum(axis=2)).mean(axis=1) + 1e-12
+
+        proposals = []
+        for _ in range(n):
+            centers = good[np_rng.integers(0, len(good), candidates)]
+            x = np.clip(centers + np_rng.normal(0.0, bandwidth, centers.shape), 0.0, 1.0)
+            best = int(np.argmax(np.log(density(x, good)) - np.log(density(x, bad))))
+            proposals.append(self.new_trial({d.name: d.from_unit(u) for d, u in zip(self.dimensions, x[best])}))
+        return proposals
+
+    # ----- running battles -----
+
+    def evaluate(self, trials: List[Trial], budget: int):
+        """Bring every trial up to ``budget`` battles per opponent, in parallel"""
+        seeds = range(budget)
+        failed = set()  # Not stored: a crash (server down, timeout) is tried again next time
+        jobs = [(trial, opponent, seed)
+                for trial in trials for opponent in self.opponents for seed in seeds
+                if self.store.lookup(trial.params, opponent, seed) is None]
+        self.store.hits += len(trials) * len(self.opponents) * budget - len(jobs)
+
+        if jobs:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = {
+                    pool.submit(run_trial, self.target, trial.params, opponent, seed, self.command): (trial, opponent, seed)
+                    for trial, opponent, seed in jobs
+                }
+                for future in as_completed(futures):
+                    trial, opponent, seed = futures[future]
+                    self.store.misses += 1
+                    try:
+                        score = future.result()
+                    except Exception as e:
+                        print(f"⚠️  Trial {trial.trial_id} failed vs {opponent} (seed {seed}): {e}")
+                        failed.add((trial.trial_id, opponent, seed))
+                        continue
+                    self.store.record(trial.params, opponent, seed, score)
+
+        for trial in trials:
+            scores = [float('-inf') if (trial.trial_id, opponent, seed) in failed
+                      else self.store.lookup(trial.params, opponent, seed)
+                      for opponent in self.opponents for seed in seeds]
+            trial.score = sum(scores) / len(scores)
+            trial.budget = budget
+
+    def successive_halving(self, trials: List[Trial]):
+        """Give everyone a small budget, then keep the best 1/eta with eta× more battles"""
+        survivors = trials
+        budget = self.min_budget
+        rung = 0
+        while True:
+            print(f"🎮 Rung {rung}: {len(survivors)} trials × {budget} battle(s) each")
+            self.evaluate(survivors, budget)
+            for trial in survivors:
+                trial.rung = rung
+
+            next_budget = budget * self.eta
+            keep = len(survivors) // self.eta
+            if keep < 1 or next_budget > self.max_budget:
+                break
+            survivors = sorted(survivors, key=lambda t: t.score, reverse=True)[:keep]
+            budget = next_budget
+            rung += 1
+
+    def run(self, strategy: str, n_trials: int, brackets: int = 1, grid_points: int = 3) -> List[Trial]:
+        """
+        Run the sweep
+
+        Args:
+            strategy: 'grid', 'random' or 'bayes'
+            n_trials: Trials per bracket (ignored for grid)
+            brackets: Independent halving rounds (bayes learns from earlier ones)
+            grid_points: Values per continuous parameter for grid search
+        """
+        for bracket in range(1, brackets + 1):
+            print(f"\n🚀 Bracket {bracket}/{brackets} ({strategy})")
+            if strategy == 'grid':
+                trials = self.propose_grid(grid_points)
+            elif strategy == 'bayes':
+                trials = self.propose_bayes(n_trials)
+            else:
+                trials = self.propose_random(n_trials)
+            self.successive_halving(trials)
+            if strategy == 'grid':
+                break  # Another grid bracket would repeat the same trials
+        return self.ranked()
+
+    def ranked(self) -> List[Trial]:
+        """Trials that got the most battles first, best score first within a rung"""
+        return sorted((t for t in self.trials if t.score is not None),
+                      key=lambda t: (t.rung, t.score), reverse=True)
+
+    def print_results(self, top: int = 10):
+        """Print the ranked results table"""
+        ranked = self.ranked()[:top]
+        names = [d.name for d in self.dimensions]
+        widths = [max(len(n), 8) for n in names]
+
+        header = f"{'Rank':>4}  {'Trial':>5}  {'Rung':>4}  {'Battles':>7}  {'Score':>9}  " + \
+            "  ".join(f"{n:>{w}}" for n, w in zip(names, widths))
+        print("\n" + "=" * len(header))
+        print("🏆 SWEEP RESULTS")
+        print("=" * len(header))
+        print(header)
+        print("-" * len(header))
+        for rank, trial in enumerate(ranked, 1):
+            values = "  ".join(
+                f"{trial.params[n]:>{w}.4g}" if isinstance(trial.params[n], float) else f"{trial.params[n]!s:>{w}}"
+                for n, w in zip(names, widths)
+            )
+            battles = trial.budget * len(self.opponents)
+            print(f"{rank:>4}  {trial.trial_id:>5}  {trial.rung:>4}  {battles:>7}  {trial.score:>9.1f}  {values}")
+        print("=" * len(header))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parallel hyperparameter sweep for ML tanks')
+    parser.add_argument('target', choices=sorted(SEARCH_SPACES), help='What to tune')
+    parser.add_argument('--strategy', choices=['grid', 'random', 'bayes'], default='random')
+    parser.add_argument('--trials', type=int, default=27, help='Trials per bracket (random/bayes)')
+    parser.add_argument('--brackets', type=int, default=1, help='Successive-halving rounds to run')
+    parser.add_argument('--grid-points', type=int, default=3, help='Values per range for grid search')
+    parser.add_argument('--param', action='append', default=[],
+                        help='Search only these: name=low:high, name=log:low:high or name=a,b,c')
+    parser.add_argument('--opponent', action='append', default=None,
+                        help='Opponent name(s) passed to the battle (default: simulated)')
+    parser.add_argument('--min-budget', type=int, default=1, help='Battles per opponent in the first rung')
+    parser.add_argument('--max-budget', type=int, default=9, help='Most battles per opponent for a trial')
+    parser.add_argument('--eta', type=int, default=3, help='Keep the best 1/eta each rung')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4, help='Parallel battles')
+    parser.add_argument('--command', default=None, help='Shell command that scores one trial')
+    parser.add_argument('--store', default=None, help='Evaluation log (default: <target>_sweep.jsonl)')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for proposals')
+    parser.add_argument('--top', type=int, default=10, help='Rows in the results table')
+    parser.add_argument('--output', default=None, help='Write ranked results to this JSON file')
+    parser.add_argument('--save-best', default=None,
+                        help='Write the best parameters here (e.g. ml_champion_best_params.json)')
+    args = parser.parse_args()
+    if args.target not in BUILTIN_BATTLES and not args.command:
+        parser.error(f"there is no built-in battle for {args.target} - pass --command to score trials")
+
+    space = dict(SEARCH_SPACES[args.target])
+    if args.param:
+        space = dict(parse_param(p) for p in args.param)
+
+    runner = SweepRunner(
+        target=args.target,
+        space=space,
+        opponents=args.opponent or ['simulated'],
+        store=FitnessStore(args.store or f"{args.target}_sweep.jsonl"),
+        workers=args.workers,
+        min_budget=args.min_budget,
+        max_budget=args.max_budget,
+        eta=args.eta,
+        command=args.command,
+        seed=args.seed
+    )
+
+    try:
+        runner.run(args.strategy, args.trials, args.brackets, args.grid_points)
+    except KeyboardInterrupt:
+        print("\n👋 Sweep stopped - showing results so far")
+
+    runner.print_results(args.top)
+    runner.store.print_statistics()
+
+    ranked = runner.ranked()
+    if args.output:
+        with open(args.output, 'w') as f:
+            # A trial with a failed battle scores -inf, which JSON can't store: write null
+            json.dump([{'trial': t.trial_id, 'rung': t.rung, 'budget': t.budget,
+                        'score': t.score if math.isfinite(t.score) else None, 'params': t.params}
+                       for t in ranked], f, indent=2)
+        print(f"💾 Saved results to {args.output}")
+    if args.save_best and ranked and not math.isfinite(ranked[0].score):
+        print(f"⚠️  Not saving {args.save_best}: even the best trial had failed battles")
+    elif args.save_best and ranked:
+        with open(args.save_best, 'w') as f:
+            json.dump(ranked[0].params, f, indent=2)
+        print(f"💾 Saved best parameters to {args.save_best}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 #!/bin/bash
 # Launch a bot and keep it running for the GUI
+# (Editing the bot? python scripts/dev_server.py <bot> reloads it between rounds instead)
 
 BOT_FILE="${1:-Samples/sitting_duck.py}"
 
@@ -3,15 +3,25 @@ Leaderboard Manager for Python Tank Wars
 
 Manages rankings, scores, and badges for submitted tanks.
 Generates shields.io badges for display.
+
+Tanks are ranked by their Glicko-2 rating (see rating_engine.py), not by
+their total score, so fighting more battles alone doesn't move a tank up.
+Every result is rated: against the tanks it fought when we know them, and
+otherwise against the field (a pretend opponent with the average rating),
+so all tanks are on the same scale.
 """
 
 import json
 import os
 from datetime import datetime
+from itertools import groupby
 from typing import Dict, List, Any
 from pathlib import Path
 import urllib.parse
 
+from rating_engine import (Rating, rate_match, update_rating, battle_place, field_score, field_rating,
+                           append_history)
+
 
 class LeaderboardManager:
     """
@@ -56,7 +66,54 @@ class LeaderboardManager:
         - author: author name
         - file: file path
         - battle_results: dict with wins, losses, damage, etc.
+
+        We don't know who the tank fought, so the result is rated against
+        the field (see _rate_against_field).
+        """
+        tank = self._apply_tank_data(tank_data)
+        if 'battle_results' in tank_data:
+            self._rate_against_field(tank, tank_data['battle_results'])
+
+        # Recalculate rankings
+        self.recalculate_rankings()
+
+        # Award badges
+        self.award_badges()
+
+        # Save
+        self.save_leaderboard()
+
+        return self.get_tank_info(tank_data['name'], tank_data['author'])
+
+    def add_battle_results(self, tank_results: List[Dict]):
+        """
+        Add many battle results at once (e.g. from recording_stats.py)
+
+        Same as calling add_or_update_tank for each entry, but rankings,
+        badges and the file are only updated once at the end.
+
+        Entries with the same 'match' key (e.g. recording and round) are
+        tanks that fought each other, and update each other's ratings.
+        Entries of one match must be next to each other in the list.
+        Entries without a match are rated against the field.
         """
+        for match, group in groupby(tank_results, key=lambda t: t.get('match')):
+            group = list(group)
+            tanks = [self._apply_tank_data(tank_data) for tank_data in group]
+            if match is not None and len(tanks) > 1:
+                places = [battle_place(t.get('battle_results', {})) for t in group]
+                self._rate_match(tanks, places)
+                continue
+            for tank, tank_data in zip(tanks, group):
+                if 'battle_results' in tank_data:
+                    self._rate_against_field(tank, tank_data['battle_results'])
+
+        self.recalculate_rankings()
+        self.award_badges()
+        self.save_leaderboard()
+
+    def _apply_tank_data(self, tank_data: Dict) -> Dict:
+        """Add or update one tank without re-ranking or saving; returns the tank"""
         name = tank_data['name']
         author = tank_data['author']
 
@@ -70,6 +127,7 @@ class LeaderboardManager:
         if existing:
             # Update existing tank
             self.update_tank_stats(existing, tank_data.get('battle_results', {}))
+            return existing
         else:
             # Add new tank
             new_tank = {
@@ -86,6 +144,8 @@ class LeaderboardManager:
                 "accuracy": 0.0,
                 "survival_rate": 0.0,
                 "avg_score_per_battle": 0.0,
+                **Rating().to_dict(),
+                "rating_history": [],
                 "badge": "rookie",
                 "achievements": [],
                 "first_battle": datetime.now().isoformat()
@@ -96,17 +156,21 @@ class LeaderboardManager:
 
             self.data['rankings'].append(new_tank)
             self.data['statistics']['total_tanks'] += 1
-
-        # Recalculate rankings
-        self.recalculate_rankings()
-
-        # Award badges
-        self.award_badges()
-
-        # Save
-        self.save_leaderboard()
-
-        return self.get_tank_info(name, author)
+            return new_tank
+
+    def _rate_match(self, tanks: List[Dict], places: List[int]):
+        """Update the ratings of tanks that fought in the same round"""
+        new_ratings = rate_match([Rating.from_dict(tank) for tank in tanks], places)
+        for tank, rating in zip(tanks, new_ratings):
+            tank.update(rating.to_dict())
+            append_history(tank.setdefault('rating_history', []), tank['battles_fought'], rating)
+
+    def _rate_against_field(self, tank: Dict, battle_results: Dict):
+        """Update a tank's rating after a battle against unknown opponents (the field's average)"""
+        field = field_rating([Rating.from_dict(other) for other in self.data['rankings'] if other is not tank])
+        rating = update_rating(Rating.from_dict(tank), [field], [field_score(battle_results)])
+        tank.update(rating.to_dict())
+        append_history(tank.setdefault('rating_history', []), tank['battles_fought'], rating)
 
     def update_tank_stats(self, tank: Dict, battle_results: Dict):
         """Update a tank's statistics from battle results"""
@@ -184,10 +248,10 @@ class LeaderboardManager:
         return max(0, score)  # Minimum score is 0
 
     def recalculate_rankings(self):
-        """Sort tanks by total score and assign ranks"""
-        # Sort by total score (descending)
+        """Sort tanks by conservative rating and assign ranks"""
+        # Sort by rating minus uncertainty (descending), then by total score
         self.data['rankings'].sort(
-            key=lambda x: (x['total_score'], x['wins'], -x['battles_fought']),
+            key=lambda x: (Rating.from_dict(x).conservative, x['total_score'], x['wins']),
             reverse=True
         )
 
@@ -287,6 +351,10 @@ class LeaderboardManager:
         score = tank.get('total_score', 0)
         badges['score'] = f"{base_url}/score-{score}-blue?style=for-the-badge&logo=star"
 
+        # Rating badge
+        rating = round(tank.get('rating', Rating().rating))
+        badges['rating'] = f"{base_url}/rating-{rating}-blueviolet?style=for-the-badge&logo=chess"
+
         # Achievement badge
         achievement = tank.get('badge', 'rookie')
         achievement_colors = {
@@ -307,8 +375,8 @@ class LeaderboardManager:
         md = "# 🏆 Leaderboard\n\n"
         md += f"*Last updated: {self.data['last_updated']}*\n\n"
 
-        md += "| Rank | Tank | Author | Score | W/L/T | Accuracy | Badge |\n"
-        md += "|------|------|--------|-------|-------|----------|-------|\n"
+        md += "| Rank | Tank | Author | Rating | Score | W/L/T | Accuracy | Badge |\n"
+        md += "|------|------|--------|--------|-------|-------|----------|-------|\n"
 
         for i, tank in enumerate(self.data['rankings'][:top_n], 1):
             # Medal emoji for top 3
@@ -323,6 +391,8 @@ class LeaderboardManager:
 
             name = tank['name']
             author = tank['author']
+            rating = Rating.from_dict(tank)
+            rating_display = f"{rating.rating:.0f} ±{2 * rating.rd:.0f}"
             score = tank['total_score']
             wlt = f"{tank['wins']}/{tank['losses']}/{tank['ties']}"
             accuracy = f"{int(tank['accuracy'] * 100)}%"
@@ -338,7 +408,7 @@ class LeaderboardManager:
             }
             badge = badge_emojis.get(tank.get('badge', 'rookie'), '🔰')
 
-            md += f"| {rank_display} | {name} | {author} | {score} | {wlt} | {accuracy} | {badge} |\n"
+            md += f"| {rank_display} | {name} | {author} | {rating_display} | {score} | {wlt} | {accuracy} | {badge} |\n"
 
         md += "\n## Badge Legend\n\n"
         md += "- 🔰 **Rookie**: First battle\n"
@@ -347,6 +417,7 @@ class LeaderboardManager:
         md += "- 🛡️ **Survivor**: 75%+ survival rate\n"
         md += "- 👑 **Champion**: #1 on leaderboard\n"
         md += "- 🏆 **Undefeated**: 5+ wins, 0 losses\n"
+        md += "\nTanks are ranked by rating minus the ± part, so a tank needs both good results and enough battles.\n"
 
         return md
 
@@ -369,6 +440,8 @@ class LeaderboardManager:
 
         md += "## Statistics\n\n"
         md += f"- **Rank**: #{tank['rank']}\n"
+        rating = Rating.from_dict(tank)
+        md += f"- **Rating**: {rating.rating:.0f} ±{2 * rating.rd:.0f}\n"
         md += f"- **Total Score**: {tank['total_score']}\n"
         md += f"- **Battles**: {tank['battles_fought']}\n"
         md += f"- **Record**: {tank['wins']}W - {tank['losses']}L - {tank['ties']}T\n"
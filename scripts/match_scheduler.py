@@ -0,0 +1,298 @@
+"""
+Adaptive Match Scheduler for Python Tank Wars
+
+A round-robin tournament plays every pairing the same number of times,
+even ones where everybody already knows the answer (champion_bot vs
+sitting_duck...). This scheduler picks the battles that teach us the most
+about the ranking, and stops as soon as the top of the table is settled.
+
+How it picks battles:
+- Every tank has a Glicko-2 rating with an uncertainty (see rating_engine.py)
+- A battle between two tanks is worth a lot when their result is hard to
+  guess (close ratings) and when we are still unsure about them
+- Tanks whose place in the top N is already clear get few battles; tanks
+  near the top-N borderline get most of them
+- Each batch is a set of different pairings (no tank plays twice at the
+  same time, like a Swiss tournament round), played in parallel
+
+When it stops:
+- As soon as every neighbouring pair in the top N (and the borderline
+  between places N and N+1) is in the right order with the chosen
+  confidence, or when the battle budget is used up
+
+The battles themselves are played by your own command, which gets the two
+tanks in MATCH_TANK1 and MATCH_TANK2 and must print the winner's name (or
+"draw") as the last line of its output. --demo plays pretend battles
+between tanks with hidden strengths instead, to see how it works.
+
+Usage:
+    python scripts/match_scheduler.py --demo 12 --top 3
+    python scripts/match_scheduler.py champion_bot rambo_bot spin_bot sitting_duck --command "python my_battle.py"
+    python scripts/match_scheduler.py --leaderboard data/leaderboard.json --command "python my_battle.py" --budget 200
+"""
+
+import os
+import sys
+import math
+import random
+import argparse
+import subprocess
+from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from rating_engine import GLICKO_SCALE, Rating, rate_match, game_information
+
+
+def win_probability(a: Rating, b: Rating) -> float:
+    """Chance that a's true rating is higher than b's"""
+    spread = math.hypot(a.rd, b.rd)
+    return 0.5 * (1 + math.erf((a.rating - b.rating) / (spread * math.sqrt(2))))
+
+
+def variance_reduction(a: Rating, b: Rating) -> float:
+    """How much one battle against b shrinks a's rating variance (Glicko-2 scale)"""
+    phi = a.rd / GLICKO_SCALE
+    return phi * phi - 1.0 / (1.0 / (phi * phi) + game_information(a, b))
+
+
+class AdaptiveScheduler:
+    """
+    Picks the most useful pairings and keeps the ratings up to date
+
+    Args:
+        ratings: Starting rating of every tank (new tanks start at 1500 ± 350)
+        top_n: How many places at the top of the table must be settled
+        confidence: How sure we must be about each neighbouring pair
+    """
+
+    def __init__(self, ratings: Dict[str, Rating], top_n: int = 3, confidence: float = 0.9):
+        self.ratings = dict(ratings)
+        self.top_n = min(top_n, len(ratings) - 1)
+        self.confidence = confidence
+        self.battles = 0
+        self.failed = 0      # Battles that crashed (they count against the budget, not the ratings)
+        self.pair_counts: Dict[Tuple[str, str], int] = {}
+
+    def standings(self) -> List[str]:
+        """Tank names, best rating first"""
+        return sorted(self.ratings, key=lambda name: self.ratings[name].rating, reverse=True)
+
+    def unsettled_pairs(self) -> List[Tuple[str, str, float]]:
+        """Neighbouring pairs in the top N (+ borderline) we are not yet sure about"""
+        order = self.standings()
+        pairs = []
+        for upper, lower in zip(order[:self.top_n], order[1:self.top_n + 1]):
+            p = win_probability(self.ratings[upper], self.ratings[lower])
+            if p < self.confidence:
+                pairs.append((upper, lower, p))
+        return pairs
+
+    def is_settled(self) -> bool:
+        return not self.unsettled_pairs()
+
+    def _relevance(self) -> Dict[str, float]:
+        """
+        How much each tank's rating still matters for the top N
+
+        A tank matters as much as the chance that it is in the wrong order
+        with one of the tanks around the top-N borderline. Tanks far below
+        (or clearly above) everyone else there hardly matter at all.
+        """
+        order = self.standings()
+        contested = order[:self.top_n + 1]
+        relevance = {}
+        for name in order:
+            rating = self.ratings[name]
+            doubt = sum(min(p, 1 - p) for p in
+                        (win_probability(rating, self.ratings[other]) for other in contested if other != name))
+            relevance[name] = doubt + 1e-3  # Nobody is ever completely ignored
+        return relevance
+
+    def pair_value(self, a: str, b: str, relevance: Dict[str, float]) -> float:
+        """Expected information from one battle between a and b"""
+        ra, rb = self.ratings[a], self.ratings[b]
+        return variance_reduction(ra, rb) * relevance[a] + variance_reduction(rb, ra) * relevance[b]
+
+    def next_pairings(self, count: int) -> List[Tuple[str, str]]:
+        """
+        Up to ``count`` pairings for the next batch, most useful first
+
+        No tank appears twice, so the whole batch can be played at the
+        same time.
+        """
+        relevance = self._relevance()
+        scored = sorted(((self.pair_value(a, b, relevance), a, b)
+                         for a, b in combinations(self.ratings, 2)), reverse=True)
+        busy = set()
+        pairings = []
+        for _, a, b in scored:
+            if a in busy or b in busy:
+                continue
+            pairings.append((a, b))
+            busy.update((a, b))
+            if len(pairings) == count:
+                break
+        return pairings
+
+    def record(self, a: str, b: str, winner: Optional[str]):
+        """Update both ratings after a battle (winner None means a draw)"""
+        places = [1, 1] if winner is None else [int(winner == a), int(winner == b)]
+        self.ratings[a], self.ratings[b] = rate_match([self.ratings[a], self.ratings[b]], places)
+        self.battles += 1
+        key = (a, b) if a < b else (b, a)
+        self.pair_counts[key] = self.pair_counts.get(key, 0) + 1
+
+    def run(self, play: Callable[[str, str], Optional[str]], budget: int, workers: int = 1,
+            verbose: bool = True) -> bool:
+        """
+        Schedule and play battles until the top N is settled or the budget is used
+
+        Args:
+            play: Plays one battle and returns the winner's name (or None for a draw);
+                must be a top-level function when workers > 1. If it raises, the
+                battle is reported and skipped - one broken battle doesn't end
+                the tournament
+            budget: Most battles to play (failed ones included)
+            workers: Battles played at the same time
+
+        Returns:
+            True if the top N was settled before the budget ran out
+        """
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            reported = None
+            while self.battles + self.failed < budget:
+                if self.is_settled():
+                    return True
+                pairings = self.next_pairings(min(max(1, workers), budget - self.battles - self.failed))
+                if pool:
+                    futures = [pool.submit(play, a, b) for a, b in pairings]
+                    results = [future.result for future in futures]
+                else:
+                    results = [lambda a=a, b=b: play(a, b) for a, b in pairings]
+                for (a, b), result in zip(pairings, results):
+                    try:
+                        winner = result()
+                    except Exception as e:
+                        print(f"⚠️  {a} vs {b} failed, skipping it: {type(e).__name__}: {e}")
+                        self.failed += 1
+                        continue
+                    self.record(a, b, winner)
+                left = len(self.unsettled_pairs())
+                if verbose and (left != reported or self.battles % 50 < len(pairings)):
+                    print(f"🎮 {self.battles:>4} battles - {left} unsettled pair(s) in the top {self.top_n}")
+                    reported = left
+            return self.is_settled()
+        finally:
+            if pool:
+                pool.shutdown()
+
+
+def command_battle(tank1: str, tank2: str, command: str) -> Optional[str]:
+    """Play one battle with the user's command; returns the winner (None for a draw)"""
+    env = dict(os.environ, MATCH_TANK1=tank1, MATCH_TANK2=tank2)
+    try:
+        result = subprocess.run(command, shell=True, env=env, capture_output=True, text=True, check=True)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"battle command exited with code {e.returncode}: {e.stderr.strip()[-200:]}") from None
+    lines = result.stdout.strip().splitlines()
+    if not lines:
+        raise RuntimeError("battle command printed nothing (it must print the winner last)")
+    winner = lines[-1].strip()
+    if winner.lower() == 'draw':
+        return None
+    if winner not in (tank1, tank2):
+        raise RuntimeError(f"battle command's last line must be {tank1}, {tank2} or draw, not {winner[:60]!r}")
+    return winner
+
+
+class _CommandBattle:
+    """Picklable wrapper so command battles can run in worker processes"""
+
+    def __init__(self, command: str):
+        self.command = command
+
+    def __call__(self, tank1: str, tank2: str) -> Optional[str]:
+        return command_battle(tank1, tank2, self.command)
+
+
+class _DemoBattle:
+    """Pretend battles between tanks with hidden strengths"""
+
+    def __init__(self, strengths: Dict[str, float], seed: int = 0):
+        self.strengths = strengths
+        self.rng = random.Random(seed)
+
+    def __call__(self, tank1: str, tank2: str) -> Optional[str]:
+        p = 1.0 / (1.0 + 10 ** ((self.strengths[tank2] - self.strengths[tank1]) / 400))
+        return tank1 if self.rng.random() < p else tank2
+
+
+def load_leaderboard_ratings(path: str) -> Dict[str, Rating]:
+    """Starting ratings of every tank on a leaderboard"""
+    from leaderboard_manager import LeaderboardManager
+    manager = LeaderboardManager(path)
+    return {tank['name']: Rating.from_dict(tank) for tank in manager.data['rankings']}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Adaptive tournament: play the most useful battles first')
+    parser.add_argument('tanks', nargs='*', help='Tank names')
+    parser.add_argument('--leaderboard', default=None, help='Start from the ratings on this leaderboard')
+    parser.add_argument('--command', default=None,
+                        help='Command that plays one battle (gets MATCH_TANK1/MATCH_TANK2, prints the winner)')
+    parser.add_argument('--demo', type=int, default=0, metavar='TANKS',
+                        help='Pretend tournament with this many tanks of hidden strength')
+    parser.add_argument('--top', type=int, default=3, help='Places at the top that must be settled')
+    parser.add_argument('--confidence', type=float, default=0.9, help='How sure each neighbouring pair must be')
+    parser.add_argument('--budget', type=int, default=500, help='Most battles to play')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help='Battles played at the same time')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    ratings: Dict[str, Rating] = {}
+    if args.leaderboard:
+        ratings.update(load_leaderboard_ratings(args.leaderboard))
+    for name in args.tanks:
+        ratings.setdefault(name, Rating())
+
+    if args.demo:
+        rng = random.Random(args.seed)
+        strengths = {f"tank_{i:02d}": rng.gauss(1500, 200) for i in range(args.demo)}
+        ratings = {name: Rating() for name in strengths}
+        play = _DemoBattle(strengths, args.seed)
+        workers = 1  # Demo battles are instant
+    elif args.command:
+        play = _CommandBattle(args.command)
+        workers = args.workers
+    else:
+        print("❌ Give a --command that plays a battle, or try --demo 12")
+        sys.exit(1)
+
+    if len(ratings) < 2:
+        print("❌ Need at least two tanks")
+        sys.exit(1)
+
+    scheduler = AdaptiveScheduler(ratings, args.top, args.confidence)
+    round_robin = len(ratings) * (len(ratings) - 1) // 2
+    print(f"🚀 {len(ratings)} tanks, top {scheduler.top_n} must be {args.confidence:.0%} sure, "
+          f"budget {args.budget} battles (one round-robin = {round_robin} battles)\n")
+
+    settled = scheduler.run(play, args.budget, workers)
+
+    print(f"\n{'✅ Top ' + str(scheduler.top_n) + ' settled' if settled else '⚠️  Budget used up'} "
+          f"after {scheduler.battles} battles"
+          f"{f' ({scheduler.failed} failed and skipped)' if scheduler.failed else ''}\n")
+    print(f"{'Place':<6} {'Tank':<24} {'Rating':>14} {'Battles':>8}")
+    for place, name in enumerate(scheduler.standings(), 1):
+        rating = scheduler.ratings[name]
+        battles = sum(n for pair, n in scheduler.pair_counts.items() if name in pair)
+        line = f"{place:<6} {name[:24]:<24} {rating.rating:>7.0f} ±{2 * rating.rd:<5.0f} {battles:>8}"
+        if args.demo:
+            line += f"   (hidden strength {strengths[name]:.0f})"
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
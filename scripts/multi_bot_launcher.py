@@ -0,0 +1,280 @@
+"""
+Multi-Bot Launcher for Python Tank Wars (Robocode Tank Royale)
+
+Every bot folder has a .sh / .cmd file that starts its own Python. A
+10-tank melee then means 10 Pythons, each loading numpy and the bot API
+again: seconds of waiting and hundreds of MB of memory. This launcher
+starts all the tanks in ONE Python instead.
+
+How it works:
+- Bot files are imported once each; numpy and the bot API are shared
+- Every tank runs as its own asyncio task in one event loop (bot APIs with
+  a blocking start() get a thread each instead, still in the same Python)
+- Team files (like the Week 9 teams) start every team member
+- If one tank crashes, only that tank stops (or restarts with --restart);
+  the others keep fighting
+
+Bot specs:
+    Samples/Corners                      a bot folder (uses Corners.py + Corners.json)
+    Samples/Corners/Corners.py           a bot file
+    .../swarm_team/swarm_team.py         a team file: starts every member
+    .../swarm_team/swarm_team.py:SwarmLeader   just one class from a file
+    Samples/Target*5                     five copies of the same bot
+
+Tank Royale reads a bot's team id from the TEAM_ID environment variable,
+which all tanks in one launcher share. Start one launcher per team when
+the server needs to know who is on which team.
+
+Usage:
+    python scripts/multi_bot_launcher.py Samples/Corners Samples/Crazy Samples/SpinBot
+    python scripts/multi_bot_launcher.py Tutorials/Week9_TeamBattles/swarm_team/swarm_team.py Samples/Target*3
+    python scripts/multi_bot_launcher.py Samples/* --check      # Load everything, don't connect
+    python scripts/multi_bot_launcher.py Samples/Crazy --profile   # Print turn timings after each round
+    python scripts/multi_bot_launcher.py Samples/Crazy --memory    # Print each tank's memory after each round
+"""
+
+import os
+import sys
+import time
+import asyncio
+import inspect
+import argparse
+import traceback
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass
+class BotSpec:
+    """One tank to start"""
+    label: str
+    bot_class: type
+    bot_info: object   # BotInfo, or None to let the bot find its own .json
+    folder: Path       # Where the bot file lives
+
+    def create(self):
+        """
+        Create the tank
+
+        Bots whose __init__ takes no bot_info look for <ClassName>.json in
+        the current folder, so they are created from inside their own folder.
+        """
+        if self.bot_info is not None and 'bot_info' in inspect.signature(self.bot_class).parameters:
+            return self.bot_class(bot_info=self.bot_info)
+        here = os.getcwd()
+        os.chdir(self.folder)
+        try:
+            return self.bot_class()
+        finally:
+            os.chdir(here)
+
+
+def _memory_mb() -> float:
+    """Peak memory of this process in MB"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def parse_spec(text: str) -> Tuple[Path, Optional[str], int]:
+    """Split 'path[:Class][*copies]' into its parts"""
+    copies = 1
+    if '*' in text:
+        text, _, count = text.rpartition('*')
+        copies = int(count)
+    path, class_name = text, None
+    head, sep, tail = text.rpartition(':')
+    if sep and tail.isidentifier() and len(head) > 1:  # Not a Windows drive letter
+        path, class_name = head, tail
+    path = Path(path)
+    if path.is_dir():
+        folder = path
+        path = folder / f"{folder.name}.py"
+        if not path.exists():
+            # e.g. rambo_bot/rambo.py: the one bot file that has a .json next to it
+            bot_files = [p for p in sorted(folder.glob('*.py')) if p.with_suffix('.json').exists()]
+            if len(bot_files) == 1:
+                path = bot_files[0]
+    return path, class_name, copies
+
+
+class BotLoader:
+    """Imports bot files once and finds the tank classes in them"""
+
+    def __init__(self):
+        from robocode_tank_royale.bot_api import BaseBot, BotInfo
+        self.base_class = BaseBot
+        self.bot_info_class = BotInfo
+        self.modules: Dict[Path, ModuleType] = {}
+
+    def load_module(self, path: Path) -> ModuleType:
+        path = path.resolve()
+        if path not in self.modules:
+            # A unique name per file, so two bots both called "tank.py" don't replace each other
+            name = f"launched_{path.stem}_{len(self.modules)}"
+            sys.path.insert(0, str(path.parent))  # For helper modules next to the bot
+            spec = importlib.util.spec_from_file_location(name, path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            spec.loader.exec_module(module)
+            self.modules[path] = module
+        return self.modules[path]
+
+    def bot_classes(self, module: ModuleType) -> List[type]:
+        """
+        Tank classes defined in a module
+
+        Classes that other tank classes in the module build on (like
+        SwarmBot under SwarmLeader/SwarmFollower1/SwarmFollower2) are
+        skipped, so a team file gives exactly its team members.
+        """
+        found = [item for item in vars(module).values()
+                 if isinstance(item, type) and issubclass(item, self.base_class)
+                 and item.__module__ == module.__name__ and not item.__name__.startswith('_')]
+        return [cls for cls in found if not any(other is not cls and issubclass(other, cls) for other in found)]
+
+    def bot_info(self, path: Path):
+        json_file = path.with_suffix('.json')
+        if json_file.exists():
+            return self.bot_info_class.from_file(str(json_file))
+        return None
+
+    def specs(self, text: str) -> List[BotSpec]:
+        path, class_name, copies = parse_spec(text)
+        if not path.exists():
+            raise FileNotFoundError(f"No bot file at {path}")
+        if path.suffix != '.py':
+            raise ValueError(f"{path.name} is not a Python file")
+        module = self.load_module(path)
+        classes = self.bot_classes(module)
+        if class_name:
+            classes = [cls for cls in classes if cls.__name__ == class_name] or [getattr(module, class_name)]
+        if not classes:
+            raise ValueError(f"No tank class (a Bot subclass) in {path.name}")
+        info = self.bot_info(path)
+        return [BotSpec(f"{cls.__name__}" + (f" #{n}" if copies > 1 else ""), cls, info, path.resolve().parent)
+                for cls in classes for n in range(1, copies + 1)]
+
+
+async def host_bot(spec: BotSpec, restart: bool, restart_delay: float = 2.0,
+                   bot: object = None) -> Optional[BaseException]:
+    """
+    Run one tank until its game ends
+
+    Anything the tank raises is caught here, so it never stops the other
+    tanks. Returns the last error (or None if the tank finished normally).
+    A tank that was already created can be passed in as ``bot``.
+    """
+    while True:
+        try:
+            if bot is None:
+                bot = spec.create()
+            if inspect.iscoroutinefunction(bot.start):
+                await bot.start()
+            else:
+                # Newer bot APIs block in start() and run their own network thread
+                await asyncio.to_thread(bot.start)
+            print(f"🏁 {spec.label} finished")
+            return None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"💥 {spec.label} crashed: {type(e).__name__}: {e}")
+            traceback.print_exc(limit=3)
+            if not restart:
+                return e
+            print(f"🔁 Restarting {spec.label} in {restart_delay:.0f}s")
+            bot = None
+            await asyncio.sleep(restart_delay)
+
+
+async def host_all(specs: List[BotSpec], restart: bool,
+                   bots: Optional[List[object]] = None) -> List[Optional[BaseException]]:
+    # Enough threads for every tank whose start() blocks, so none waits for another to finish
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=len(specs)))
+    bots = bots or [None] * len(specs)
+    return await asyncio.gather(*(host_bot(spec, restart, bot=bot) for spec, bot in zip(specs, bots)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run many tanks in one Python process')
+    parser.add_argument('bots', nargs='+', help='Bot folders or files (file.py:Class and NAME*3 work too)')
+    parser.add_argument('--server-url', default=None, help='Server to connect to (default: ws://localhost:7654)')
+    parser.add_argument('--secret', default=None, help='Server secret for bots')
+    parser.add_argument('--restart', action='store_true', help='Restart tanks that crash')
+    parser.add_argument('--check', action='store_true', help="Load and create every tank but don't connect")
+    parser.add_argument('--profile', action='store_true',
+                        help='Time every turn and event handler, print a table after each round')
+    parser.add_argument('--memory', action='store_true',
+                        help="Print each tank's live memory (tracemalloc) after each round")
+    args = parser.parse_args()
+
+    if args.server_url:
+        os.environ['SERVER_URL'] = args.server_url
+    if args.secret:
+        os.environ['SERVER_SECRET'] = args.secret
+
+    started = time.perf_counter()
+    try:
+        loader = BotLoader()
+    except ImportError:
+        print("❌ robocode-tank-royale is not installed: pip install -r requirements.txt")
+        sys.exit(1)
+
+    specs: List[BotSpec] = []
+    for text in args.bots:
+        try:
+            specs.extend(loader.specs(text))
+        except Exception as e:
+            print(f"⚠️  Skipping {text}: {type(e).__name__}: {e}")
+
+    if not specs:
+        print("❌ No tanks to start")
+        sys.exit(1)
+
+    if args.profile or args.memory:
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        from tank_utils import profile_turns, report_memory
+        watched = {}  # Copies of one tank share a wrapped class (and one memory report)
+        for spec in specs:
+            if spec.bot_class not in watched:
+                bot_class = spec.bot_class
+                if args.memory:
+                    bot_class = report_memory(bot_class)
+                if args.profile:
+                    bot_class = profile_turns(bot_class)
+                watched[spec.bot_class] = bot_class
+            spec.bot_class = watched[spec.bot_class]
+
+    if args.check:
+        for spec in specs:
+            try:
+                spec.create()
+                print(f"✅ {spec.label}")
+            except Exception as e:
+                print(f"❌ {spec.label}: {type(e).__name__}: {e}")
+
+    print(f"\n🚀 {len(specs)} tank(s) from {len(loader.modules)} file(s) ready in "
+          f"{time.perf_counter() - started:.2f}s, {_memory_mb():.0f} MB for all of them")
+    if args.check:
+        return
+
+    try:
+        errors = asyncio.run(host_all(specs, args.restart))
+    except KeyboardInterrupt:
+        print("\n👋 Stopped all tanks")
+        return
+    crashed = [spec.label for spec, error in zip(specs, errors) if error is not None]
+    if crashed:
+        print(f"⚠️  Crashed: {', '.join(crashed)}")
+
+
+if __name__ == '__main__':
+    main()
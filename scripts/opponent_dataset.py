@@ -0,0 +1,253 @@
+"""
+Opponent Modelling Dataset Builder for Python Tank Wars
+
+Learning tanks normally start every battle knowing nothing about their
+enemies. But the recordings folder already holds thousands of turns of
+real enemies driving and shooting! This tool turns those recordings into
+a training dataset: for every bot on every turn, "what did the bot see"
+(features) and "what did it do next" (targets).
+
+Features (from the bot's own point of view, nearest enemy = its target):
+    x, y, wall_distance, direction, speed, turn_rate, gun_heat, energy,
+    gun_bearing, enemy_distance, enemy_bearing, enemy_heading, enemy_speed,
+    enemy_energy, enemy_count
+
+Targets (what the bot did on the next turn):
+    acceleration, next_turn_rate, next_gun_turn, fired, fire_power
+    movement: 0-8 = (slow down / keep speed / speed up) × (left / straight / right)
+
+All angles are in degrees between -180 and 180, relative to the bot's own
+heading (bearings) or to the line between the two tanks (enemy_heading).
+
+How it stays fast and small:
+- Each recording is streamed once and only the previous turn is kept
+- Several recordings are processed at the same time
+- Rows are float32 / uint8 NumPy arrays saved in one compressed .npz file
+
+Usage:
+    python scripts/opponent_dataset.py recordings/ --output datasets/opponents.npz
+    python scripts/opponent_dataset.py recordings/ --bot 2=Rambo --only 2 --output datasets/rambo.npz
+
+    # Later, e.g. to pre-train a tank
+    from opponent_dataset import load_dataset
+    data = load_dataset("datasets/opponents.npz")
+    X, fired = data['features'], data['targets'][:, 3]
+"""
+
+import os
+import sys
+import math
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from recording_reader import ARENA_WIDTH, ARENA_HEIGHT, TICK_EVENT, find_recordings, iter_messages
+from recording_stats import parse_bot_names
+
+FEATURE_NAMES = (
+    'x', 'y', 'wall_distance', 'direction', 'speed', 'turn_rate', 'gun_heat', 'energy',
+    'gun_bearing', 'enemy_distance', 'enemy_bearing', 'enemy_heading', 'enemy_speed',
+    'enemy_energy', 'enemy_count',
+)
+TARGET_NAMES = ('acceleration', 'next_turn_rate', 'next_gun_turn', 'fired', 'fire_power')
+MOVEMENT_NAMES = tuple(f"{speed} {turn}" for speed in ('slow down', 'keep speed', 'speed up')
+                       for turn in ('left', 'straight', 'right'))
+
+SPEED_DEADBAND = 0.1   # Speed changes smaller than this count as "keep speed"
+TURN_DEADBAND = 0.5    # Turn rates smaller than this (degrees) count as "straight"
+
+
+def _angle(degrees: float) -> float:
+    """Normalize an angle to -180..180"""
+    return (degrees + 180.0) % 360.0 - 180.0
+
+
+def _sign(value: float, deadband: float) -> int:
+    return 0 if value < -deadband else (2 if value > deadband else 1)
+
+
+def bot_features(bot: Dict, enemies: List[Dict]) -> Optional[List[float]]:
+    """Feature row for one bot, or None if no enemy is alive"""
+    if not enemies:
+        return None
+    x, y = bot['x'], bot['y']
+    enemy = min(enemies, key=lambda e: (e['x'] - x) ** 2 + (e['y'] - y) ** 2)
+    dx, dy = enemy['x'] - x, enemy['y'] - y
+    line = math.degrees(math.atan2(dy, dx))
+    return [
+        x, y,
+        min(x, y, ARENA_WIDTH - x, ARENA_HEIGHT - y),
+        bot['direction'],
+        bot['speed'],
+        bot['turnRate'],
+        bot['gunHeat'],
+        bot['energy'],
+        _angle(bot['gunDirection'] - bot['direction']),
+        math.hypot(dx, dy),
+        _angle(line - bot['direction']),
+        _angle(enemy['direction'] - line),
+        enemy['speed'],
+        enemy['energy'],
+        len(enemies),
+    ]
+
+
+def extract_recording(path: str, only: Optional[List[int]] = None) -> Dict[str, np.ndarray]:
+    """
+    One streaming pass over a recording
+
+    Every bot that is alive on two turns in a row gives one row: features
+    from the first turn, targets from what changed on the second.
+
+    Args:
+        path: Recording file
+        only: Bot ids to keep (default: every bot)
+    """
+    features: List[List[float]] = []
+    targets: List[List[float]] = []
+    movement: List[int] = []
+    keys: List[List[int]] = []    # bot id, round, turn
+
+    previous: Dict[int, Dict] = {}
+    previous_features: Dict[int, List[float]] = {}
+    previous_round = previous_turn = None
+
+    for message in iter_messages(path):
+        if message.get('type') != TICK_EVENT:
+            continue
+        round_number = message.get('roundNumber', 1)
+        turn = message.get('turnNumber', 0)
+        if round_number != previous_round:
+            previous, previous_features = {}, {}
+            previous_round = round_number
+
+        fired = {}
+        for event in message.get('events', []):
+            if event.get('type') == 'BulletFiredEvent':
+                bullet = event['bullet']
+                fired[bullet['ownerId']] = bullet['power']
+
+        bots = {bot['id']: bot for bot in message.get('botStates', [])}
+        for bot_id, bot in bots.items():
+            before = previous.get(bot_id)
+            row = previous_features.get(bot_id)
+            if before is None or row is None:
+                continue
+            acceleration = bot['speed'] - before['speed']
+            turn_rate = bot['turnRate']
+            features.append(row)
+            targets.append([acceleration, turn_rate, bot['gunTurnRate'],
+                            float(bot_id in fired), fired.get(bot_id, 0.0)])
+            movement.append(_sign(acceleration, SPEED_DEADBAND) * 3 + _sign(-turn_rate, TURN_DEADBAND))
+            keys.append([bot_id, round_number, previous_turn])
+
+        previous, previous_turn = bots, turn
+        previous_features = {}
+        for bot_id, bot in bots.items():
+            if only and bot_id not in only:
+                continue
+            enemies = [other for other_id, other in bots.items() if other_id != bot_id]
+            row = bot_features(bot, enemies)
+            if row is not None:
+                previous_features[bot_id] = row
+
+    return {
+        'features': np.asarray(features, dtype=np.float32).reshape(-1, len(FEATURE_NAMES)),
+        'targets': np.asarray(targets, dtype=np.float32).reshape(-1, len(TARGET_NAMES)),
+        'movement': np.asarray(movement, dtype=np.uint8),
+        'keys': np.asarray(keys, dtype=np.int32).reshape(-1, 3),
+    }
+
+
+def _extract(job) -> Dict[str, np.ndarray]:
+    return extract_recording(*job)
+
+
+def build_dataset(paths: List[Path], only: Optional[List[int]] = None, workers: int = 1) -> Dict[str, np.ndarray]:
+    """Extract every recording (several at a time) into one set of arrays"""
+    jobs = [(str(path), only) for path in paths]
+    if workers <= 1 or len(paths) <= 1:
+        parts = [_extract(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_extract, jobs))
+
+    dataset = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+    dataset['recording'] = np.concatenate([np.full(len(part['movement']), i, dtype=np.uint16)
+                                           for i, part in enumerate(parts)])
+    return dataset
+
+
+def save_dataset(path: str, dataset: Dict[str, np.ndarray], recordings: List[Path], names: Dict[int, str]):
+    """Save the arrays plus column names in one compressed .npz file"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(
+        path,
+        **dataset,
+        feature_names=np.array(FEATURE_NAMES),
+        target_names=np.array(TARGET_NAMES),
+        movement_names=np.array(MOVEMENT_NAMES),
+        recordings=np.array([p.name for p in recordings]),
+        bot_names=np.array([f"{bot_id}={name}" for bot_id, name in sorted(names.items())]),
+    )
+
+
+def load_dataset(path: str) -> Dict[str, np.ndarray]:
+    """
+    Load a dataset saved by this tool
+
+    Returns:
+        features (rows × 15), targets (rows × 5), movement (rows),
+        keys (rows × [bot id, round, turn]), recording (rows, index into
+        'recordings'), plus the column name arrays
+    """
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build an opponent modelling dataset from battle recordings')
+    parser.add_argument('recordings', nargs='*', default=['recordings'],
+                        help='Recording files or folders (default: recordings/)')
+    parser.add_argument('--output', default='datasets/opponents.npz', help='Where to save the dataset')
+    parser.add_argument('--bot', action='append', default=[],
+                        help='Name a bot id: ID=Name (e.g. 2=Rambo)')
+    parser.add_argument('--only', type=int, action='append', default=None,
+                        help='Only keep rows for this bot id (can be repeated)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2,
+                        help='Recordings processed at the same time')
+    args = parser.parse_args()
+
+    paths = find_recordings(args.recordings)
+    if not paths:
+        print("❌ No recordings found")
+        sys.exit(1)
+
+    names = {bot_id: name for bot_id, (name, _) in parse_bot_names(args.bot).items()}
+    print(f"📂 Reading {len(paths)} recording(s) with {min(args.workers, len(paths))} worker(s)")
+    dataset = build_dataset(paths, args.only, args.workers)
+    rows = len(dataset['movement'])
+    if not rows:
+        print("❌ No rows found - are there ticks with at least two tanks?")
+        sys.exit(1)
+
+    save_dataset(args.output, dataset, paths, names)
+    size = os.path.getsize(args.output)
+    print(f"💾 Saved {rows} rows to {args.output} ({size / 1024:.0f} KB, {size / rows:.1f} bytes per row)\n")
+
+    print(f"{'Tank':<20} {'Rows':>8} {'Fires':>7} {'Avg power':>9}  Favourite move")
+    for bot_id in np.unique(dataset['keys'][:, 0]):
+        mask = dataset['keys'][:, 0] == bot_id
+        targets = dataset['targets'][mask]
+        shots = targets[:, 3] > 0
+        favourite = MOVEMENT_NAMES[np.bincount(dataset['movement'][mask], minlength=9).argmax()]
+        power = targets[shots, 4].mean() if shots.any() else 0.0
+        print(f"{names.get(int(bot_id), f'Bot {bot_id}')[:20]:<20} {int(mask.sum()):>8} "
+              f"{shots.mean():>7.1%} {power:>9.2f}  {favourite}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+"""
+Rating Engine for Python Tank Wars
+
+Adding up points rewards tanks that simply fought more battles. A rating
+instead estimates how strong a tank is, and how sure we are about it.
+This module uses Glicko-2 (the system used by many chess sites):
+
+- rating: the strength estimate (everyone starts at 1500)
+- rd ("rating deviation"): how unsure we are; starts at 350 and shrinks
+  with every battle
+- volatility: how much the tank's results jump around
+
+Rankings use the "conservative" rating, rating - 2 × rd, so a tank needs
+both good results and enough battles to be sure about them. Strong tanks
+rise to the top after a handful of battles instead of dozens.
+
+Melee battles (more than two tanks) count as a game against every other
+tank in the round: the winner beat everyone, survivors beat the tanks that
+died, and tanks with the same result tie. Updating a tank only needs its
+own rating and its opponents' ratings, never the battle history.
+
+Usage:
+    from rating_engine import Rating, rate_match
+
+    ratings = [Rating(), Rating(), Rating()]
+    ratings = rate_match(ratings, places=[2, 1, 0])   # Higher place = better result
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+GLICKO_SCALE = 173.7178   # Converts between the Glicko and Glicko-2 scales
+DEFAULT_RATING = 1500.0
+DEFAULT_RD = 350.0
+DEFAULT_VOLATILITY = 0.06
+TAU = 0.5                 # How fast volatility may change (0.3 - 1.2)
+MIN_RD = 30.0             # Never become completely certain
+HISTORY_POINTS = 64       # Most rating history points kept per tank
+
+
+@dataclass
+class Rating:
+    """A tank's Glicko-2 rating"""
+    rating: float = DEFAULT_RATING
+    rd: float = DEFAULT_RD
+    volatility: float = DEFAULT_VOLATILITY
+
+    @property
+    def conservative(self) -> float:
+        """Rating we are ~95% sure the tank is at least as good as"""
+        return self.rating - 2 * self.rd
+
+    def to_dict(self) -> Dict[str, float]:
+        return {'rating': round(self.rating, 2), 'rating_deviation': round(self.rd, 2),
+                'volatility': round(self.volatility, 6)}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Rating':
+        return cls(data.get('rating', DEFAULT_RATING),
+                   data.get('rating_deviation', DEFAULT_RD),
+                   data.get('volatility', DEFAULT_VOLATILITY))
+
+
+def _g(phi: float) -> float:
+    return 1.0 / math.sqrt(1.0 + 3.0 * phi * phi / (math.pi * math.pi))
+
+
+def expected_score(player: Rating, opponent: Rating) -> float:
+    """Chance of player beating opponent, as Glicko-2 sees it"""
+    g = _g(opponent.rd / GLICKO_SCALE)
+    return 1.0 / (1.0 + math.exp(-g * (player.rating - opponent.rating) / GLICKO_SCALE))
+
+
+def game_information(player: Rating, opponent: Rating) -> float:
+    """How much one game against opponent tells us about player (1 / v in the paper)"""
+    g = _g(opponent.rd / GLICKO_SCALE)
+    expected = expected_score(player, opponent)
+    return g * g * expected * (1 - expected)
+
+
+def _new_volatility(sigma: float, phi: float, v: float, delta: float, tau: float = TAU) -> float:
+    """Step 5 of the Glicko-2 paper (Illinois root finding)"""
+    a = math.log(sigma * sigma)
+
+    def f(x: float) -> float:
+        ex = math.exp(x)
+        return (ex * (delta * delta - phi * phi - v - ex) / (2 * (phi * phi + v + ex) ** 2)
+                - (x - a) / (tau * tau))
+
+    low = a
+    if delta * delta > phi * phi + v:
+        high = math.log(delta * delta - phi * phi - v)
+    else:
+        k = 1
+        while f(a - k * tau) < 0:
+            k += 1
+        high = a - k * tau
+
+    f_low, f_high = f(low), f(high)
+    for _ in range(100):
+        if abs(high - low) <= 1e-6:
+            break
+        new = low + (low - high) * f_low / (f_high - f_low)
+        f_new = f(new)
+        if f_new * f_high <= 0:
+            low, f_low = high, f_high
+        else:
+            f_low /= 2
+        high, f_high = new, f_new
+    return math.exp(low / 2)
+
+
+def update_rating(player: Rating, opponents: Sequence[Rating], scores: Sequence[float]) -> Rating:
+    """
+    One Glicko-2 update for a player after a set of games
+
+    Args:
+        player: Rating before the games
+        opponents: Rating of each opponent (before the games)
+        scores: 1 for a win, 0.5 for a tie, 0 for a loss against each opponent
+    """
+    mu = (player.rating - DEFAULT_RATING) / GLICKO_SCALE
+    phi = player.rd / GLICKO_SCALE
+    if not opponents:
+        phi_star = math.sqrt(phi * phi + player.volatility * player.volatility)
+        return Rating(player.rating, min(DEFAULT_RD, phi_star * GLICKO_SCALE), player.volatility)
+
+    v_inverse = 0.0
+    improvement = 0.0
+    for opponent, score in zip(opponents, scores):
+        v_inverse += game_information(player, opponent)
+        improvement += _g(opponent.rd / GLICKO_SCALE) * (score - expected_score(player, opponent))
+    v = 1.0 / v_inverse
+    delta = v * improvement
+
+    sigma = _new_volatility(player.volatility, phi, v, delta)
+    phi_star = math.sqrt(phi * phi + sigma * sigma)
+    new_phi = 1.0 / math.sqrt(1.0 / (phi_star * phi_star) + 1.0 / v)
+    new_mu = mu + new_phi * new_phi * improvement
+
+    return Rating(new_mu * GLICKO_SCALE + DEFAULT_RATING,
+                  max(MIN_RD, min(DEFAULT_RD, new_phi * GLICKO_SCALE)),
+                  sigma)
+
+
+def rate_match(ratings: Sequence[Rating], places: Sequence[float]) -> List[Rating]:
+    """
+    New ratings for everyone in one battle (2 or more tanks)
+
+    Args:
+        ratings: Each tank's rating before the battle
+        places: Each tank's result - higher is better, equal means a tie
+            (e.g. 2 = won, 1 = survived, 0 = destroyed)
+
+    Returns:
+        Each tank's rating after the battle, in the same order
+    """
+    updated = []
+    for i, player in enumerate(ratings):
+        opponents = [r for j, r in enumerate(ratings) if j != i]
+        scores = [1.0 if places[i] > places[j] else 0.5 if places[i] == places[j] else 0.0
+                  for j in range(len(ratings)) if j != i]
+        updated.append(update_rating(player, opponents, scores))
+    return updated
+
+
+def battle_place(battle_results: Dict) -> int:
+    """Place of a tank in its round from its battle_results: 2 = won, 1 = survived, 0 = destroyed"""
+    if battle_results.get('won'):
+        return 2
+    return 1 if battle_results.get('survived') else 0
+
+
+def field_score(battle_results: Dict) -> float:
+    """Result of a battle without known opponents, as a score against the field: 1 won, 0 lost, 0.5 else"""
+    if battle_results.get('won'):
+        return 1.0
+    return 0.0 if battle_results.get('lost') else 0.5
+
+
+def field_rating(ratings: Sequence[Rating]) -> Rating:
+    """
+    A pretend average opponent: the mean rating and mean uncertainty of a field of tanks
+
+    Used to rate a battle result when we don't know who the opponents were.
+    An empty field is a brand new tank (1500 ± 350).
+    """
+    if not ratings:
+        return Rating()
+    return Rating(sum(r.rating for r in ratings) / len(ratings),
+                  sum(r.rd for r in ratings) / len(ratings))
+
+
+def append_history(history: List[List[int]], battles: int, rating: Rating,
+                   max_points: int = HISTORY_POINTS):
+    """
+    Add a [battles fought, rating, rd] point to a rating history
+
+    When the history is full, every other older point is dropped, so it
+    stays small but still covers the tank's whole career (recent battles
+    in detail, early ones more coarsely).
+    """
+    history.append([battles, round(rating.rating), round(rating.rd)])
+    if len(history) > max_points:
+        history[:-1] = history[:-1:2]
@@ -0,0 +1,592 @@
+"""
+Seekable Index for .battle.gz Recordings
+
+A gzip file can normally only be read from the start: to get to round 7
+you have to decompress (and parse) every tick before it. This tool builds
+a small sidecar file next to each recording (game.battle.gz.idx) with
+"checkpoints" at the start of every round and every N turns. Each
+checkpoint remembers:
+
+- a bit position in the compressed file where decompression can restart
+  (a deflate block start, or a spot inside a block plus the bits of that
+  block's Huffman table header)
+- the last 32 KB of text before it, which is all the decompressor needs
+  to carry on from there
+
+With that, any turn can be reached by decompressing a few KB from the
+nearest checkpoint, and the original recording is never changed. This
+is the same trick as zlib's "zran" example and indexed_gzip.
+
+Python's zlib can't report where it is in the compressed bits, so the
+index is built with a small pure-Python inflater (it only runs once per
+recording). Seeking uses the normal zlib module.
+
+Usage:
+    python scripts/recording_index.py build recordings/
+    python scripts/recording_index.py info recordings/game-2025-12-16-00-53-39.battle.gz
+    python scripts/recording_index.py show recordings/game-2025-12-16-00-53-39.battle.gz --round 1 --turn 250
+
+    from recording_index import IndexedRecording
+    for message in IndexedRecording("recordings/game.battle.gz").iter_messages(round_number=7):
+        ...
+"""
+
+import os
+import sys
+import re
+import json
+import zlib
+import bisect
+import struct
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Tuple
+
+from recording_reader import TICK_EVENT, find_recordings
+
+INDEX_MAGIC = b"TKGZIX01"
+INDEX_SUFFIX = ".idx"
+WINDOW_SIZE = 32768   # Deflate never looks back further than this
+READ_CHUNK = 65536
+ACCESS_SPAN = 32768   # Output bytes between restart points inside a deflate block
+
+# Deflate tables (RFC 1951)
+LENGTH_BASE = [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 15, 17, 19, 23, 27, 31,
+               35, 43, 51, 59, 67, 83, 99, 115, 131, 163, 195, 227, 258]
+LENGTH_EXTRA = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2,
+                3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 5, 0]
+DIST_BASE = [1, 2, 3, 4, 5, 7, 9, 13, 17, 25, 33, 49, 65, 97, 129, 193, 257, 385, 513, 769,
+             1025, 1537, 2049, 3073, 4097, 6145, 8193, 12289, 16385, 24577]
+DIST_EXTRA = [0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8,
+              9, 9, 10, 10, 11, 11, 12, 12, 13, 13]
+CODE_LENGTH_ORDER = [16, 17, 18, 0, 8, 7, 9, 6, 10, 5, 11, 4, 12, 3, 13, 2, 14, 1, 15]
+
+
+def index_path(path) -> str:
+    """Where the sidecar index for a recording lives"""
+    return str(path) + INDEX_SUFFIX
+
+
+def _huffman_table(lengths: List[int]) -> Tuple[List[int], int]:
+    """
+    Lookup table for a canonical Huffman code
+
+    The table is indexed by the next ``max_len`` bits of input (deflate
+    packs codes starting from the lowest bit) and holds symbol << 4 | length.
+    """
+    max_len = max(lengths)
+    if max_len == 0:
+        return [0], 0
+    counts = [0] * (max_len + 1)
+    for length in lengths:
+        counts[length] += 1
+    counts[0] = 0
+    next_code = [0] * (max_len + 1)
+    code = 0
+    for bits in range(1, max_len + 1):
+        code = (code + counts[bits - 1]) << 1
+        next_code[bits] = code
+
+    table = [0] * (1 << max_len)
+    for symbol, length in enumerate(lengths):
+        if length:
+            code = next_code[length]
+            next_code[length] += 1
+            reversed_code = int(format(code, f'0{length}b')[::-1], 2)
+            for i in range(reversed_code, 1 << max_len, 1 << length):
+                table[i] = symbol << 4 | length
+    return table, max_len
+
+
+FIXED_LITERALS = _huffman_table([8] * 144 + [9] * 112 + [7] * 24 + [8] * 8)
+FIXED_DISTANCES = _huffman_table([5] * 30)
+
+
+def _gzip_header_size(data: bytes) -> int:
+    """Length of the gzip member header (where the deflate data starts)"""
+    if data[:3] != b"\x1f\x8b\x08":
+        raise ValueError("not a gzip file")
+    flags = data[3]
+    pos = 10
+    if flags & 4:   # FEXTRA
+        pos += 2 + (data[pos] | data[pos + 1] << 8)
+    if flags & 8:   # FNAME
+        pos = data.index(b"\0", pos) + 1
+    if flags & 16:  # FCOMMENT
+        pos = data.index(b"\0", pos) + 1
+    if flags & 2:   # FHCRC
+        pos += 2
+    return pos
+
+
+def inflate(data: bytes, start: int, span: int = ACCESS_SPAN) -> Iterator[Tuple[bytes, Optional[tuple]]]:
+    """
+    Decompress a raw deflate stream, pausing at access points
+
+    An access point is somewhere decompression can later be restarted:
+    the start of every deflate block, plus a spot about every ``span``
+    bytes of output inside a block. Restarting inside a block needs the
+    block's Huffman table header, so its bit range is part of the point.
+
+    Args:
+        data: The compressed file
+        start: Byte offset where the deflate stream starts
+        span: Output bytes between access points inside a block
+
+    Yields:
+        (output since the last access point, access point) where the point
+        is (bit offset, header start bit, header end bit) - the header bits
+        are None at a block start. The last item has no access point.
+    """
+    data = data + bytes(8)  # Padding so the bit buffer can always be topped up
+    pos, buf, nbits = start, 0, 0
+    out = bytearray()
+    emitted = 0
+    final = False
+
+    while not final:
+        block_bit = pos * 8 - nbits
+        yield bytes(out[emitted:]), (block_bit, None, None)
+        if len(out) > 4 * WINDOW_SIZE:
+            del out[:-WINDOW_SIZE]
+        emitted = len(out)
+
+        while nbits < 16:
+            buf |= data[pos] << nbits
+            pos += 1
+            nbits += 8
+        final = buf & 1
+        kind = (buf >> 1) & 3
+        buf >>= 3
+        nbits -= 3
+
+        if kind == 0:  # Stored block: skip to the byte boundary, then copy
+            pos -= nbits // 8
+            buf, nbits = 0, 0
+            length = data[pos] | data[pos + 1] << 8
+            pos += 4
+            out += data[pos:pos + length]
+            pos += length
+            continue
+
+        if kind == 1:
+            (lit_table, lit_bits), (dist_table, dist_bits) = FIXED_LITERALS, FIXED_DISTANCES
+        elif kind == 2:
+            while nbits < 14:
+                buf |= data[pos] << nbits
+                pos += 1
+                nbits += 8
+            n_lit = (buf & 31) + 257
+            n_dist = ((buf >> 5) & 31) + 1
+            n_code = ((buf >> 10) & 15) + 4
+            buf >>= 14
+            nbits -= 14
+
+            code_lengths = [0] * 19
+            for i in range(n_code):
+                while nbits < 3:
+                    buf |= data[pos] << nbits
+                    pos += 1
+                    nbits += 8
+                code_lengths[CODE_LENGTH_ORDER[i]] = buf & 7
+                buf >>= 3
+                nbits -= 3
+            cl_table, cl_bits = _huffman_table(code_lengths)
+
+            lengths: List[int] = []
+            while len(lengths) < n_lit + n_dist:
+                while nbits < 16:
+                    buf |= data[pos] << nbits
+                    pos += 1
+                    nbits += 8
+                entry = cl_table[buf & ((1 << cl_bits) - 1)]
+                buf >>= entry & 15
+                nbits -= entry & 15
+                symbol = entry >> 4
+                if symbol < 16:
+                    lengths.append(symbol)
+                elif symbol == 16:
+                    lengths.extend([lengths[-1]] * (3 + (buf & 3)))
+                    buf >>= 2
+                    nbits -= 2
+                elif symbol == 17:
+                    lengths.extend([0] * (3 + (buf & 7)))
+                    buf >>= 3
+                    nbits -= 3
+                else:
+                    lengths.extend([0] * (11 + (buf & 127)))
+                    buf >>= 7
+                    nbits -= 7
+            lit_table, lit_bits = _huffman_table(lengths[:n_lit])
+            dist_table, dist_bits = _huffman_table(lengths[n_lit:])
+        else:
+            raise ValueError(f"invalid deflate block type at bit {block_bit}")
+
+        header_end = pos * 8 - nbits
+        lit_mask = (1 << lit_bits) - 1
+        dist_mask = (1 << dist_bits) - 1
+        while True:
+            if len(out) - emitted >= span:
+                yield bytes(out[emitted:]), (pos * 8 - nbits, block_bit, header_end)
+                if len(out) > 4 * WINDOW_SIZE:
+                    del out[:-WINDOW_SIZE]
+                emitted = len(out)
+
+            while nbits < 48:  # Enough for a length code, a distance code and their extra bits
+                buf |= data[pos] << nbits
+                pos += 1
+                nbits += 8
+            entry = lit_table[buf & lit_mask]
+            code_len = entry & 15
+            if not code_len:
+                raise ValueError(f"corrupt deflate data in block at bit {block_bit}")
+            buf >>= code_len
+            nbits -= code_len
+            symbol = entry >> 4
+            if symbol < 256:
+                out.append(symbol)
+                continue
+            if symbol == 256:
+                break
+
+            symbol -= 257
+            extra = LENGTH_EXTRA[symbol]
+            length = LENGTH_BASE[symbol] + (buf & ((1 << extra) - 1))
+            buf >>= extra
+            nbits -= extra
+
+            entry = dist_table[buf & dist_mask]
+            buf >>= entry & 15
+            nbits -= entry & 15
+            symbol = entry >> 4
+            extra = DIST_EXTRA[symbol]
+            distance = DIST_BASE[symbol] + (buf & ((1 << extra) - 1))
+            buf >>= extra
+            nbits -= extra
+
+            copy_from = len(out) - distance
+            if length <= distance:
+                out += out[copy_from:copy_from + length]
+            else:  # Overlapping copy repeats the last `distance` bytes
+                out += (out[copy_from:] * (length // distance + 1))[:length]
+
+    yield bytes(out[emitted:]), None
+
+
+def build_index(path, every: int = 100, span: int = ACCESS_SPAN) -> str:
+    """
+    Write the sidecar index for one recording
+
+    Args:
+        path: A .battle.gz recording
+        every: Add a checkpoint at least every this many turns (plus one at every round start)
+        span: Most bytes that have to be decompressed and skipped to reach a checkpoint
+
+    Returns:
+        Path of the index file
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    # Checkpoint: [round, turn, bit, header start, header end, point output offset, line offset, window]
+    checkpoints: List[list] = []
+    windows: List[bytes] = []
+    points: List[Tuple[int, tuple, bytes]] = []  # Recent (output offset, access point, window)
+    window = b""
+    out_pos = 0
+    pending = b""
+    pending_start = 0
+    last_round, last_turn = None, 0
+
+    try:
+        for chunk, point in inflate(data, _gzip_header_size(data), span):
+            out_pos += len(chunk)
+            window = (window + chunk)[-WINDOW_SIZE:]
+
+            *lines, pending = (pending + chunk).split(b"\n")
+            line_start = pending_start
+            for line in lines:
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    message = {}
+                if message.get('type') == TICK_EVENT:
+                    round_number, turn = message.get('roundNumber'), message.get('turnNumber', 0)
+                    if round_number != last_round or turn >= last_turn + every:
+                        point_out, (bit, header_start, header_end), point_window = \
+                            next(p for p in reversed(points) if p[0] <= line_start)
+                        if not checkpoints or checkpoints[-1][2] != bit:
+                            windows.append(point_window)
+                        checkpoints.append([round_number, turn, bit, header_start, header_end,
+                                            point_out, line_start, len(windows) - 1])
+                        last_round, last_turn = round_number, turn
+                line_start += len(line) + 1
+            pending_start = line_start
+
+            if point is not None:
+                points.append((out_pos, point, window))
+            while len(points) > 1 and points[1][0] <= pending_start:
+                points.pop(0)
+    except (IndexError, ValueError):
+        pass  # Truncated recording: index what was there
+
+    stat = os.stat(path)
+    compressed = [zlib.compress(w, 6) for w in windows]
+    header = json.dumps({
+        'source_size': stat.st_size,
+        'source_mtime': stat.st_mtime_ns,
+        'every': every,
+        'checkpoints': checkpoints,
+        'windows': [len(w) for w in compressed],
+    }, separators=(',', ':')).encode()
+
+    output = index_path(path)
+    temp = output + ".tmp"
+    with open(temp, 'wb') as f:
+        f.write(INDEX_MAGIC + struct.pack("<I", len(header)) + header)
+        for w in compressed:
+            f.write(w)
+    os.replace(temp, output)  # Readers never see a half-written index
+    return output
+
+
+def _empty_blocks() -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    Bits of two deflate blocks that decompress to nothing: (value, bit count)
+
+    The fixed-Huffman one is 10 bits, the dynamic one 95 bits. Putting
+    some of them in front of resumed data lines its bits back up with the
+    byte boundaries of the original file (stored blocks depend on that).
+    """
+    def bits(value: int, n: int, reverse: bool = False):
+        nonlocal acc, length
+        if reverse:  # Huffman codes are packed starting from their top bit
+            value = int(format(value, f'0{n}b')[::-1], 2)
+        acc |= value << length
+        length += n
+
+    acc, length = 0, 0
+    bits(0, 1), bits(1, 2), bits(0, 7, True)                     # Fixed block, end-of-block code
+    fixed = (acc, length)
+
+    acc, length = 0, 0
+    bits(0, 1), bits(2, 2), bits(0, 5), bits(0, 5), bits(15, 4)  # Dynamic block, 257 + 1 codes, 19 lengths
+    code_lengths = {18: 1, 0: 2, 1: 2}
+    for symbol in CODE_LENGTH_ORDER:
+        bits(code_lengths.get(symbol, 0), 3)
+    bits(0, 1, True), bits(127, 7)                               # 138 zeros
+    bits(0, 1, True), bits(107, 7)                               # 118 zeros
+    bits(0b11, 2, True), bits(0b10, 2, True)                     # End-of-block gets length 1, one unused distance
+    bits(0, 1, True)                                             # End-of-block
+    return fixed, (acc, length)
+
+
+EMPTY_FIXED_BLOCK, EMPTY_DYNAMIC_BLOCK = _empty_blocks()
+
+
+TICK_HEAD = re.compile(rb'^\{"roundNumber":(\d+),')
+TICK_TAIL = re.compile(rb'"turnNumber":(\d+),"type":"TickEventForObserver"\}\s*$')
+
+
+def _tick_key(line: bytes) -> Optional[Tuple[int, int]]:
+    """(round, turn) of a tick line without parsing all of it (None if it doesn't look like one)"""
+    head = TICK_HEAD.match(line)
+    tail = TICK_TAIL.search(line, max(0, len(line) - 64))
+    if head and tail:
+        return int(head.group(1)), int(tail.group(1))
+    return None
+
+
+def _resume_stream(f, bit: int, header: Optional[Tuple[int, int]] = None) -> Iterator[bytes]:
+    """
+    Raw deflate data that restarts at an access point
+
+    Yields the file's bits from ``bit`` onwards. Inside a block, the
+    block's Huffman header bits go first so zlib sees an ordinary (if
+    shorter) deflate block. Empty blocks in front keep every later bit at
+    the same position within its byte as in the original file.
+    """
+    header_bits, header_len = 0, 0
+    if header:
+        header_start, header_end = header
+        header_len = header_end - header_start
+        f.seek(header_start // 8)
+        raw = f.read((header_end - header_start // 8 * 8 + 7) // 8)
+        header_bits = (int.from_bytes(raw, 'little') >> (header_start % 8)) & ((1 << header_len) - 1)
+
+    carry, carry_len = 0, 0
+    padding = (bit - header_len) % 8
+    if padding % 2:
+        carry, carry_len = EMPTY_DYNAMIC_BLOCK
+        padding = (padding - carry_len) % 8
+    for _ in range(padding // 2):  # Each fixed block moves things on by 10 bits, i.e. 2 within a byte
+        carry |= EMPTY_FIXED_BLOCK[0] << carry_len
+        carry_len += EMPTY_FIXED_BLOCK[1]
+    carry |= header_bits << carry_len
+    carry_len += header_len
+
+    f.seek(bit // 8)
+    skip = bit % 8
+    for chunk in iter(lambda: f.read(READ_CHUNK), b""):
+        value = int.from_bytes(chunk, 'little') >> skip
+        total = carry_len + 8 * len(chunk) - skip
+        skip = 0
+        value = carry | value << carry_len
+        whole = total // 8
+        yield (value & ((1 << (8 * whole)) - 1)).to_bytes(whole, 'little')
+        carry, carry_len = value >> (8 * whole), total - 8 * whole
+    if carry_len:
+        yield carry.to_bytes(1, 'little')
+
+
+class IndexedRecording:
+    """
+    A .battle.gz recording with a sidecar index
+
+    Raises FileNotFoundError if there is no index and ValueError if the
+    index belongs to a different version of the file (build it again).
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        with open(index_path(path), 'rb') as f:
+            if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                raise ValueError(f"{index_path(path)} is not a recording index")
+            header_len = struct.unpack("<I", f.read(4))[0]
+            header = json.loads(f.read(header_len))
+            self._window_data = f.read()
+
+        stat = os.stat(self.path)
+        if (header['source_size'], header['source_mtime']) != (stat.st_size, stat.st_mtime_ns):
+            raise ValueError(f"{index_path(path)} is out of date")
+
+        self.every: int = header['every']
+        self.checkpoints: List[list] = header['checkpoints']
+        self._keys = [(c[0], c[1]) for c in self.checkpoints]
+        self._window_offsets = [0]
+        for length in header['windows']:
+            self._window_offsets.append(self._window_offsets[-1] + length)
+
+    def _window(self, i: int) -> bytes:
+        return zlib.decompress(self._window_data[self._window_offsets[i]:self._window_offsets[i + 1]])
+
+    def iter_messages(self, round_number: int = 1, turn: int = 0) -> Iterator[dict]:
+        """
+        Yield messages from a round and turn to the end of the recording
+
+        Decompression starts at the nearest checkpoint at or before the
+        target, so only a few KB have to be read.
+        """
+        if not self.checkpoints:
+            return
+        i = max(0, bisect.bisect_right(self._keys, (round_number, turn)) - 1)
+        _, _, bit, header_start, header_end, point_out, line_start, window = self.checkpoints[i]
+        header = (header_start, header_end) if header_start is not None else None
+        skip = line_start - point_out
+
+        window_bytes = self._window(window)
+        if window_bytes:
+            decompressor = zlib.decompressobj(-15, zdict=window_bytes)
+        else:
+            decompressor = zlib.decompressobj(-15)
+
+        pending = b""
+        with open(self.path, 'rb') as f:
+            for chunk in _resume_stream(f, bit, header):
+                try:
+                    text = decompressor.decompress(chunk)
+                except zlib.error:
+                    return  # Truncated recording
+                if skip:
+                    dropped = min(skip, len(text))
+                    text = text[dropped:]
+                    skip -= dropped
+                *lines, pending = (pending + text).split(b"\n")
+                for line in lines:
+                    key = _tick_key(line)
+                    if key is not None and key < (round_number, turn):
+                        continue
+                    try:
+                        message = json.loads(line)
+                    except ValueError:
+                        return
+                    if message.get('type') == TICK_EVENT and \
+                            (message.get('roundNumber'), message.get('turnNumber', 0)) < (round_number, turn):
+                        continue
+                    yield message
+                if decompressor.eof:
+                    break
+
+    def tick(self, round_number: int, turn: int) -> Optional[dict]:
+        """One tick, or None if the recording doesn't have it"""
+        for message in self.iter_messages(round_number, turn):
+            if message.get('type') == TICK_EVENT:
+                if (message.get('roundNumber'), message.get('turnNumber')) == (round_number, turn):
+                    return message
+                return None
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Seekable sidecar indexes for .battle.gz recordings')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p = commands.add_parser('build', help='Build indexes (game.battle.gz -> game.battle.gz.idx)')
+    p.add_argument('recordings', nargs='*', default=['recordings'])
+    p.add_argument('--every', type=int, default=100, help='Checkpoint at least every N turns')
+    p.add_argument('--force', action='store_true', help='Rebuild indexes that are up to date')
+    p.add_argument('--workers', type=int, default=os.cpu_count() or 2)
+
+    p = commands.add_parser('info', help='Show the checkpoints of an indexed recording')
+    p.add_argument('file')
+
+    p = commands.add_parser('show', help='Print one tick as JSON')
+    p.add_argument('file')
+    p.add_argument('--round', type=int, default=1)
+    p.add_argument('--turn', type=int, required=True)
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        paths = [p for p in find_recordings(args.recordings) if p.name.endswith('.gz')]
+        if not args.force:
+            fresh = []
+            for path in paths:
+                try:
+                    IndexedRecording(path)
+                    fresh.append(path)
+                except (OSError, ValueError):
+                    pass
+            if fresh:
+                print(f"⏭️  {len(fresh)} index(es) already up to date (use --force to rebuild)")
+            paths = [p for p in paths if p not in fresh]
+        if not paths:
+            return
+
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = {pool.submit(build_index, str(path), args.every): path for path in paths}
+            for future in as_completed(futures):
+                try:
+                    output = future.result()
+                    print(f"✅ {output} ({os.path.getsize(output):,} bytes)")
+                except Exception as e:
+                    print(f"⚠️  {futures[future]}: {e}")
+
+    elif args.command == 'info':
+        recording = IndexedRecording(args.file)
+        print(f"📂 {args.file}: {len(recording.checkpoints)} checkpoints (every {recording.every} turns)")
+        for round_number, turn, bit, header_start, _, point_out, line_start, _ in recording.checkpoints:
+            where = "block start" if header_start is None else "inside a block"
+            print(f"   Round {round_number} turn {turn}: bit {bit} ({where}), "
+                  f"{line_start - point_out:,} bytes to skip")
+
+    elif args.command == 'show':
+        tick = IndexedRecording(args.file).tick(args.round, args.turn)
+        if tick is None:
+            print(f"❌ Round {args.round} turn {args.turn} is not in {args.file}")
+            sys.exit(1)
+        print(json.dumps(tick, indent=2))
+
+
+if __name__ == '__main__':
+    main()
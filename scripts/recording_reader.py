@@ -0,0 +1,123 @@
+"""
+Recording Reader for Python Tank Wars (Robocode Tank Royale)
+
+The Tank Royale recorder saves every game as a gzipped file with one JSON
+object per line. Most lines are "TickEventForObserver" messages holding
+every bot's state, every bullet, and the events of that turn:
+
+    {"roundNumber": 1, "turnNumber": 17, "type": "TickEventForObserver",
+     "botStates": [...], "bulletStates": [...], "events": [...]}
+
+This module streams those lines one at a time, so even a huge recording
+never has to fit in memory. The other recording tools in scripts/ are
+built on it.
+
+Usage:
+    from recording_reader import iter_ticks, iter_messages_from, find_recordings
+
+    for path in find_recordings(["recordings"]):
+        for tick in iter_ticks(path):
+            print(tick["turnNumber"], len(tick["botStates"]))
+
+    # Start at round 3 (fast if the recording has a sidecar index)
+    for message in iter_messages_from("recordings/game.battle.gz", round_number=3):
+        ...
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import IO, Iterable, Iterator, List
+
+# Default arena size (see game-setups.properties)
+ARENA_WIDTH = 800
+ARENA_HEIGHT = 600
+
+TICK_EVENT = "TickEventForObserver"
+
+
+class TruncatedRecording(Exception):
+    """The recording stops in the middle (the server was stopped while writing it)"""
+
+
+def open_recording(path) -> IO[str]:
+    """Open a recording as text, gzipped or not"""
+    path = str(path)
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def iter_messages(path, strict: bool = False) -> Iterator[dict]:
+    """
+    Yield every JSON message in a recording
+
+    A half-written last line (the server was stopped mid-write) or a
+    truncated gzip stream ends the recording instead of raising an error.
+    With strict=True, TruncatedRecording is raised there instead (after
+    every complete message), for tools that must know the end is missing.
+    Compact .tkr recordings (see compact_recording.py) are read too.
+    """
+    if str(path).endswith('.tkr'):
+        from compact_recording import CompactRecording
+        yield from CompactRecording(path).iter_messages()
+        return
+    with open_recording(path) as f:
+        try:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    if strict:
+                        raise TruncatedRecording(f"{path} ends with a half-written line") from None
+                    return
+        except (EOFError, OSError) as e:
+            if strict:
+                raise TruncatedRecording(f"{path} is cut off: {e}") from None
+            return
+
+
+def iter_ticks(path) -> Iterator[dict]:
+    """Yield only the tick messages of a recording"""
+    for message in iter_messages(path):
+        if message.get('type') == TICK_EVENT:
+            yield message
+
+
+def iter_messages_from(path, round_number: int, turn: int = 0) -> Iterator[dict]:
+    """
+    Yield messages from a round and turn to the end of the recording
+
+    If the recording has an up-to-date sidecar index (see
+    recording_index.py), decompression starts right next to the turn
+    instead of at the beginning of the file.
+    """
+    if not str(path).endswith('.tkr'):
+        from recording_index import IndexedRecording
+        try:
+            indexed = IndexedRecording(path)
+        except (OSError, ValueError):
+            indexed = None
+        if indexed is not None:
+            yield from indexed.iter_messages(round_number, turn)
+            return
+
+    started = False
+    for message in iter_messages(path):
+        if not started and message.get('type') == TICK_EVENT:
+            started = (message.get('roundNumber'), message.get('turnNumber', 0)) >= (round_number, turn)
+        if started:
+            yield message
+
+
+def find_recordings(paths: Iterable) -> List[Path]:
+    """Expand files and folders into a sorted list of recording files"""
+    found = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            found.extend(sorted(path.glob('*.battle.gz')))
+            found.extend(sorted(path.glob('*.battle')))
+            found.extend(sorted(path.glob('*.tkr')))
+        elif path.exists():
+            found.append(path)
+    return found
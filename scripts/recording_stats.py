@@ -0,0 +1,263 @@
+"""
+Recording Stats Extractor for Python Tank Wars
+
+Reads battle recordings and works out, for every tank in every round:
+shots fired, shots that hit, damage dealt, damage taken, and whether it
+survived or won. The results are in exactly the format that
+LeaderboardManager.update_tank_stats() expects, so recorded tournaments
+can go straight onto the leaderboard. Tanks from the same round are
+ingested as one match, so they update each other's ratings.
+
+Each recording is read in a single streaming pass, and a folder of
+recordings is processed in parallel.
+
+A round only counts as finished when the next round started or the game
+ended. The last round of an aborted game, or of a recording that stops
+in the middle, is marked "aborted" and is not put on the leaderboard.
+
+Recordings only know tanks by their id number (1, 2, 3...), so tell the
+extractor who is who with --bot, or the tanks are called "Bot 1", "Bot 2"...
+--ingest needs a name for every tank: "Bot 1" of one game is usually not
+the same tank as "Bot 1" of another, so they must not share a leaderboard
+entry.
+
+Usage:
+    python scripts/recording_stats.py recordings/
+    python scripts/recording_stats.py recordings/game.battle.gz --bot 1=FinalBoss/ClaudeCode --bot 2=Rambo/Samples
+    python scripts/recording_stats.py recordings/ --output results.jsonl
+    python scripts/recording_stats.py recordings/ --ingest data/leaderboard.json --bot 1=FinalBoss/ClaudeCode
+"""
+
+import os
+import sys
+import json
+import argparse
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from recording_reader import TICK_EVENT, TruncatedRecording, find_recordings, iter_messages
+
+
+@dataclass
+class BotTally:
+    """Running totals for one bot during one round"""
+    bot_id: int
+    session_id: str = ""
+    shots_fired: int = 0
+    shots_hit: int = 0
+    shots_hit_wall: int = 0
+    damage_dealt: float = 0.0
+    damage_taken: float = 0.0     # From bullets
+    other_damage: float = 0.0     # Rams and wall hits, found from energy changes
+    energy: float = 100.0
+    last_turn: int = 0
+
+    def battle_results(self, survived: bool, won: bool) -> Dict:
+        """Format as a LeaderboardManager battle_results dict"""
+        return {
+            'won': won,
+            'lost': not survived,
+            'survived': survived,
+            'damage_dealt': int(round(self.damage_dealt)),
+            'damage_taken': int(round(self.damage_taken + self.other_damage)),
+            'shots_fired': self.shots_fired,
+            'shots_hit': self.shots_hit,
+        }
+
+
+class RoundTally:
+    """
+    Tallies every bot in one round, one tick at a time
+
+    Energy is checked every tick: whatever a bot lost that isn't explained
+    by firing or by bullets hitting it must be ram or wall damage.
+    """
+
+    def __init__(self, round_number: int):
+        self.round_number = round_number
+        self.bots: Dict[int, BotTally] = {}
+        self.alive: set = set()
+        self.last_turn = 0
+
+    def add_tick(self, tick: dict):
+        self.last_turn = tick.get('turnNumber', self.last_turn)
+
+        fire_cost = defaultdict(float)
+        energy_gained = defaultdict(float)
+        bullet_damage = defaultdict(float)
+
+        for event in tick.get('events', []):
+            kind = event.get('type')
+            if kind == 'BulletFiredEvent':
+                bullet = event['bullet']
+                self._bot(bullet['ownerId']).shots_fired += 1
+                fire_cost[bullet['ownerId']] += bullet['power']
+            elif kind == 'BulletHitBotEvent':
+                bullet = event['bullet']
+                shooter = self._bot(bullet['ownerId'])
+                shooter.shots_hit += 1
+                shooter.damage_dealt += event['damage']
+                self._bot(event['victimId']).damage_taken += event['damage']
+                energy_gained[bullet['ownerId']] += 3 * bullet['power']
+                bullet_damage[event['victimId']] += event['damage']
+            elif kind == 'BulletHitWallEvent':
+                self._bot(event['bullet']['ownerId']).shots_hit_wall += 1
+
+        alive = set()
+        for state in tick.get('botStates', []):
+            bot = self._bot(state['id'])
+            bot.session_id = state.get('sessionId', bot.session_id)
+            expected = bot.energy - fire_cost[bot.bot_id] + energy_gained[bot.bot_id] - bullet_damage[bot.bot_id]
+            unexplained = expected - state['energy']
+            if bot.last_turn and unexplained > 1e-6:
+                bot.other_damage += unexplained
+            bot.energy = state['energy']
+            bot.last_turn = self.last_turn
+            if state['energy'] > 0:
+                alive.add(bot.bot_id)
+        self.alive = alive
+
+    def _bot(self, bot_id: int) -> BotTally:
+        if bot_id not in self.bots:
+            self.bots[bot_id] = BotTally(bot_id)
+        return self.bots[bot_id]
+
+    def results(self) -> List[Tuple[int, Dict]]:
+        """(bot id, battle_results) for every bot; the last one standing wins"""
+        sole_survivor = len(self.alive) == 1
+        return [
+            (bot_id, bot.battle_results(survived=bot_id in self.alive,
+                                        won=sole_survivor and bot_id in self.alive))
+            for bot_id, bot in sorted(self.bots.items())
+        ]
+
+
+def extract_recording(path: str) -> List[Dict]:
+    """
+    One streaming pass over a recording
+
+    Returns:
+        One entry per bot per round: recording, round, bot_id, session_id,
+        aborted (the round didn't finish) and battle_results
+    """
+    rounds: List[RoundTally] = []
+    current: Optional[RoundTally] = None
+    last_round_ended = False
+
+    try:
+        for message in iter_messages(path, strict=True):
+            kind = message.get('type', '')
+            if kind == TICK_EVENT:
+                round_number = message.get('roundNumber', 1)
+                if current is None or round_number != current.round_number:
+                    current = RoundTally(round_number)
+                    rounds.append(current)
+                    last_round_ended = False
+                current.add_tick(message)
+            elif kind.startswith(('RoundEnded', 'GameEnded')):
+                last_round_ended = True
+            elif kind == 'GameAbortedEvent':
+                last_round_ended = False
+    except TruncatedRecording:
+        last_round_ended = False
+
+    entries = []
+    for i, tally in enumerate(rounds):
+        # Earlier rounds finished (the next one started); the last one only if we saw it end
+        round_aborted = i == len(rounds) - 1 and not last_round_ended
+        for bot_id, results in tally.results():
+            entries.append({
+                'recording': Path(path).name,
+                'round': tally.round_number,
+                'turns': tally.last_turn,
+                'bot_id': bot_id,
+                'session_id': tally.bots[bot_id].session_id,
+                'aborted': round_aborted,
+                'battle_results': results,
+            })
+    return entries
+
+
+def extract_all(paths: List[Path], workers: int) -> List[Dict]:
+    """Extract every recording, several at a time, in a stable order"""
+    if workers <= 1 or len(paths) <= 1:
+        return [entry for path in paths for entry in extract_recording(str(path))]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [entry for entries in pool.map(extract_recording, map(str, paths)) for entry in entries]
+
+
+def parse_bot_names(specs: List[str]) -> Dict[int, Tuple[str, str]]:
+    """Parse --bot ID=Name/Author options"""
+    names = {}
+    for spec in specs:
+        bot_id, _, rest = spec.partition('=')
+        name, _, author = rest.partition('/')
+        names[int(bot_id)] = (name, author or 'unknown')
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract per-tank battle stats from recordings')
+    parser.add_argument('recordings', nargs='*', default=['recordings'],
+                        help='Recording files or folders (default: recordings/)')
+    parser.add_argument('--bot', action='append', default=[],
+                        help='Name a bot id: ID=Name/Author (e.g. 1=FinalBoss/ClaudeCode)')
+    parser.add_argument('--output', default=None, help='Write results as JSON lines to this file')
+    parser.add_argument('--ingest', default=None, metavar='LEADERBOARD',
+                        help='Add the results to this leaderboard JSON file')
+    parser.add_argument('--include-aborted', action='store_true',
+                        help='Also ingest rounds that did not finish (aborted or cut-off recordings)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2,
+                        help='Recordings processed at the same time')
+    args = parser.parse_args()
+
+    paths = find_recordings(args.recordings)
+    if not paths:
+        print("❌ No recordings found")
+        sys.exit(1)
+
+    names = parse_bot_names(args.bot)
+    entries = extract_all(paths, args.workers)
+    for entry in entries:
+        entry['name'], entry['author'] = names.get(entry['bot_id'], (f"Bot {entry['bot_id']}", 'unknown'))
+
+    print(f"📊 {len(entries)} results from {len(paths)} recording(s)\n")
+    print(f"{'Recording':<34} {'Rnd':>3} {'Tank':<20} {'Shots':>5} {'Hits':>4} {'Dealt':>6} {'Taken':>6}  Result")
+    for entry in entries:
+        r = entry['battle_results']
+        result = 'WON' if r['won'] else ('died' if r['lost'] else 'survived')
+        if entry['aborted']:
+            result += ' (unfinished)'
+        print(f"{entry['recording'][:34]:<34} {entry['round']:>3} {entry['name'][:20]:<20} "
+              f"{r['shots_fired']:>5} {r['shots_hit']:>4} {r['damage_dealt']:>6.0f} {r['damage_taken']:>6.0f}  {result}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+        print(f"\n💾 Saved results to {args.output}")
+
+    if args.ingest:
+        from leaderboard_manager import LeaderboardManager
+
+        ingest = [e for e in entries if args.include_aborted or not e['aborted']]
+        unnamed = sorted({e['bot_id'] for e in ingest if e['bot_id'] not in names})
+        if unnamed:
+            print(f"\n❌ Not adding anything to {args.ingest}: bot id(s) {', '.join(map(str, unnamed))} "
+                  f"have no name. Name every tank with --bot ID=Name/Author")
+            sys.exit(1)
+
+        manager = LeaderboardManager(args.ingest)
+        manager.add_battle_results([
+            {'name': e['name'], 'author': e['author'], 'battle_results': e['battle_results'],
+             'match': (e['recording'], e['round'])}
+            for e in ingest
+        ])
+        print(f"\n🏆 Added {len(ingest)} results to {args.ingest}")
+
+
+if __name__ == '__main__':
+    main()
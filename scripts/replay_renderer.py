@@ -0,0 +1,372 @@
+"""
+Replay Renderer for Python Tank Wars (Robocode Tank Royale)
+
+Turns battle recordings (recordings/*.battle.gz) into MP4 videos you can
+watch, share, or show on the projector at the end of a tournament!
+
+Each video shows the tanks (in their own colors), their guns, radar scan
+arcs, energy bars, bullets in flight, and a flash wherever a bullet hits.
+
+How it stays fast:
+- Recordings are streamed one tick at a time, never loaded all at once
+- Frames are drawn into a small pool of preallocated NumPy buffers
+- A background thread encodes frames with OpenCV while the next ones are drawn
+- Several recordings are rendered at the same time, one per CPU core
+
+Usage:
+    python scripts/replay_renderer.py recordings/
+    python scripts/replay_renderer.py recordings/game-2025-12-16-00-53-39.battle.gz --scale 0.5
+    python scripts/replay_renderer.py recordings/ --highlights --workers 4
+    python scripts/replay_renderer.py recordings/big-tournament.battle.gz --round 7
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import queue
+import argparse
+import threading
+from itertools import takewhile
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Optional, Set, Tuple
+
+import numpy as np
+import cv2
+
+from recording_reader import (ARENA_WIDTH, ARENA_HEIGHT, TICK_EVENT, find_recordings, iter_messages_from,
+                              iter_ticks, open_recording)
+
+# BGR colors for tanks that don't set their own
+DEFAULT_COLORS = [
+    (80, 80, 255), (255, 160, 60), (80, 220, 80), (0, 215, 255),
+    (230, 90, 230), (255, 255, 80), (60, 140, 255), (200, 200, 200),
+]
+BACKGROUND_COLOR = (30, 30, 30)
+GRID_COLOR = (45, 45, 45)
+BULLET_COLOR = (200, 255, 255)
+HIT_COLOR = (0, 0, 255)
+TEXT_COLOR = (230, 230, 230)
+
+TANK_SIZE = 36       # Tank body is 36×36 units
+GUN_LENGTH = 28
+RADAR_LENGTH = 120   # Scan arcs are drawn shorter than the real 1200 unit range
+
+
+def hex_to_bgr(color: str) -> Tuple[int, int, int]:
+    """Convert '#RRGGBB' to an OpenCV BGR tuple"""
+    color = color.lstrip('#')
+    r, g, b = int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
+    return (b, g, r)
+
+
+class FrameWriter:
+    """
+    Encodes frames with OpenCV on a background thread
+
+    Frames come from a fixed pool of preallocated buffers: the renderer
+    takes a free buffer, draws into it and submits it; the writer thread
+    encodes it and hands the buffer back. No frame memory is allocated
+    while rendering, and drawing overlaps with encoding.
+    """
+
+    def __init__(self, path: str, fps: float, width: int, height: int,
+                 pool_size: int = 8, codec: str = 'mp4v'):
+        self.writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*codec), fps, (width, height))
+        if not self.writer.isOpened():
+            raise RuntimeError(f"OpenCV could not open a '{codec}' video writer for {path}")
+
+        self.free: queue.Queue = queue.Queue()
+        for _ in range(pool_size):
+            self.free.put(np.empty((height, width, 3), dtype=np.uint8))
+        self.ready: queue.Queue = queue.Queue()
+        self.frames_written = 0
+        self.error: Optional[BaseException] = None
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def acquire(self) -> np.ndarray:
+        """Get a free frame buffer (waits if the encoder is behind)"""
+        if self.error:
+            raise self.error
+        return self.free.get()
+
+    def submit(self, frame: np.ndarray):
+        """Queue a finished frame for encoding"""
+        self.ready.put(frame)
+
+    def _run(self):
+        while True:
+            frame = self.ready.get()
+            if frame is None:
+                return
+            try:
+                self.writer.write(frame)
+                self.frames_written += 1
+            except BaseException as e:
+                self.error = e
+            self.free.put(frame)
+
+    def close(self):
+        """Finish encoding queued frames and close the file"""
+        self.ready.put(None)
+        self.thread.join()
+        self.writer.release()
+        if self.error:
+            raise self.error
+
+
+class ReplayRenderer:
+    """Draws recording ticks into frame buffers"""
+
+    def __init__(self, width: int = ARENA_WIDTH, height: int = ARENA_HEIGHT, scale: float = 1.0):
+        self.scale = scale
+        self.width = int(round(width * scale))
+        self.height = int(round(height * scale))
+        self.background = self._draw_background()
+        self.colors: Dict[int, Tuple[int, int, int]] = {}
+
+    def _draw_background(self) -> np.ndarray:
+        """Arena floor with a 100-unit grid, drawn once and copied every frame"""
+        background = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        background[:] = BACKGROUND_COLOR
+        step = 100 * self.scale
+        for i in range(1, int(self.width / step) + 1):
+            background[:, int(i * step) - 1] = GRID_COLOR
+        for i in range(1, int(self.height / step) + 1):
+            background[self.height - int(i * step)] = GRID_COLOR
+        return background
+
+    def to_pixels(self, x: float, y: float) -> Tuple[int, int]:
+        """Arena coordinates (y up) to image pixels (y down)"""
+        return int(x * self.scale), int(self.height - y * self.scale)
+
+    def point_at(self, x: float, y: float, angle: float, length: float) -> Tuple[int, int]:
+        """Pixel position ``length`` units from (x, y) in direction ``angle``"""
+        rad = math.radians(angle)
+        return self.to_pixels(x + length * math.cos(rad), y + length * math.sin(rad))
+
+    def bot_color(self, bot: dict) -> Tuple[int, int, int]:
+        """Remember each bot's body color (it is only sent when it changes)"""
+        bot_id = bot['id']
+        if 'bodyColor' in bot:
+            self.colors[bot_id] = hex_to_bgr(bot['bodyColor'])
+        elif bot_id not in self.colors:
+            self.colors[bot_id] = DEFAULT_COLORS[(bot_id - 1) % len(DEFAULT_COLORS)]
+        return self.colors[bot_id]
+
+    def draw_tick(self, frame: np.ndarray, tick: dict):
+        """Draw one tick into ``frame`` (overwrites the whole buffer)"""
+        np.copyto(frame, self.background)
+        s = self.scale
+        bots = tick.get('botStates', [])
+
+        # Radar scan arcs first so tanks are drawn on top of them
+        for bot in bots:
+            color = self.bot_color(bot)
+            dim = tuple(c // 3 for c in color)
+            center = self.to_pixels(bot['x'], bot['y'])
+            sweep = bot.get('radarSweep', 0.0)
+            radar = bot['radarDirection']
+            if abs(sweep) > 0.5:
+                # OpenCV angles go clockwise on screen, Tank Royale's go counter-clockwise
+                cv2.ellipse(frame, center, (int(RADAR_LENGTH * s), int(RADAR_LENGTH * s)), 0,
+                            -radar, -(radar - sweep), dim, -1, cv2.LINE_AA)
+            else:
+                cv2.line(frame, center, self.point_at(bot['x'], bot['y'], radar, RADAR_LENGTH), dim, 1, cv2.LINE_AA)
+
+        for bullet in tick.get('bulletStates', []):
+            radius = max(1, int((1 + bullet.get('power', 1.0)) * s))
+            cv2.circle(frame, self.to_pixels(bullet['x'], bullet['y']), radius, BULLET_COLOR, -1, cv2.LINE_AA)
+
+        for bot in bots:
+            self._draw_tank(frame, bot)
+
+        for event in tick.get('events', []):
+            if event.get('type') == 'BulletHitBotEvent':
+                bullet = event['bullet']
+                cv2.circle(frame, self.to_pixels(bullet['x'], bullet['y']), int(14 * s), HIT_COLOR, 2, cv2.LINE_AA)
+
+        label = f"Round {tick.get('roundNumber', '?')}  Turn {tick.get('turnNumber', '?')}"
+        cv2.putText(frame, label, (8, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, TEXT_COLOR, 1, cv2.LINE_AA)
+
+    def _draw_tank(self, frame: np.ndarray, bot: dict):
+        s = self.scale
+        x, y = bot['x'], bot['y']
+        color = self.bot_color(bot)
+        center = self.to_pixels(x, y)
+
+        # Body: a square rotated to the tank's heading
+        box = cv2.boxPoints(((center[0], center[1]), (TANK_SIZE * s, TANK_SIZE * s), -bot['direction']))
+        cv2.fillConvexPoly(frame, box.astype(np.int32), color, cv2.LINE_AA)
+
+        # Gun barrel
+        cv2.line(frame, center, self.point_at(x, y, bot['gunDirection'], GUN_LENGTH), TEXT_COLOR,
+                 max(1, int(3 * s)), cv2.LINE_AA)
+
+        # Energy bar above the tank
+        half = int(TANK_SIZE * s / 2)
+        top = center[1] - half - int(8 * s) - 2
+        filled = int(2 * half * max(0.0, min(bot['energy'], 100.0)) / 100.0)
+        cv2.rectangle(frame, (center[0] - half, top), (center[0] + half, top + 3), (60, 60, 60), -1)
+        if filled > 0:
+            bar_color = (80, 200, 80) if bot['energy'] > 30 else (0, 140, 255)
+            cv2.rectangle(frame, (center[0] - half, top), (center[0] - half + filled, top + 3), bar_color, -1)
+
+        cv2.putText(frame, str(bot['id']), (center[0] - half, top - 3),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.35, TEXT_COLOR, 1, cv2.LINE_AA)
+
+
+def find_highlights(path, window: int) -> Set[Tuple[int, int]]:
+    """
+    Find (round, turn) pairs within ``window`` turns of a bullet hit
+
+    For JSON recordings this is a quick text scan: only the few lines
+    that contain a hit are parsed as JSON. Compact .tkr recordings are
+    binary, so their ticks are read and their events checked instead.
+    """
+    keep = set()
+    for tick in _hit_ticks(path):
+        round_number, turn = tick.get('roundNumber'), tick.get('turnNumber', 0)
+        keep.update((round_number, t) for t in range(turn - window, turn + window // 2 + 1))
+    return keep
+
+
+def _hit_ticks(path):
+    """Yield the ticks of a recording that have a bullet hit"""
+    if str(path).endswith('.tkr'):
+        for tick in iter_ticks(path):
+            if any(event.get('type') == 'BulletHitBotEvent' for event in tick.get('events', ())):
+                yield tick
+        return
+    with open_recording(path) as f:
+        for line in f:
+            if '"BulletHitBotEvent"' not in line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                return
+
+
+def render_recording(path: str,
+                     output: str,
+                     fps: float = 30.0,
+                     scale: float = 1.0,
+                     every: int = 1,
+                     highlights: bool = False,
+                     window: int = 45,
+                     codec: str = 'mp4v',
+                     round_number: Optional[int] = None) -> Tuple[int, float]:
+    """
+    Render one recording to a video file
+
+    Args:
+        path: Recording to render
+        output: Video file to write
+        fps: Frames per second of the video
+        scale: Size of the video relative to the arena (0.5 = half size)
+        every: Draw every Nth tick (2 = twice as fast, half the frames)
+        highlights: Only keep the turns around bullet hits
+        window: Turns before each hit to keep in highlight mode
+        codec: OpenCV FourCC code
+        round_number: Only render this round (seeks straight to it if the
+            recording has a sidecar index - see recording_index.py)
+
+    Returns:
+        (frames written, seconds taken)
+    """
+    start = time.perf_counter()
+    cv2.setNumThreads(1)  # One recording per process - don't fight over cores
+
+    keep = find_highlights(path, window) if highlights else None
+    if keep is not None and not keep:
+        return 0, time.perf_counter() - start  # No hits, so no highlight video
+
+    renderer = ReplayRenderer(scale=scale)
+    writer = FrameWriter(output, fps, renderer.width, renderer.height, codec=codec)
+    try:
+        if round_number is None:
+            ticks = iter_ticks(path)
+        else:
+            ticks = takewhile(lambda t: t.get('roundNumber') == round_number,
+                              (m for m in iter_messages_from(path, round_number) if m.get('type') == TICK_EVENT))
+        for i, tick in enumerate(ticks):
+            if i % every:
+                continue
+            if keep is not None and (tick.get('roundNumber'), tick.get('turnNumber')) not in keep:
+                continue
+            frame = writer.acquire()
+            renderer.draw_tick(frame, tick)
+            writer.submit(frame)
+    finally:
+        writer.close()
+
+    return writer.frames_written, time.perf_counter() - start
+
+
+def recording_stem(path: Path) -> str:
+    """A recording's file name without its extension ('game.battle.gz' -> 'game')"""
+    name = path.name
+    for extension in ('.battle.gz', '.battle', '.tkr'):
+        if name.endswith(extension):
+            return name[:-len(extension)]
+    return path.stem
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render battle recordings to MP4 videos')
+    parser.add_argument('recordings', nargs='*', default=['recordings'],
+                        help='Recording files or folders (default: recordings/)')
+    parser.add_argument('--output-dir', default='videos', help='Where to save the videos')
+    parser.add_argument('--fps', type=float, default=30.0, help='Video frames per second')
+    parser.add_argument('--scale', type=float, default=1.0, help='Video size relative to the arena')
+    parser.add_argument('--every', type=int, default=1, help='Only draw every Nth tick')
+    parser.add_argument('--highlights', action='store_true', help='Only keep the action around bullet hits')
+    parser.add_argument('--window', type=int, default=45, help='Turns kept before each hit (highlights)')
+    parser.add_argument('--codec', default='mp4v', help='OpenCV FourCC video codec')
+    parser.add_argument('--round', type=int, default=None, help='Only render this round')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2,
+                        help='Recordings rendered at the same time')
+    args = parser.parse_args()
+
+    paths = find_recordings(args.recordings)
+    if not paths:
+        print("❌ No recordings found")
+        sys.exit(1)
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    suffix = '_highlights.mp4' if args.highlights else '.mp4'
+    if args.round is not None:
+        suffix = f'_round{args.round}{suffix}'
+
+    print(f"🎬 Rendering {len(paths)} recording(s) with {min(args.workers, len(paths))} worker(s)")
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {}
+        for path in paths:
+            name = recording_stem(path)
+            output = output_dir / f"{name}{suffix}"
+            futures[pool.submit(render_recording, str(path), str(output), args.fps, args.scale,
+                                args.every, args.highlights, args.window, args.codec, args.round)] = output
+
+        for future in as_completed(futures):
+            output = futures[future]
+            try:
+                frames, seconds = future.result()
+                if frames:
+                    print(f"✅ {output} ({frames} frames in {seconds:.1f}s)")
+                else:
+                    print(f"⏭️  {output.name}: nothing to show (no hits)")
+            except Exception as e:
+                print(f"⚠️  {output}: {e}")
+
+    print(f"🏁 Done in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,295 @@
+"""
+Tournament Scoresheet for Python Tank Wars
+
+Builds a full tournament report from battle results:
+
+- 📋 A summary table for every tank (rounds, wins, survival, damage, accuracy)
+- ⚔️ A head-to-head matrix: how often each tank beats each other tank
+- 📈 Elo ratings, and how they changed over the tournament
+- 🖼️ One chart image with the matrix, the ratings and their history
+
+Results come from recording_stats.py (its --output JSON lines), or
+straight from recordings. Everything is loaded into one pandas DataFrame
+and worked out with groupby/pivot operations, so even tens of thousands
+of matches only take a moment.
+
+Who beats whom in a round: the winner beats everyone, survivors beat
+tanks that died, and two tanks that both survived (or both died) tie.
+
+Usage:
+    python scripts/recording_stats.py recordings/ --bot 1=FinalBoss/ClaudeCode --output results.jsonl
+    python scripts/scoresheet.py results.jsonl
+    python scripts/scoresheet.py recordings/ --bot 1=FinalBoss/ClaudeCode --output-dir reports
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from recording_reader import find_recordings
+from recording_stats import extract_all, parse_bot_names
+
+ELO_START = 1500.0
+ELO_K = 32.0
+
+
+def load_results(paths: List[str], bot_specs: List[str], workers: int = 1) -> pd.DataFrame:
+    """
+    Load battle results into one DataFrame, one row per tank per round
+
+    Args:
+        paths: recording_stats.py .jsonl files, recordings, or folders of recordings
+        bot_specs: --bot ID=Name/Author options for recordings
+        workers: Recordings processed at the same time
+
+    Returns:
+        DataFrame with recording, round, bot_id, tank, author, aborted and
+        the battle_results columns (won, lost, survived, damage_dealt...)
+    """
+    frames = []
+    jsonl = [p for p in paths if str(p).endswith('.jsonl')]
+    for path in jsonl:
+        frames.append(pd.read_json(path, lines=True))
+
+    recordings = find_recordings([p for p in paths if p not in jsonl])
+    if recordings:
+        entries = extract_all(recordings, workers)
+        names = parse_bot_names(bot_specs)
+        for entry in entries:
+            entry['name'], entry['author'] = names.get(entry['bot_id'], (f"Bot {entry['bot_id']}", 'unknown'))
+        frames.append(pd.DataFrame(entries))
+
+    if not frames:
+        return pd.DataFrame()
+    df = pd.concat(frames, ignore_index=True)
+    results = pd.json_normalize(df.pop('battle_results').tolist())
+    df = pd.concat([df.reset_index(drop=True), results], axis=1).rename(columns={'name': 'tank'})
+
+    # Recording names start with the date, so this is also the order the games were played in
+    df = df.sort_values(['recording', 'round', 'bot_id'], kind='stable').reset_index(drop=True)
+    df['match'] = df.groupby(['recording', 'round'], sort=False).ngroup()
+    df['place'] = df['won'].astype(int) * 2 + df['survived'].astype(int)
+    return df
+
+
+def tank_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """One row per tank with its totals and rates"""
+    summary = df.groupby('tank').agg(
+        author=('author', 'first'),
+        rounds=('match', 'size'),
+        wins=('won', 'sum'),
+        survived=('survived', 'mean'),
+        damage_dealt=('damage_dealt', 'sum'),
+        damage_taken=('damage_taken', 'sum'),
+        shots_fired=('shots_fired', 'sum'),
+        shots_hit=('shots_hit', 'sum'),
+    )
+    summary['win_rate'] = summary['wins'] / summary['rounds']
+    summary['accuracy'] = summary['shots_hit'] / summary['shots_fired'].where(summary['shots_fired'] > 0)
+    return summary
+
+
+def pairwise(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Every tank against every other tank in the same round
+
+    Returns:
+        DataFrame with match, tank, opponent and score (1 = beat them,
+        0.5 = tie, 0 = lost to them)
+    """
+    side = df[['match', 'tank', 'place']]
+    pairs = side.merge(side, on='match', suffixes=('', '_opponent'))
+    pairs = pairs[pairs['tank'] != pairs['tank_opponent']]
+    pairs = pairs.rename(columns={'tank_opponent': 'opponent'})
+    pairs['score'] = (np.sign(pairs['place'] - pairs['place_opponent']) + 1) / 2
+    return pairs[['match', 'tank', 'opponent', 'score']].reset_index(drop=True)
+
+
+def head_to_head(pairs: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """(share of rounds each tank beat each opponent, number of rounds they met)"""
+    table = pairs.pivot_table(index='tank', columns='opponent', values='score', aggfunc=['mean', 'size'])
+    return table['mean'], table['size'].fillna(0).astype(int)
+
+
+def elo_ratings(pairs: pd.DataFrame, k: float = ELO_K) -> Tuple[pd.Series, pd.DataFrame]:
+    """
+    Elo ratings, updated once per round in the order rounds were played
+
+    All pairings of a round are scored against the ratings from before the
+    round, and each tank's change is averaged over its opponents so melee
+    rounds don't swing ratings more than duels.
+
+    Returns:
+        (final rating per tank, rating history with match, tank and rating)
+    """
+    tanks = pd.Index(sorted(set(pairs['tank'])))
+    a = tanks.get_indexer(pairs['tank'])
+    b = tanks.get_indexer(pairs['opponent'])
+    score = pairs['score'].to_numpy()
+    match = pairs['match'].to_numpy()
+
+    order = np.argsort(match, kind='stable')
+    a, b, score, match = a[order], b[order], score[order], match[order]
+    bounds = np.flatnonzero(np.diff(match)) + 1
+    starts = np.concatenate([[0], bounds])
+    ends = np.concatenate([bounds, [len(match)]])
+
+    ratings = np.full(len(tanks), ELO_START)
+    history_match, history_tank, history_rating = [], [], []
+    for start, end in zip(starts, ends):
+        ta, tb, s = a[start:end], b[start:end], score[start:end]
+        expected = 1.0 / (1.0 + 10 ** ((ratings[tb] - ratings[ta]) / 400.0))
+        change = np.zeros(len(tanks))
+        opponents = np.zeros(len(tanks))
+        np.add.at(change, ta, k * (s - expected))
+        np.add.at(opponents, ta, 1)
+        played = np.flatnonzero(opponents)
+        ratings[played] += change[played] / opponents[played]
+
+        history_match.append(np.full(len(played), match[start]))
+        history_tank.append(played)
+        history_rating.append(ratings[played].copy())
+
+    final = pd.Series(ratings, index=tanks, name='elo').sort_values(ascending=False)
+    if not history_match:
+        return final, pd.DataFrame(columns=['match', 'tank', 'rating'])
+    history = pd.DataFrame({
+        'match': np.concatenate(history_match),
+        'tank': tanks[np.concatenate(history_tank)],
+        'rating': np.concatenate(history_rating),
+    })
+    return final, history
+
+
+def _percent(value) -> str:
+    return '-' if pd.isna(value) else f"{value:.0%}"
+
+
+def markdown_table(df: pd.DataFrame) -> str:
+    """A DataFrame as a Markdown table (index included)"""
+    header = [df.index.name or ''] + [str(c) for c in df.columns]
+    lines = ["| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+    for index, row in zip(df.index, df.itertuples(index=False)):
+        lines.append("| " + " | ".join([str(index)] + [str(v) for v in row]) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def render_charts(matrix: pd.DataFrame, ratings: pd.Series, history: pd.DataFrame, output: Path,
+                  top_n: int = 8):
+    """Draw the head-to-head matrix, ratings and rating history into one PNG"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    fig, (ax_matrix, ax_ratings, ax_history) = plt.subplots(1, 3, figsize=(20, 6.5))
+
+    shown = matrix.loc[ratings.index[:top_n * 2].intersection(matrix.index, sort=False)]
+    shown = shown[shown.index.intersection(shown.columns, sort=False)]
+    image = ax_matrix.imshow(shown.to_numpy(dtype=float), cmap='RdYlGn', vmin=0, vmax=1)
+    ax_matrix.set_xticks(range(len(shown.columns)), shown.columns, rotation=45, ha='right')
+    ax_matrix.set_yticks(range(len(shown.index)), shown.index)
+    if len(shown) <= 12:
+        for (row, col), value in np.ndenumerate(shown.to_numpy(dtype=float)):
+            if not np.isnan(value):
+                ax_matrix.text(col, row, f"{value:.0%}", ha='center', va='center', fontsize=8)
+    ax_matrix.set_title("Head to head (row beats column)")
+    fig.colorbar(image, ax=ax_matrix, fraction=0.046)
+
+    ax_ratings.barh(ratings.index[::-1], ratings.to_numpy()[::-1], color='#4C72B0')
+    ax_ratings.axvline(ELO_START, color='grey', linestyle='--', linewidth=1)
+    ax_ratings.set_xlim(min(ratings.min(), ELO_START) - 50, max(ratings.max(), ELO_START) + 50)
+    ax_ratings.set_title("Elo rating")
+
+    for tank in ratings.index[:top_n]:
+        line = history[history['tank'] == tank]
+        ax_history.plot(line['match'], line['rating'], label=tank, linewidth=1.2)
+    ax_history.set_xlabel("Round (in the order they were played)")
+    ax_history.set_title(f"Elo over the tournament (top {top_n})")
+    ax_history.legend(fontsize=8)
+
+    fig.tight_layout()
+    fig.savefig(output, dpi=100)
+    plt.close(fig)
+
+
+def build_scoresheet(df: pd.DataFrame, output_dir: Path, charts: bool = True) -> Path:
+    """
+    Work out every table and write scoresheet.md (and scoresheet.png)
+
+    Returns:
+        Path of the Markdown scoresheet
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    summary = tank_summary(df)
+    pairs = pairwise(df)
+    matrix, meetings = head_to_head(pairs)
+    ratings, history = elo_ratings(pairs)
+
+    table = summary.join(ratings).sort_values('elo', ascending=False)
+    table = pd.DataFrame({
+        'Author': table['author'],
+        'Elo': table['elo'].round().astype(int),
+        'Rounds': table['rounds'],
+        'Wins': table['wins'],
+        'Win %': table['win_rate'].map(_percent),
+        'Survival %': table['survived'].map(_percent),
+        'Damage dealt': table['damage_dealt'],
+        'Damage taken': table['damage_taken'],
+        'Accuracy': table['accuracy'].map(_percent),
+    }, index=pd.Index(table.index, name='Tank'))
+
+    order = [t for t in ratings.index if t in matrix.index]
+    matrix = matrix.reindex(index=order, columns=order)
+    meetings = meetings.reindex(index=order, columns=order).fillna(0).astype(int)
+    h2h = matrix.apply(lambda column: column.map(_percent))
+    h2h = h2h.where(meetings == 0, h2h + ' (' + meetings.astype(str) + ')')
+    h2h.index.name = 'Tank'
+
+    md = "# 📋 Tournament Scoresheet\n\n"
+    md += f"*{df['recording'].nunique()} recordings, {df['match'].nunique()} rounds, " \
+          f"{len(summary)} tanks*\n\n"
+    md += "## Standings\n\n" + markdown_table(table) + "\n"
+    md += "## Head to Head\n\n"
+    md += "Share of rounds the row tank beat the column tank (rounds they met in brackets).\n\n"
+    md += markdown_table(h2h) + "\n"
+    if charts:
+        render_charts(matrix, ratings, history, output_dir / "scoresheet.png")
+        md += "## Charts\n\n![Scoresheet charts](scoresheet.png)\n"
+
+    output = output_dir / "scoresheet.md"
+    output.write_text(md, encoding='utf-8')
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Tournament scoresheet from battle results')
+    parser.add_argument('results', nargs='*', default=['recordings'],
+                        help='recording_stats.py .jsonl files, recordings, or folders (default: recordings/)')
+    parser.add_argument('--bot', action='append', default=[],
+                        help='Name a bot id in recordings: ID=Name/Author')
+    parser.add_argument('--output-dir', default='reports', help='Where to write the scoresheet')
+    parser.add_argument('--include-aborted', action='store_true', help='Also count rounds from aborted games')
+    parser.add_argument('--no-charts', action='store_true', help='Skip the chart image')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2,
+                        help='Recordings processed at the same time')
+    args = parser.parse_args()
+
+    df = load_results(args.results, args.bot, args.workers)
+    if not args.include_aborted and 'aborted' in df:
+        df = df[~df['aborted'].astype(bool)]
+    if df.empty:
+        print("❌ No battle results found")
+        sys.exit(1)
+
+    output = build_scoresheet(df, Path(args.output_dir), charts=not args.no_charts)
+    print(f"📊 {df['match'].nunique()} rounds, {df['tank'].nunique()} tanks")
+    print(f"💾 Saved scoresheet to {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,13 +6,20 @@ It checks for common problems and provides step-by-step guidance.
 
 Usage:
     python tank_doctor.py your_tank.py
+    python tank_doctor.py --perf your_tank.py other_tank.py   # Only look for slow code
+    python tank_doctor.py --self-check   # Check the speed checker on this repository's tanks
 """
 
 import sys
 import ast
 import os
+import argparse
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Set, Tuple
+
+from bot_catalog import tank_classes
+
 
 class Colors:
     HEADER = '\033[95m'
@@ -25,6 +32,278 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Tank Royale gives every tank about 30 ms per turn. Rough costs of slow
+# patterns, measured with timeit on an ordinary laptop (Python 3.11):
+TURN_BUDGET_MS = 30.0
+GRID_CELL_US = 1.1          # One cell of a Python loop doing a little math
+DEFAULT_GRID_CELLS = 40 * 30  # An 800x600 arena in 20-pixel cells
+
+# Handlers that run once a round (saving data there is fine)
+ROUND_HANDLERS = {
+    'on_round_started', 'on_round_ended', 'on_game_started', 'on_game_ended',
+    'on_won_round', 'on_win', 'on_death', 'on_connected', 'on_disconnected',
+}
+FREQUENT_HANDLERS = {'on_tick', 'on_scanned_bot'}   # Run (almost) every turn
+FILE_CALLS = {
+    'open', 'json.load', 'json.dump', 'pickle.load', 'pickle.dump',
+    'np.load', 'np.save', 'np.savez', 'np.loadtxt', 'np.savetxt',
+    'numpy.load', 'numpy.save',
+}
+FILE_METHODS = {'read_text', 'write_text', 'read_bytes', 'write_bytes'}
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# (file, rule, method) the speed checker must find in this repository's tanks...
+KNOWN_SLOW_SPOTS = [
+    # Only reached through AnytimeTask(self.movement.plan_steps)
+    ('Submissions/AdaptiveBot/adaptive_bot.py', 'grid-loop', 'FieldBasedMovement.add_enemy_repulsion'),
+    ('Submissions/AdaptiveBot/adaptive_bot.py', 'grid-loop', 'FieldBasedMovement.add_wall_penalties'),
+]
+# ...and must not report
+KNOWN_FALSE_ALARMS = [
+    ('Tutorials/Week11_QLearning/selfplay.py', 'file-io', 'SelfPlayCoordinator.launch_workers'),  # Not a tank
+    ('Submissions/ClaudeCode/ml_champion_tank/ml_champion_tank.py', 'print-every-turn',
+     'MLChampionTank.run'),  # if self.tick % 100 == 0
+]
+
+
+@dataclass
+class SlowSpot:
+    """One performance finding"""
+    line: int
+    rule: str
+    where: str      # Method it was found in
+    problem: str
+    cost: str       # Estimated cost, in words
+    fix: str
+
+
+def _dotted(node) -> str:
+    """'np.append' for np.append(...), 'open' for open(...)"""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        inner = _dotted(node.value)
+        return f"{inner}.{node.attr}" if inner else node.attr
+    return ''
+
+
+def _range_size(loop: ast.For) -> Optional[int]:
+    """How many times `for x in range(N)` runs, if N is written as a number"""
+    call = loop.iter
+    if not (isinstance(call, ast.Call) and _dotted(call.func) == 'range' and call.args):
+        return None
+    numbers = [arg.value for arg in call.args if isinstance(arg, ast.Constant) and isinstance(arg.value, int)]
+    if len(numbers) != len(call.args):
+        return None
+    start, stop = (0, numbers[0]) if len(numbers) == 1 else (numbers[0], numbers[1])
+    step = numbers[2] if len(numbers) > 2 else 1
+    return max(0, (stop - start + step - 1) // step) if step > 0 else None
+
+
+def _is_range_loop(node) -> bool:
+    return (isinstance(node, ast.For) and isinstance(node.target, ast.Name)
+            and isinstance(node.iter, ast.Call) and _dotted(node.iter.func) == 'range')
+
+
+class PerformanceLinter:
+    """
+    Finds code that is slow to run EVERY turn
+
+    Per-turn code is the tank classes' run() and event handlers (except
+    the once-a-round ones like on_round_ended), and every method they call
+    with self.xxx() or self.helper.xxx() (when self.helper = SomeClass() in
+    the same file). Other classes with an on_xxx() method (like a training
+    coordinator) are not tanks, so they are left alone. The patterns come
+    from real tanks in this repository.
+    """
+
+    def __init__(self, source: str):
+        self.tree = ast.parse(source)
+        self.spots: List[SlowSpot] = []
+
+    def lint(self) -> List[SlowSpot]:
+        classes = {node.name: node for node in ast.walk(self.tree) if isinstance(node, ast.ClassDef)}
+        methods = {(cls, item.name): item for cls, node in classes.items() for item in node.body
+                   if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))}
+        helpers = {cls: self._helper_classes(node, classes) for cls, node in classes.items()}
+
+        per_turn = self._per_turn_methods(methods, helpers, tank_classes(classes))
+        for (cls, name), method in methods.items():
+            if (cls, name) in per_turn:
+                self._check_method(method, f"{cls}.{name}",
+                                   frequent=name == 'run' or name in FREQUENT_HANDLERS)
+        self.spots.sort(key=lambda spot: spot.line)
+        return self.spots
+
+    @staticmethod
+    def _helper_classes(cls: ast.ClassDef, classes) -> Dict[str, str]:
+        """self.movement = FieldBasedMovement() -> {'movement': 'FieldBasedMovement'}"""
+        helpers = {}
+        for node in ast.walk(cls):
+            if (isinstance(node, ast.Assign) and isinstance(node.value, ast.Call)
+                    and _dotted(node.value.func) in classes):
+                for target in node.targets:
+                    if (isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name)
+                            and target.value.id == 'self'):
+                        helpers[target.attr] = _dotted(node.value.func)
+        return helpers
+
+    @staticmethod
+    def _method_ref(cls, node, helpers) -> Optional[Tuple[str, str]]:
+        """self.x -> (cls, 'x'); self.helper.x -> (helper's class, 'x'); anything else -> None"""
+        if not isinstance(node, ast.Attribute):
+            return None
+        owner = node.value
+        if isinstance(owner, ast.Name) and owner.id == 'self':
+            return cls, node.attr
+        if (isinstance(owner, ast.Attribute) and isinstance(owner.value, ast.Name)
+                and owner.value.id == 'self' and owner.attr in helpers[cls]):
+            return helpers[cls][owner.attr], node.attr
+        return None
+
+    def _per_turn_methods(self, methods, helpers, tanks) -> Set[Tuple[str, str]]:
+        """
+        The tanks' run() and handlers, and everything they call through self.x() or self.helper.x()
+
+        Methods a tank hands to something else to call later, like
+        AnytimeTask(self.movement.plan_steps), count as per-turn too.
+        """
+        todo = [(cls, name) for cls, name in methods if cls in tanks
+                and (name == 'run' or (name.startswith('on_') and name not in ROUND_HANDLERS))]
+        for (cls, name), method in methods.items():
+            if cls in tanks:
+                todo.extend(self._passed_methods(cls, method, helpers))
+        todo = [key for key in dict.fromkeys(todo) if key in methods]
+        seen = set(todo)
+        while todo:
+            cls, name = todo.pop()
+            for node in ast.walk(methods[(cls, name)]):
+                if not isinstance(node, ast.Call):
+                    continue
+                callees = [self._method_ref(cls, node.func, helpers)]
+                callees.extend(self._passed_methods(cls, node, helpers))
+                for callee in callees:
+                    if callee in methods and callee not in seen:
+                        seen.add(callee)
+                        todo.append(callee)
+        return seen
+
+    def _passed_methods(self, cls, tree, helpers) -> List[Tuple[str, str]]:
+        """Methods given as arguments to calls in tree: AnytimeTask(self.movement.plan_steps)"""
+        passed = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call):
+                for arg in node.args + [keyword.value for keyword in node.keywords]:
+                    ref = self._method_ref(cls, arg, helpers)
+                    if ref is not None:
+                        passed.append(ref)
+        return passed
+
+    def _loop_depths(self, method) -> Dict[int, int]:
+        """How many loops each node in a method sits inside (by id(node))"""
+        depths = {}
+
+        def visit(node, depth):
+            depths[id(node)] = depth
+            for child in ast.iter_child_nodes(node):
+                inside = isinstance(node, (ast.For, ast.AsyncFor, ast.While)) and child not in (
+                    getattr(node, 'iter', None), getattr(node, 'target', None), getattr(node, 'test', None))
+                visit(child, depth + 1 if inside else depth)
+
+        visit(method, 0)
+        return depths
+
+    @staticmethod
+    def _guarded(method) -> Set[int]:
+        """Nodes that only run when an if says so (by id(node)), like prints under if self.tick % 100 == 0"""
+        guarded = set()
+        for node in ast.walk(method):
+            if isinstance(node, ast.If):
+                for statement in node.body + node.orelse:
+                    guarded.update(id(child) for child in ast.walk(statement))
+        return guarded
+
+    def _add(self, node, rule, where, problem, cost, fix):
+        self.spots.append(SlowSpot(node.lineno, rule, where, problem, cost, fix))
+
+    def _check_method(self, method, where, frequent):
+        in_loop = self._loop_depths(method)
+        guarded = self._guarded(method)
+        is_run = method.name == 'run'
+        for node in ast.walk(method):
+            depth = in_loop.get(id(node), 0)
+            # run()'s own `while self.is_running()` loop is the turn loop, not an extra loop
+            extra_loops = depth - 1 if is_run else depth
+            times = " - inside a loop, so that again for every time round it" if extra_loops > 0 else ""
+
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                names = ', '.join(alias.name for alias in node.names)
+                if isinstance(node, ast.ImportFrom):
+                    names = f"{node.module} ({names})"
+                self._add(node, 'import-in-method', where,
+                          f"import {names} inside a method runs again every turn",
+                          "~0.3 µs each time once loaded, but the FIRST call loads the module in the "
+                          "middle of a battle (numpy alone takes ~70 ms = 2 skipped turns)",
+                          "move the import to the top of the file")
+
+            elif isinstance(node, ast.Call):
+                name = _dotted(node.func)
+                if name in ('np.append', 'numpy.append'):
+                    self._add(node, 'np-append', where,
+                              "np.append() makes a brand new copy of the whole array every time",
+                              f"~3 µs plus copying every element (grows as the array grows){times}",
+                              "collect values in a list and call np.array() once, or fill a "
+                              "ready-made array with np.zeros(n)")
+                elif (isinstance(node.func, ast.Attribute) and node.func.attr == 'index'
+                      and len(node.args) == 1 and not name.startswith(('str.', "''"))):
+                    self._add(node, 'list-index', where,
+                              f"{name}() checks every item one by one until it finds a match",
+                              f"~15 ns per item in the list (and a crash if it isn't there){times}",
+                              "keep a dictionary from item to position: positions[item]")
+                elif (name == 'print' and id(node) not in guarded
+                      and (is_run and depth > 0 or frequent and not is_run)):
+                    self._add(node, 'print-every-turn', where,
+                              "print() runs every turn",
+                              "~2 µs to a file, 50 µs or more to a console - and thousands of lines "
+                              f"hide the messages that matter{times}",
+                              "print only when something changes, or every 100 turns "
+                              "(if self.tick % 100 == 0)")
+                elif name in FILE_CALLS or (isinstance(node.func, ast.Attribute)
+                                            and node.func.attr in FILE_METHODS):
+                    self._add(node, 'file-io', where,
+                              f"{name}() reads or writes a file during the battle",
+                              f"0.03-0.15 ms normally, but the disk can stall for 10+ ms - a whole "
+                              f"turn{times}",
+                              "load files in __init__ and save them in on_round_ended / on_game_ended")
+
+            if _is_range_loop(node):
+                self._check_grid_loop(node, where, depth - 1 if is_run else depth)
+
+    def _check_grid_loop(self, outer: ast.For, where: str, outer_loops: int):
+        for inner in ast.walk(outer):
+            if inner is outer or not _is_range_loop(inner):
+                continue
+            names = {outer.target.id, inner.target.id}
+            uses_both = any(isinstance(sub, ast.Subscript)
+                            and names <= {n.id for n in ast.walk(sub.slice) if isinstance(n, ast.Name)}
+                            | {n.id for n in ast.walk(sub.value) if isinstance(n, ast.Name)}
+                            for sub in ast.walk(inner))
+            if not uses_both:
+                continue
+            rows, columns = _range_size(outer), _range_size(inner)
+            cells = rows * columns if rows and columns else DEFAULT_GRID_CELLS
+            ms = cells * GRID_CELL_US / 1000
+            size = f"{rows}x{columns}" if rows and columns else "a 40x30"
+            times = f" - and the loop around it repeats that (e.g. once per enemy)" if outer_loops > 0 else ""
+            self._add(outer, 'grid-loop', where,
+                      "Python loops over every cell of a grid",
+                      f"~{GRID_CELL_US} µs per cell: {size} grid = ~{ms:.1f} ms of the "
+                      f"{TURN_BUDGET_MS:.0f} ms turn{times}",
+                      "let NumPy do the whole grid at once (np.meshgrid / np.hypot on arrays) - "
+                      "usually 20-50x faster")
+            return
+
+
 class TankDoctor:
     """
     Analyzes tank code and provides helpful feedback
@@ -35,6 +314,7 @@ class TankDoctor:
         self.issues = []
         self.warnings = []
         self.suggestions = []
+        self.slow_spots: List[SlowSpot] = []
         self.content = ""
 
     def examine(self):
@@ -69,6 +349,7 @@ class TankDoctor:
         self.check_common_mistakes()
         self.check_indentation_consistency()
         self.check_imports()
+        self.check_performance()
 
         # Show results
         self.show_diagnosis()
@@ -287,6 +568,32 @@ class TankDoctor:
         else:
             print(f"{Colors.GREEN}   ✓ Imports look good!{Colors.ENDC}\n")
 
+    def check_performance(self):
+        """Look for code that is too slow to run every turn"""
+        print(f"{Colors.BLUE}🔍 Checking speed (code that runs every turn)...{Colors.ENDC}")
+
+        try:
+            self.slow_spots = PerformanceLinter(self.content).lint()
+        except SyntaxError:
+            print(f"{Colors.YELLOW}   ⚠ Fix the syntax error first{Colors.ENDC}\n")
+            return
+
+        if self.slow_spots:
+            print(f"{Colors.YELLOW}   ⚠ Found {len(self.slow_spots)} slow spots{Colors.ENDC}\n")
+        else:
+            print(f"{Colors.GREEN}   ✓ Nothing slow found!{Colors.ENDC}\n")
+
+    def show_slow_spots(self):
+        """Print the slow spots with their estimated cost"""
+        print(f"{Colors.CYAN}{Colors.BOLD}🐢 SLOW SPOTS (why your tank might skip turns):{Colors.ENDC}")
+        print(f"{Colors.CYAN}   Every turn your tank has about {TURN_BUDGET_MS:.0f} ms to think. "
+              f"Miss it and the turn is skipped!{Colors.ENDC}")
+        for i, spot in enumerate(self.slow_spots, 1):
+            print(f"\n{Colors.YELLOW}{i}. Line {spot.line} in {spot.where}: {spot.problem}{Colors.ENDC}")
+            print(f"   ⏱️  Cost: {spot.cost}")
+            print(f"   💡 Fix: {spot.fix}")
+        print()
+
     def show_diagnosis(self):
         """Show the final diagnosis"""
         print(f"\n{Colors.HEADER}{Colors.BOLD}")
@@ -311,6 +618,10 @@ class TankDoctor:
                 print(f"\n{Colors.YELLOW}{i}. {warning}{Colors.ENDC}")
             print()
 
+        # Show slow spots (make it faster)
+        if self.slow_spots:
+            self.show_slow_spots()
+
         # Show suggestions (nice to have)
         if self.suggestions:
             print(f"{Colors.CYAN}{Colors.BOLD}💡 SUGGESTIONS (Nice to Have):{Colors.ENDC}")
@@ -340,14 +651,63 @@ class TankDoctor:
         print(f"{Colors.CYAN}Remember: Every bug you fix makes you a better programmer! 💪{Colors.ENDC}\n")
 
 
-def main():
-    if len(sys.argv) < 2:
-        print(f"{Colors.RED}Usage: python tank_doctor.py your_tank.py{Colors.ENDC}")
-        sys.exit(1)
+def lint_performance(files: List[str]) -> int:
+    """Linter mode: only the speed check, one line per finding"""
+    total = 0
+    for tank_file in files:
+        try:
+            spots = PerformanceLinter(Path(tank_file).read_text(encoding='utf-8')).lint()
+        except (OSError, SyntaxError) as e:
+            print(f"{tank_file}: {Colors.RED}could not check: {e}{Colors.ENDC}")
+            total += 1
+            continue
+        for spot in spots:
+            print(f"{tank_file}:{spot.line}: {Colors.YELLOW}{spot.rule}{Colors.ENDC} "
+                  f"[{spot.where}] {spot.problem} ({spot.cost})")
+        total += len(spots)
+    print(f"\n🐢 {total} slow spot(s) in {len(files)} file(s)")
+    return total
+
+
+def self_check() -> bool:
+    """Run the speed checker on tanks in this repository whose slow spots we know"""
+    found = {}
+    ok = True
+    for path, rule, where in KNOWN_SLOW_SPOTS + KNOWN_FALSE_ALARMS:
+        if path not in found:
+            spots = PerformanceLinter((REPO_ROOT / path).read_text(encoding='utf-8')).lint()
+            found[path] = {(spot.rule, spot.where) for spot in spots}
+        expected = (path, rule, where) in KNOWN_SLOW_SPOTS
+        if ((rule, where) in found[path]) != expected:
+            ok = False
+            problem = "missed" if expected else "wrongly reported"
+            print(f"❌ {path}: {problem} {rule} in {where}")
+    checks = len(KNOWN_SLOW_SPOTS) + len(KNOWN_FALSE_ALARMS)
+    print(f"{'✅' if ok else '❌'} Speed checker self-check: {checks} known cases")
+    return ok
 
-    tank_file = sys.argv[1]
-    doctor = TankDoctor(tank_file)
-    success = doctor.examine()
+
+def main():
+    parser = argparse.ArgumentParser(description='Check a tank for mistakes and slow code')
+    parser.add_argument('tank_files', nargs='*', help='Tank file(s) to check')
+    parser.add_argument('--perf', action='store_true',
+                        help='Only look for code that is slow to run every turn (linter mode)')
+    parser.add_argument('--self-check', action='store_true',
+                        help="Check the speed checker against this repository's tanks")
+    args = parser.parse_args()
+
+    if args.self_check:
+        sys.exit(0 if self_check() else 1)
+    if not args.tank_files:
+        parser.error("give at least one tank file")
+
+    if args.perf:
+        sys.exit(1 if lint_performance(args.tank_files) else 0)
+
+    success = True
+    for tank_file in args.tank_files:
+        doctor = TankDoctor(tank_file)
+        success = doctor.examine() and success
 
     sys.exit(0 if success else 1)
 
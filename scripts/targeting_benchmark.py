@@ -0,0 +1,471 @@
+"""
+Targeting Benchmark for Python Tank Wars
+
+Did my gun change make the tank shoot better, or just slower? This tool
+answers that without a server: it replays the radar scans from battle
+recordings into a gun's targeting code, and checks every shot against
+where the target really went next in the recording.
+
+For every ScannedBotEvent in the recordings:
+1. The gun code gets the scan and the scanning tank's position
+   (exactly the numbers the tank would get in a real game)
+2. Its answer (gun direction + fire power) is timed
+3. A "virtual bullet" flies from the tank in that direction at
+   20 - 3 × power per turn; it hits if it passes within 18 units of the
+   target's recorded position (the tank's size) before leaving the arena
+
+The same recordings always give the same shots, so hit rates can be
+compared exactly between runs. Save a baseline, change your gun, and run
+again with --baseline to see if it got less accurate or slower.
+
+Built-in guns:
+    head_on         aim straight at the scanned position (reference)
+    linear          exact straight-line prediction (reference)
+    lead_shot       tank_utils.TankTargeting.lead_shot
+    final_boss      FinalBossTank.choose_shot (power choice + fire decision)
+    skirmisher      Week 7 SkirmisherTank.choose_shot + should_fire
+
+The tank guns run the tanks' own choose_shot() code on a ReplayBot, so a
+change to the tank file is a change to the benchmark too.
+
+Your own gun: --gun my_gun.py:aim, where aim(shooter, scan) gets two dicts
+(botStates entry of the shooting tank, ScannedBotEvent) and returns
+(gun direction in degrees, power) or None to hold fire. Directions use the
+game's angles: 0 = east (right), counting counter-clockwise.
+
+Usage:
+    python scripts/targeting_benchmark.py recordings/
+    python scripts/targeting_benchmark.py recordings/ --gun lead_shot --gun final_boss --save-baseline gun_baseline.json
+    python scripts/targeting_benchmark.py recordings/ --baseline gun_baseline.json
+    python scripts/targeting_benchmark.py recordings/ --gun my_gun.py:aim
+"""
+
+import sys
+import copy
+import json
+import math
+import types
+import random
+import hashlib
+import argparse
+import importlib.util
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from recording_reader import ARENA_WIDTH, ARENA_HEIGHT, TICK_EVENT, find_recordings, iter_messages
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BOT_RADIUS = 18        # Tank Royale tanks are circles with this radius
+MAX_FLIGHT = 120       # Turns a virtual bullet may fly
+
+Aim = Optional[Tuple[float, float]]   # (gun direction, power), or None = don't fire
+
+
+def load_module(path: Path, name: str):
+    """Import a tank file under its own module name"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class ReplayBot:
+    """
+    The parts of a Bot that targeting helpers read, filled in from a recording
+
+    With a tank class, the tank's own methods can be called on it
+    (bot.choose_shot()), and they can call each other like on the real
+    tank. Extra keyword arguments become attributes, for the helpers that
+    the tank's targeting code uses (e.g. enemies=EnemyTracker()).
+    """
+
+    def __init__(self, state: Dict, tank: Optional[type] = None, **parts):
+        self.state = state
+        self.tank = tank
+        self.__dict__.update(parts)
+
+    def __getattr__(self, name):
+        """Anything else comes from the tank class, as a method of this ReplayBot"""
+        method = getattr(self.tank, name, None) if self.tank is not None else None
+        if not callable(method):
+            raise AttributeError(f"ReplayBot has no {name!r}")
+        return types.MethodType(method, self)
+
+    @property
+    def x(self) -> float:
+        return self.state['x']
+
+    @property
+    def y(self) -> float:
+        return self.state['y']
+
+    @property
+    def energy(self) -> float:
+        return self.state['energy']
+
+    def get_x(self) -> float:
+        return self.state['x']
+
+    def get_y(self) -> float:
+        return self.state['y']
+
+    def get_gun_direction(self) -> float:
+        return self.state['gunDirection']
+
+    def get_energy(self) -> float:
+        return self.state['energy']
+
+    def get_arena_width(self) -> int:
+        return ARENA_WIDTH
+
+    def get_arena_height(self) -> int:
+        return ARENA_HEIGHT
+
+
+def _direction_to(from_x: float, from_y: float, to_x: float, to_y: float) -> float:
+    """Game direction (0 = east, counter-clockwise) from one point to another"""
+    return math.degrees(math.atan2(to_y - from_y, to_x - from_x))
+
+
+class Gun:
+    """
+    A gun under test
+
+    aim() is called once per scan and its time is measured. Every tank in
+    every round gets its own copy (see for_new_tank), so guns that keep
+    track of enemies between scans only see their own tank's scans.
+    """
+    name = 'gun'
+
+    def reset(self):
+        """Forget everything learned about enemies"""
+
+    def for_new_tank(self) -> 'Gun':
+        twin = copy.copy(self)
+        twin.reset()
+        return twin
+
+    def observe(self, shooter: Dict, scan: Dict):
+        """Untimed bookkeeping a tank does when it gets a scan (e.g. tracker updates)"""
+
+    def aim(self, shooter: Dict, scan: Dict) -> Tuple[Aim, Optional[int]]:
+        """Return ((direction, power) or None, id of the bot being shot at)"""
+        raise NotImplementedError
+
+
+class HeadOnGun(Gun):
+    name = 'head_on'
+
+    def aim(self, shooter, scan):
+        return (_direction_to(shooter['x'], shooter['y'], scan['x'], scan['y']), 2.0), scan['scannedBotId']
+
+
+class LinearGun(Gun):
+    name = 'linear'
+
+    def aim(self, shooter, scan):
+        power = 2.0
+        speed = 20 - 3 * power
+        heading = math.radians(scan['direction'])
+        vx, vy = scan['speed'] * math.cos(heading), scan['speed'] * math.sin(heading)
+        dx, dy = scan['x'] - shooter['x'], scan['y'] - shooter['y']
+        # Solve |d + v t| = speed × t for the first time the bullet can meet the target
+        a = vx * vx + vy * vy - speed * speed
+        b = 2 * (dx * vx + dy * vy)
+        c = dx * dx + dy * dy
+        t = -c / b if abs(a) < 1e-9 else (-b - math.sqrt(max(0.0, b * b - 4 * a * c))) / (2 * a)
+        if t <= 0:
+            t = math.sqrt(c) / speed
+        x = min(max(scan['x'] + vx * t, 0), ARENA_WIDTH)
+        y = min(max(scan['y'] + vy * t, 0), ARENA_HEIGHT)
+        return (_direction_to(shooter['x'], shooter['y'], x, y), power), scan['scannedBotId']
+
+
+class LeadShotGun(Gun):
+    """tank_utils.TankTargeting.lead_shot, fed the scan exactly as a tank would"""
+    name = 'lead_shot'
+
+    def __init__(self):
+        sys.path.insert(0, str(REPO_ROOT))
+        from tank_utils import TankTargeting
+        self.lead_shot = TankTargeting.lead_shot
+
+    def aim(self, shooter, scan):
+        bot = ReplayBot(shooter)
+        gun_turn, _, _ = self.lead_shot(bot, scan['x'], scan['y'], scan['speed'], scan['direction'], 2)
+        # The tank turns its gun by gun_turn, so the bullet leaves in this direction
+        return (shooter['gunDirection'] + gun_turn, 2.0), scan['scannedBotId']
+
+
+class FinalBossGun(Gun):
+    """FinalBossTank.choose_shot(), with its own tracker and targeting systems"""
+    name = 'final_boss'
+
+    def __init__(self):
+        self.module = load_module(REPO_ROOT / 'Submissions' / 'ClaudeCode' / 'final_boss_tank' / 'final_boss_tank.py',
+                                  'benchmark_final_boss_tank')
+        self.tank = self.module.FinalBossTank
+        self.parts = {'targeting': self.module.TargetingSystem(),
+                      'advanced_targeting': self.module._AdvancedTargetingSystem(),
+                      'boundary': self.module._BoundaryValidator()}
+
+    def reset(self):
+        self.enemies = self.module.EnemyTracker(max_enemies=50)
+
+    def observe(self, shooter, scan):
+        heading = math.radians(scan['direction'])
+        self.enemies.update(scan['scannedBotId'], scan['x'], scan['y'],
+                            scan['speed'] * math.sin(heading), scan['speed'] * math.cos(heading),
+                            scan['energy'], scan['turnNumber'])
+
+    def aim(self, shooter, scan):
+        shot = ReplayBot(shooter, self.tank, enemies=self.enemies, **self.parts).choose_shot()
+        if shot is None:
+            return None, None
+        target_id, angle, power, good_shot = shot
+        # The tank also waits until its gun has turned there; here the gun turns at once
+        if not good_shot:
+            return None, target_id
+        return (float(angle), float(power)), target_id
+
+
+class SkirmisherGun(Gun):
+    """Week 7 SkirmisherTank.choose_shot() and should_fire()"""
+    name = 'skirmisher'
+
+    def __init__(self):
+        self.module = load_module(REPO_ROOT / 'Tutorials' / 'Week7_AdvancedSkirmisher' / 'skirmisher_tank.py',
+                                  'benchmark_skirmisher_tank')
+        self.tank = self.module.SkirmisherTank
+        self.parts = {'targeting': self.module.TargetingSystem(),
+                      'target_selector': self.module.TargetSelector()}
+
+    def reset(self):
+        self.enemies = self.module.EnemyTracker(max_enemies=50)
+
+    def observe(self, shooter, scan):
+        heading = math.radians(scan['direction'])
+        self.enemies.update(scan['scannedBotId'], scan['x'], scan['y'],
+                            scan['speed'] * math.sin(heading), scan['speed'] * math.cos(heading),
+                            scan['energy'], scan['turnNumber'])
+
+    def aim(self, shooter, scan):
+        bot = ReplayBot(shooter, self.tank, enemies=self.enemies, **self.parts)
+        shot = bot.choose_shot()
+        if shot is None:
+            return None, None
+        target, angle, power = shot
+        if not bot.should_fire(target):
+            return None, target['id']
+        return (float(angle), float(power)), target['id']
+
+
+class FunctionGun(Gun):
+    """A user gun: aim(shooter, scan) -> (direction, power) or None"""
+
+    def __init__(self, spec: str):
+        path, _, function = spec.rpartition(':')
+        module = load_module(Path(path), f"benchmark_gun_{Path(path).stem}")
+        self.function: Callable = getattr(module, function)
+        self.name = spec
+
+    def aim(self, shooter, scan):
+        return self.function(shooter, scan), scan['scannedBotId']
+
+
+BUILTIN_GUNS = {gun.name: gun for gun in (HeadOnGun, LinearGun, LeadShotGun, FinalBossGun, SkirmisherGun)}
+
+
+def make_gun(spec: str) -> Gun:
+    if spec in BUILTIN_GUNS:
+        return BUILTIN_GUNS[spec]()
+    if ':' in spec:
+        return FunctionGun(spec)
+    raise ValueError(f"Unknown gun '{spec}' (built-in: {', '.join(BUILTIN_GUNS)}, or file.py:function)")
+
+
+def iter_rounds(path: str):
+    """
+    Yield (positions, scans) for every round of a recording
+
+    positions[bot id] maps turn → (x, y); scans is a list of
+    (shooter state, ScannedBotEvent) in the order they happened.
+    """
+    positions: Dict[int, Dict[int, Tuple[float, float]]] = {}
+    scans: List[Tuple[Dict, Dict]] = []
+    current_round = None
+    for message in iter_messages(path):
+        if message.get('type') != TICK_EVENT:
+            continue
+        round_number = message.get('roundNumber', 1)
+        if round_number != current_round:
+            if scans:
+                yield positions, scans
+            positions, scans = {}, []
+            current_round = round_number
+        turn = message.get('turnNumber', 0)
+        bots = {bot['id']: bot for bot in message.get('botStates', [])}
+        for bot_id, bot in bots.items():
+            positions.setdefault(bot_id, {})[turn] = (bot['x'], bot['y'])
+        for event in message.get('events', []):
+            if event.get('type') == 'ScannedBotEvent' and event['scannedByBotId'] in bots:
+                scans.append((bots[event['scannedByBotId']], event))
+    if scans:
+        yield positions, scans
+
+
+def virtual_hit(start_x: float, start_y: float, direction: float, power: float,
+                track: Dict[int, Tuple[float, float]], turn: int) -> bool:
+    """Fly a bullet fired on ``turn`` and check it against the target's recorded track"""
+    speed = 20 - 3 * power
+    dx, dy = math.cos(math.radians(direction)), math.sin(math.radians(direction))
+    x, y = start_x, start_y
+    for step in range(1, MAX_FLIGHT + 1):
+        target = track.get(turn + step)
+        if target is None:
+            return False  # The target died (or the round ended) first
+        next_x, next_y = x + dx * speed, y + dy * speed
+        # Closest point of this turn's bullet path to the target
+        px, py = target[0] - x, target[1] - y
+        along = min(max(px * dx + py * dy, 0.0), speed)
+        if (px - along * dx) ** 2 + (py - along * dy) ** 2 <= BOT_RADIUS ** 2:
+            return True
+        x, y = next_x, next_y
+        if not (0 <= x <= ARENA_WIDTH and 0 <= y <= ARENA_HEIGHT):
+            return False
+    return False
+
+
+def benchmark_gun(gun: Gun, paths: List[Path]) -> Dict:
+    """Replay every scan into one gun; returns its accuracy and timing numbers"""
+    random.seed(0)
+    np.random.seed(0)
+    times: List[int] = []
+    shots = hits = held = errors = 0
+    first_error = None
+    fingerprint = hashlib.sha1()
+
+    for path in paths:
+        for positions, scans in iter_rounds(str(path)):
+            tank_guns: Dict[int, Gun] = {}
+            for shooter, scan in scans:
+                tank_gun = tank_guns.get(shooter['id'])
+                if tank_gun is None:
+                    tank_gun = tank_guns[shooter['id']] = gun.for_new_tank()
+                try:
+                    tank_gun.observe(shooter, scan)
+                    started = perf_counter_ns()
+                    aim, target_id = tank_gun.aim(shooter, scan)
+                    times.append(perf_counter_ns() - started)
+                except Exception as e:
+                    errors += 1
+                    first_error = first_error or f"{type(e).__name__}: {e}"
+                    continue
+                if aim is None or target_id not in positions:
+                    held += 1
+                    continue
+                direction, power = aim
+                fingerprint.update(f"{direction:.3f},{power:.2f};".encode())
+                shots += 1
+                hits += virtual_hit(shooter['x'], shooter['y'], direction, power,
+                                    positions[target_id], scan['turnNumber'])
+
+    micros = np.asarray(times) / 1000.0 if times else np.zeros(1)
+    return {
+        'gun': gun.name,
+        'calls': len(times) + errors,
+        'shots': shots,
+        'held': held,
+        'errors': errors,
+        'first_error': first_error,
+        'hits': hits,
+        'hit_rate': hits / shots if shots else 0.0,
+        'p50_us': float(np.percentile(micros, 50)),
+        'p99_us': float(np.percentile(micros, 99)),
+        'mean_us': float(micros.mean()),
+        'fingerprint': fingerprint.hexdigest()[:12],
+    }
+
+
+def compare(results: List[Dict], baseline: Dict[str, Dict], tolerance: float, slowdown: float) -> List[str]:
+    """Regressions against a saved baseline, as messages"""
+    problems = []
+    for result in results:
+        old = baseline.get(result['gun'])
+        if old is None:
+            continue
+        if result['errors'] > old.get('errors', 0):
+            problems.append(f"{result['gun']}: crashes {old.get('errors', 0)} → {result['errors']}")
+        if result['hit_rate'] < old['hit_rate'] - tolerance:
+            problems.append(f"{result['gun']}: hit rate {old['hit_rate']:.1%} → {result['hit_rate']:.1%}")
+        if result['p50_us'] > old['p50_us'] * slowdown:
+            problems.append(f"{result['gun']}: median time {old['p50_us']:.1f} µs → {result['p50_us']:.1f} µs")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay recorded scans into targeting code: speed and virtual hit rate')
+    parser.add_argument('recordings', nargs='*', default=['recordings'],
+                        help='Recording files or folders (default: recordings/)')
+    parser.add_argument('--gun', action='append', default=None,
+                        help=f"Gun to test: {', '.join(BUILTIN_GUNS)} or file.py:function (default: all built-in)")
+    parser.add_argument('--baseline', default=None, help='Compare with results saved by --save-baseline')
+    parser.add_argument('--save-baseline', default=None, help='Save these results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.01, help='Allowed hit rate drop (0.01 = 1 point)')
+    parser.add_argument('--slowdown', type=float, default=1.25, help='Allowed median time increase (1.25 = 25%%)')
+    args = parser.parse_args()
+
+    paths = find_recordings(args.recordings)
+    if not paths:
+        print("❌ No recordings found")
+        sys.exit(1)
+
+    results = []
+    for spec in args.gun or list(BUILTIN_GUNS):
+        try:
+            gun = make_gun(spec)
+        except Exception as e:
+            print(f"⚠️  Skipping {spec}: {e}")
+            continue
+        print(f"🎯 {gun.name}...")
+        results.append(benchmark_gun(gun, paths))
+
+    if not results:
+        print("❌ No gun could be tested")
+        sys.exit(1)
+
+    print(f"\n📊 {results[0]['calls']} scans from {len(paths)} recording(s)\n")
+    print(f"{'Gun':<16} {'Shots':>6} {'Held':>6} {'Hits':>6} {'Hit rate':>8} {'p50 µs':>8} {'p99 µs':>8}  Fingerprint")
+    for r in results:
+        print(f"{r['gun'][:16]:<16} {r['shots']:>6} {r['held']:>6} {r['hits']:>6} {r['hit_rate']:>8.1%} "
+              f"{r['p50_us']:>8.1f} {r['p99_us']:>8.1f}  {r['fingerprint']}")
+    for r in results:
+        if r['errors']:
+            print(f"⚠️  {r['gun']} crashed on {r['errors']} scan(s), e.g. {r['first_error']}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump({r['gun']: r for r in results}, f, indent=2)
+        print(f"\n💾 Saved baseline to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for r in results:
+            old = baseline.get(r['gun'])
+            if old and old['fingerprint'] != r['fingerprint']:
+                print(f"ℹ️  {r['gun']} aims differently than in the baseline")
+        problems = compare(results, baseline, args.tolerance, args.slowdown)
+        if problems:
+            print("\n❌ Regressions:")
+            for problem in problems:
+                print(f"   {problem}")
+            sys.exit(1)
+        print("\n✅ No regressions against the baseline")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,108 +2,210 @@
 """
 Test script to verify all converted bots have correct syntax and can be imported.
 This is useful for CI/CD testing before running actual battles.
+
+Every bot is imported in its own Python process, several at a time:
+- a bot that hangs or is very slow to import is stopped after --timeout seconds
+- a bot that eats too much memory is stopped at --memory MB
+- nothing one bot sets up (module globals, sys.modules entries) can affect another
+
+Usage:
+    python scripts/test_bots.py
+    python scripts/test_bots.py --workers 8 --timeout 20 --memory 512
+    python scripts/test_bots.py --json results.json      # Structured results for CI
 """
 
+import os
 import sys
+import json
+import time
+import hashlib
+import argparse
+import subprocess
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
 from pathlib import Path
+from typing import List
+
+from bot_catalog import BotCatalog, REPO_ROOT
+
+RESULT_MARKER = "BOT_CHECK_RESULT "
+
+@dataclass
+class BotCheck:
+    """Result of checking one bot"""
+    path: str
+    passed: bool
+    message: str
+    seconds: float = 0.0
 
-def test_bot(bot_path):
-    """Test if a bot file can be imported successfully"""
+def _module_name(bot_path):
+    """A module name nobody else uses, so checked bots never replace each other in sys.modules"""
+    digest = hashlib.sha1(str(Path(bot_path).resolve()).encode()).hexdigest()[:10]
+    return f"bot_check_{Path(bot_path).stem}_{digest}"
+
+def test_bot(bot_path, class_name=None):
+    """Test if a bot file can be imported successfully (and has class_name, if given)"""
     bot_path = Path(bot_path)
-    
+
     if not bot_path.exists():
         return False, f"File not found: {bot_path}"
-    
+
     try:
         # Try to import the module
-        spec = importlib.util.spec_from_file_location("test_bot", bot_path)
+        name = _module_name(bot_path)
+        spec = importlib.util.spec_from_file_location(name, bot_path)
         if spec is None or spec.loader is None:
             return False, "Could not load module spec"
-        
+
         module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
         spec.loader.exec_module(module)
-        
-        # Check if it has a BaseBot subclass
+
+        # Check if it has a BaseBot subclass (its own - not Bot or BaseBot that it imported)
         from robocode_tank_royale.bot_api import BaseBot
-        
-        bot_class = None
-        for item_name in dir(module):
+
+        bot_class = getattr(module, class_name, None) if class_name else None
+        for item_name in ([] if bot_class else dir(module)):
             if item_name.startswith('_'):
                 continue
             item = getattr(module, item_name)
-            if isinstance(item, type) and issubclass(item, BaseBot) and item != BaseBot:
+            if (isinstance(item, type) and issubclass(item, BaseBot)
+                    and not item.__module__.startswith('robocode_tank_royale')):
                 bot_class = item
                 break
-        
+
         if bot_class is None:
             return False, "No BaseBot subclass found"
-        
+
         return True, f"Found bot class: {bot_class.__name__}"
-    
+
+    except MemoryError:
+        return False, "Ran out of memory while importing"
     except Exception as e:
         return False, str(e)
 
+def _limit_memory(memory_mb):
+    """Cap this process's memory (where the OS allows it)"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return
+    limit = memory_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError):
+        pass
+
+def _child(bot_path, class_name, memory_mb):
+    """Runs inside the checker's subprocess: import one bot and print the result"""
+    _limit_memory(memory_mb)
+    sys.path.insert(0, str(Path(bot_path).resolve().parent))  # Like running the bot from its folder
+    success, message = test_bot(bot_path, class_name or None)
+    print(RESULT_MARKER + json.dumps({'passed': success, 'message': message}), flush=True)
+
+def check_bot(bot_path, class_name=None, timeout=30.0, memory_mb=1024) -> BotCheck:
+    """Import one bot in a fresh Python process with a time and memory limit"""
+    started = time.perf_counter()
+    full_path = Path(bot_path).resolve()  # The child runs in the bot's folder, so relative paths would break
+    command = [sys.executable, str(Path(__file__).resolve()), '--child', str(full_path),
+               class_name or '', str(memory_mb)]
+    # One BLAS thread: numpy otherwise reserves memory per CPU, which the memory cap would count
+    env = dict(os.environ, OPENBLAS_NUM_THREADS='1', OMP_NUM_THREADS='1', MKL_NUM_THREADS='1')
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=timeout,
+                                cwd=full_path.parent, env=env)
+    except subprocess.TimeoutExpired:
+        return BotCheck(str(bot_path), False, f"Import took longer than {timeout:.0f}s (stuck?)", timeout)
+    seconds = time.perf_counter() - started
+
+    for line in reversed(result.stdout.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            outcome = json.loads(line[len(RESULT_MARKER):])
+            return BotCheck(str(bot_path), outcome['passed'], outcome['message'], seconds)
+
+    # No result line: the process was killed or crashed hard
+    if result.returncode < 0:
+        reason = f"Crashed (signal {-result.returncode}) - maybe more than {memory_mb} MB of memory?"
+    else:
+        last = (result.stderr.strip().splitlines() or [f"exit code {result.returncode}"])[-1]
+        reason = f"Crashed: {last}"
+    return BotCheck(str(bot_path), False, reason, seconds)
+
+def check_bots(bots, workers=None, timeout=30.0, memory_mb=1024, on_result=None) -> List[BotCheck]:
+    """
+    Check many bots, several at a time
+
+    Args:
+        bots: (bot file, class name or None) pairs
+        workers: Bots checked at the same time (default: one per CPU)
+        on_result: Called with each BotCheck as soon as it is ready
+
+    Returns:
+        One BotCheck per bot, in the same order
+    """
+    def run(item):
+        check = check_bot(item[0], item[1], timeout, memory_mb)
+        if on_result:
+            on_result(check)
+        return check
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 2) as pool:
+        return list(pool.map(run, bots))
+
 def main():
     """Test all bots in the repository"""
+    parser = argparse.ArgumentParser(description='Check that every bot can be imported')
+    parser.add_argument('search', nargs='?', default='', help='Only bots whose name or path contains this')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help='Bots checked at the same time')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Seconds one import may take')
+    parser.add_argument('--memory', type=int, default=1024, help='MB of memory one import may use')
+    parser.add_argument('--json', default=None, metavar='FILE', help='Also save the results as JSON')
+    parser.add_argument('--child', nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        bot_path, class_name, memory_mb = args.child
+        _child(bot_path, class_name, int(memory_mb))
+        return
+
     print("=" * 70)
     print("  🤖 Testing All Converted Bots")
     print("=" * 70)
     print()
-    
-    # List of all bot files to test
-    bot_files = [
-        # Samples
-        "Samples/sitting_duck.py",
-        "Samples/spin_bot.py",
-        "Samples/walls_bot.py",
-        "Samples/tracker_bot.py",
-        "Samples/champion_bot.py",
-        
-        # Tutorials
-        "Tutorials/Week1_MyFirstTank/my_first_tank.py",
-        "Tutorials/Week2_Trigonometry/predictor_bot.py",
-        "Tutorials/Week3_BoundaryChecking/boundary_bot.py",
-        "Tutorials/Week4_Strategy/trickster_bot.py",
-        "Tutorials/Week5_AdvancedTargeting/sniper_bot.py",
-        "Tutorials/Week6_AdvancedPython/professional_tank.py",
-        "Tutorials/Week7_AdvancedSkirmisher/skirmisher_tank.py",
-        "Tutorials/Week8_AntiGravitySwarms/anti_gravity_tank.py",
-        
-        # Submissions
-        "Submissions/ClaudeCode/final_boss_tank.py",
-        "Submissions/ClaudeCode/challenger_tank.py",
-        "Submissions/ExampleSubmission/example_tank.py",
-    ]
-    
-    passed = 0
-    failed = 0
-    results = []
-    
-    for bot_file in bot_files:
-        success, message = test_bot(bot_file)
-        status = "✅" if success else "❌"
-        
-        bot_name = Path(bot_file).stem
-        print(f"{status} {bot_name:30s} - {message}")
-        
-        if success:
-            passed += 1
-        else:
-            failed += 1
-        
-        results.append((bot_file, success, message))
-    
+
+    # Every bot in Samples/, Tutorials/ and Submissions/ (found without importing them)
+    bots = BotCatalog().find(args.search)
+    bot_files = [str(REPO_ROOT / bot.path) for bot in bots]
+
+    def report(check):
+        status = "✅" if check.passed else "❌"
+        bot_name = Path(check.path).stem
+        print(f"{status} {bot_name:30s} - {check.message} ({check.seconds:.1f}s)", flush=True)
+
+    started = time.perf_counter()
+    results = check_bots([(bot_file, bot.bot_class) for bot_file, bot in zip(bot_files, bots)],
+                         args.workers, args.timeout, args.memory, on_result=report)
+    wall = time.perf_counter() - started
+    passed = sum(check.passed for check in results)
+    failed = len(results) - passed
+
     print()
     print("=" * 70)
     print(f"  Results: {passed} passed, {failed} failed out of {len(bot_files)} bots")
+    print(f"  Took {wall:.1f}s with {args.workers} workers "
+          f"({sum(check.seconds for check in results):.1f}s of imports)")
     print("=" * 70)
-    
+
+    if args.json:
+        Path(args.json).write_text(json.dumps([asdict(check) for check in results], indent=2))
+        print(f"\n💾 Results saved to {args.json}")
+
     if failed > 0:
         print("\n❌ Some bots failed. Details:")
-        for bot_file, success, message in results:
-            if not success:
-                print(f"  - {bot_file}: {message}")
+        for check in results:
+            if not check.passed:
+                print(f"  - {check.path}: {check.message}")
         sys.exit(1)
     else:
         print("\n✅ All bots passed! Ready for battle!")
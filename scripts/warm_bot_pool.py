@@ -0,0 +1,294 @@
+"""
+Warm Bot Worker Pool for Python Tank Wars
+
+Tournaments start and stop the same tanks hundreds of times. Starting a
+tank the normal way (its .sh / .cmd file) means a brand new Python that
+imports numpy, the bot API and the bot file again, every single match.
+
+This pool does all that importing ONCE, then keeps a few worker processes
+ready that are copies ("forks") of the warm process. A new match is handed
+to a worker that only has to create a fresh tank object - milliseconds
+instead of seconds.
+
+How it works:
+- The pool imports the bot API, numpy, the shared tank_utils package and
+  every bot file under Samples/, Tutorials/ and Submissions/ (bot files
+  are .py files with a .json next to them)
+- It forks --size idle workers that already have all of that loaded
+- Each match goes to one idle worker, and a new idle worker is forked
+  right away so the next match finds one waiting too
+- A worker plays one match and then exits, so nothing a tank remembers
+  (class variables, module globals...) leaks into the next match
+- Every worker has its own environment, so e.g. each team can get its own
+  TEAM_ID (something one multi_bot_launcher.py process can't do)
+
+On systems without fork (Windows) workers are started fresh instead and
+warm themselves up while they wait for their first match.
+
+Usage:
+    python scripts/warm_bot_pool.py Samples/Corners Samples/Crazy Samples/SpinBot --matches 100
+    python scripts/warm_bot_pool.py --benchmark Samples/Corners     # Cold start vs warm worker
+
+    # From a tournament script
+    from warm_bot_pool import WarmBotPool
+    with WarmBotPool(find_bot_files()) as pool:
+        handles = [pool.launch("Samples/Corners"), pool.launch("Samples/Crazy")]
+        results = [pool.result(handle) for handle in handles]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import subprocess
+import multiprocessing
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from bot_catalog import BOT_FOLDERS, REPO_ROOT, BotCatalog
+from multi_bot_launcher import BotLoader, host_all
+
+# The warm state; forked workers get a copy of it for free
+_loader: Optional[BotLoader] = None
+
+
+@dataclass
+class MatchResult:
+    """What a worker reports back after its match"""
+    pid: int
+    tanks: List[str] = field(default_factory=list)
+    setup_ms: float = 0.0                             # From getting the job to tanks created
+    errors: List[str] = field(default_factory=list)
+
+
+def find_bot_files(folders=BOT_FOLDERS, root: Path = REPO_ROOT) -> List[Path]:
+    """Every bot file (a .py with a .json of the same name) in the given folders"""
+    return [root / bot.path for bot in BotCatalog(root, folders).entries]
+
+
+def warm_up(bot_files: List[Path]) -> Dict[Path, str]:
+    """
+    Import the bot API, numpy, tank_utils and every bot file into this process
+
+    Returns:
+        The bot files that could not be imported, with the reason
+    """
+    global _loader
+    import numpy  # noqa: F401 - imported here so every worker inherits it
+    sys.path.insert(0, str(REPO_ROOT))
+    import tank_utils
+    tank_utils.preload()  # Every part of it and its trig tables, shared by all workers
+    _loader = BotLoader()
+    failed = {}
+    for path in bot_files:
+        try:
+            _loader.load_module(path)
+        except Exception as e:
+            failed[path] = f"{type(e).__name__}: {e}"
+    return failed
+
+
+def _play(spec_text: str, env: Dict[str, str], connect: bool) -> MatchResult:
+    """Create the tanks for one match (and play it when connect is True)"""
+    started = time.perf_counter()
+    result = MatchResult(os.getpid())
+    os.environ.update(env)
+    try:
+        specs = _loader.specs(spec_text)
+        bots = [spec.create() for spec in specs]
+    except Exception as e:
+        result.errors.append(f"{type(e).__name__}: {e}")
+        return result
+    result.tanks = [spec.label for spec in specs]
+    result.setup_ms = (time.perf_counter() - started) * 1000
+    if connect:
+        errors = asyncio.run(host_all(specs, restart=False, bots=bots))
+        result.errors = [f"{spec.label}: {type(e).__name__}: {e}" for spec, e in zip(specs, errors) if e]
+    return result
+
+
+def _worker(conn, bot_files: List[Path]):
+    """One pre-warmed worker: wait for a single match, play it, report back"""
+    if _loader is None:  # Not forked (e.g. Windows): warm up before the match arrives
+        warm_up(bot_files)
+    conn.send('ready')
+    job = conn.recv()
+    if job is None:
+        return
+    try:
+        result = _play(*job)
+    except BaseException as e:
+        result = MatchResult(os.getpid(), errors=[f"{type(e).__name__}: {e}"])
+    conn.send(result)
+
+
+class WarmBotPool:
+    """
+    A few pre-warmed worker processes, each ready to serve one match
+
+    Args:
+        bot_files: Bot files to import before any worker starts
+        size: Idle workers kept waiting for the next match
+    """
+
+    def __init__(self, bot_files: List[Path], size: int = 4):
+        self.bot_files = bot_files
+        self.size = size
+        forking = 'fork' in multiprocessing.get_all_start_methods()
+        self.context = multiprocessing.get_context('fork' if forking else 'spawn')
+        self.failed = warm_up(bot_files) if forking else {}
+        self.idle = deque()
+        self.busy = {}
+        for _ in range(size):
+            self._start_worker()
+
+    def _start_worker(self):
+        conn, child_conn = self.context.Pipe()
+        process = self.context.Process(target=_worker, args=(child_conn, self.bot_files), daemon=True)
+        process.start()
+        child_conn.close()
+        self.idle.append((process, conn))
+
+    def launch(self, spec: str, env: Optional[Dict[str, str]] = None, connect: bool = True) -> int:
+        """
+        Start a match on an idle worker
+
+        Args:
+            spec: Which tank(s), as for multi_bot_launcher.py (folder, file, file.py:Class, NAME*3)
+            env: Extra environment variables for this worker only (e.g. TEAM_ID)
+            connect: False only creates the tanks (for timing and checking)
+
+        Returns:
+            A handle for result()
+        """
+        process, conn = self.idle.popleft()
+        conn.recv()  # 'ready' - only waits if the worker is still warming up
+        conn.send((spec, env or {}, connect))
+        self.busy[process.pid] = (process, conn)
+        self._start_worker()  # Keep the pool full for the next match
+        return process.pid
+
+    def result(self, handle: int, timeout: Optional[float] = None) -> MatchResult:
+        """Wait for a match to finish"""
+        process, conn = self.busy.pop(handle)
+        try:
+            if conn.poll(timeout):
+                return conn.recv()
+            process.terminate()
+            return MatchResult(handle, errors=[f"No result after {timeout}s - stopped"])
+        except EOFError:
+            return MatchResult(handle, errors=[f"Worker died (exit code {process.exitcode})"])
+        finally:
+            process.join(1)
+            conn.close()
+
+    def close(self):
+        for process, conn in self.idle:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process, _ in self.busy.values():
+            process.terminate()
+        for process, conn in list(self.idle) + list(self.busy.values()):
+            process.join(1)
+            conn.close()
+        self.idle.clear()
+        self.busy.clear()
+
+    def __enter__(self) -> 'WarmBotPool':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def cold_start_ms(spec: str) -> float:
+    """Time to create a tank in a brand new Python, like its .sh file does"""
+    code = ("import sys; sys.path.insert(0, sys.argv[1]); import numpy; "
+            "from multi_bot_launcher import BotLoader; "
+            "[s.create() for s in BotLoader().specs(sys.argv[2])]")
+    started = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code, str(Path(__file__).parent), spec], check=True,
+                   stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - started) * 1000
+
+
+def benchmark(pool: WarmBotPool, spec: str, runs: int = 10):
+    """Compare creating a tank in a new Python with creating it in a warm worker"""
+    warm, setup = [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = pool.result(pool.launch(spec, connect=False))
+        warm.append((time.perf_counter() - started) * 1000)
+        setup.append(result.setup_ms)
+        if result.errors:
+            print(f"❌ {spec}: {result.errors[0]}")
+            return
+    cold = [cold_start_ms(spec) for _ in range(min(runs, 5))]
+
+    print(f"\n📊 Starting {', '.join(result.tanks)} ({runs} runs)")
+    print(f"   Cold start (new Python):     {statistics.median(cold):8.1f} ms")
+    print(f"   Warm worker (hand-off):      {statistics.median(warm):8.1f} ms")
+    print(f"   Warm worker (create tanks):  {statistics.median(setup):8.1f} ms")
+    print(f"   ⚡ {statistics.median(cold) / statistics.median(warm):.0f}x faster per match")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve repeated matches from pre-warmed bot processes')
+    parser.add_argument('bots', nargs='*', help='Tanks for every match (as for multi_bot_launcher.py)')
+    parser.add_argument('--size', type=int, default=os.cpu_count() or 2, help='Idle workers kept ready')
+    parser.add_argument('--matches', type=int, default=1, help='How many matches to play one after another')
+    parser.add_argument('--server-url', default=None, help='Server to connect to (default: ws://localhost:7654)')
+    parser.add_argument('--secret', default=None, help='Server secret for bots')
+    parser.add_argument('--benchmark', action='store_true', help="Time cold vs warm start, don't connect")
+    args = parser.parse_args()
+
+    if args.server_url:
+        os.environ['SERVER_URL'] = args.server_url
+    if args.secret:
+        os.environ['SERVER_SECRET'] = args.secret
+
+    bot_files = find_bot_files()
+    started = time.perf_counter()
+    try:
+        # Every tank in the match needs a worker of its own
+        pool = WarmBotPool(bot_files, max(args.size, len(args.bots)))
+    except ImportError:
+        print("❌ robocode-tank-royale is not installed: pip install -r requirements.txt")
+        sys.exit(1)
+
+    print(f"🔥 Warmed up {len(bot_files) - len(pool.failed)} bot file(s) and {pool.size} worker(s) "
+          f"in {time.perf_counter() - started:.2f}s")
+    for path, reason in pool.failed.items():
+        print(f"⚠️  Could not import {path.relative_to(REPO_ROOT)}: {reason}")
+
+    with pool:
+        if args.benchmark:
+            for spec in args.bots or [str(REPO_ROOT / 'Samples' / 'Target')]:
+                benchmark(pool, spec)
+            return
+
+        if not args.bots:
+            print("❌ Name the tanks to start, e.g. Samples/Corners Samples/Crazy")
+            sys.exit(1)
+
+        try:
+            for match in range(1, args.matches + 1):
+                handles = [pool.launch(spec) for spec in args.bots]
+                results = [pool.result(handle) for handle in handles]
+                setup = max(result.setup_ms for result in results)
+                print(f"🏁 Match {match}/{args.matches} done (tanks ready in {setup:.0f} ms)")
+                for result in results:
+                    for error in result.errors:
+                        print(f"   💥 {error}")
+        except KeyboardInterrupt:
+            print("\n👋 Stopped all tanks")
+
+
+if __name__ == '__main__':
+    main()
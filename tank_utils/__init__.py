@@ -0,0 +1,79 @@
+"""
+Tank Utilities - Shared Helper Functions
+=========================================
+
+This package contains common helper functions used across multiple tank tutorials.
+Instead of copying the same code into every tank, we can import these functions!
+
+Think of this like a toolbox - you don't need to build a hammer for every project,
+you just grab the hammer from your toolbox when you need it!
+
+What's in the toolbox:
+    helpers.py    TankMath, TankTargeting, TankMovement, quick_aim
+    trig.py       normalize_angle, compass (sin/cos tables)
+    tracking.py   EnemyTracker, TargetingSystem (needs numpy)
+    records.py    ScanRecord, EnemyRecord, update_enemy, BulletWarning
+    anytime.py    turn_budget_ms, AnytimeTask, AnytimeScheduler
+    profiling.py  profile_turns, TurnProfiler, LatencyHistogram
+    memory.py     report_memory, MemoryReport (tracemalloc)
+
+Only the drawer you open is loaded: ``from tank_utils import TankMath``
+loads helpers.py, but never numpy or the profiler. Each drawer is loaded
+once per Python process and then shared by every tank in it.
+"""
+
+import importlib
+
+# Which file each name lives in
+_EXPORTS = {
+    'TankMath': 'helpers',
+    'TankTargeting': 'helpers',
+    'TankMovement': 'helpers',
+    'quick_aim': 'helpers',
+    'normalize_angle': 'trig',
+    'compass': 'trig',
+    'EnemyTracker': 'tracking',
+    'TargetingSystem': 'tracking',
+    'ScanRecord': 'records',
+    'EnemyRecord': 'records',
+    'update_enemy': 'records',
+    'BulletWarning': 'records',
+    'turn_budget_ms': 'anytime',
+    'AnytimeTask': 'anytime',
+    'AnytimeScheduler': 'anytime',
+    'profile_turns': 'profiling',
+    'TurnProfiler': 'profiling',
+    'LatencyHistogram': 'profiling',
+    'report_memory': 'memory',
+    'MemoryReport': 'memory',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Load the file a name lives in the first time somebody asks for it"""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Found directly next time
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+def preload(compass_steps=(5, 10, 15)):
+    """
+    Load every drawer (numpy too) and build the common compass tables now
+
+    For programs that start many tanks from one warm process (like
+    warm_bot_pool.py): everything loaded here is shared by the tanks
+    started afterwards, instead of each one loading it in its first turn.
+    """
+    for module in sorted(set(_EXPORTS.values())):
+        importlib.import_module(f".{module}", __name__)
+    for step in compass_steps:
+        __getattr__('compass')(step)
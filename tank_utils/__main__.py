@@ -0,0 +1,13 @@
+"""Quick self-check: python -m tank_utils"""
+
+from tank_utils import TankMath, compass
+
+if __name__ == "__main__":
+    # Run some tests!
+    print("🧪 Testing TankMath...")
+    print(f"Distance (3,4,5 triangle): {TankMath.calculate_distance(0, 0, 3, 4)}")
+    print(f"Angle to (1,0): {TankMath.calculate_angle(0, 0, 1, 0)}°")
+    print(f"Bullet speed (power=2): {TankMath.bullet_speed(2)} px/tick")
+    print(f"Normalize 450°: {TankMath.normalize_angle(450)}°")
+    print(f"Compass directions every 15°: {len(compass(15))}")
+    print("\n✅ Tank utilities loaded and ready to use!")
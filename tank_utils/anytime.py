@@ -0,0 +1,148 @@
+"""
+Anytime Thinking - spreading big calculations over several turns
+
+turn_budget_ms() tells you how much of this turn you can spend, AnytimeTask
+runs a calculation a piece at a time, and AnytimeScheduler shares one
+budget between several tasks.
+"""
+
+import time
+
+
+def turn_budget_ms(bot, share=0.5, default_ms=10.0):
+    """
+    How many milliseconds of this turn your tank can spend on extra thinking
+
+    Uses what is left of the turn (bot.time_left) when the bot API knows it,
+    otherwise the whole turn timeout. Only ``share`` of it is handed out,
+    the rest is kept as a safety margin for go() and the event handlers.
+
+    Example:
+        >>> self.thinking.run(turn_budget_ms(self))   # Half of what's left this turn
+    """
+    for name in ("time_left", "turn_timeout"):
+        try:
+            microseconds = getattr(bot, name)
+        except Exception:  # Not connected yet
+            continue
+        if isinstance(microseconds, (int, float)) and microseconds > 0:
+            return microseconds / 1000 * share
+    return default_ms
+
+
+class AnytimeTask:
+    """
+    A big calculation that may be spread over several turns
+
+    Some tank brains (building a danger map, searching for the best shot,
+    finding clusters of enemies) take longer than one turn allows. If your
+    tank waits for them, it misses turns and stands still!
+
+    An "anytime" calculation is written as a generator: it does a small
+    piece of work and then ``yield``s the best answer it has so far (or
+    None if it has none yet). The task runs pieces until its time is up -
+    always at least one, so it never gets stuck - and carries on where it
+    stopped next turn. ``result`` is always usable: the best answer so far,
+    or the last one found while a new calculation is still getting started.
+
+    Args:
+        steps: Generator function doing the work (yields best-so-far answers)
+        inputs: Optional function returning the arguments for a fresh
+            calculation; the task then restarts by itself after finishing
+        default: ``result`` before anything was found
+
+    Example:
+        >>> def best_spot(field):
+        ...     best = None
+        ...     for row in range(len(field)):          # One row per piece
+        ...         ...
+        ...         yield best
+        >>> task = AnytimeTask(best_spot, inputs=lambda: (self.field,))
+        >>> task.run_for(5)      # At most about 5 ms this turn
+        >>> x, y = task.result
+    """
+
+    def __init__(self, steps, inputs=None, default=None, name=None):
+        self.steps = steps
+        self.inputs = inputs
+        self.name = name or getattr(steps, "__name__", "task")
+        self.result = default
+        self.finished_result = default
+        self.done = True            # Nothing running yet
+        self.finished = 0           # Calculations completed
+        self.turns_used = 0         # Turns the last finished calculation took
+        self._generator = None
+        self._turns = 0
+
+    def start(self, *args, **kwargs):
+        """Begin a new calculation (an unfinished one is dropped)"""
+        self._generator = self.steps(*args, **kwargs)
+        self._turns = 0
+        self.done = False
+
+    def step_until(self, deadline):
+        """Run pieces until time.perf_counter() reaches deadline (or the work is done)"""
+        if self.done:
+            if self.inputs is None:
+                return self.result
+            self.start(*self.inputs())
+        self._turns += 1
+        generator = self._generator
+        try:
+            while True:
+                answer = next(generator)
+                if answer is not None:
+                    self.result = answer
+                if time.perf_counter() >= deadline:
+                    break
+        except StopIteration as stop:
+            if stop.value is not None:  # "return answer" at the end also counts
+                self.result = stop.value
+            self.finished_result = self.result
+            self.done = True
+            self.finished += 1
+            self.turns_used = self._turns
+            self._generator = None
+        return self.result
+
+    def run_for(self, milliseconds):
+        """Run pieces for about this many milliseconds"""
+        return self.step_until(time.perf_counter() + milliseconds / 1000)
+
+
+class AnytimeScheduler:
+    """
+    Shares one time budget per turn between several AnytimeTasks
+
+    Each unfinished task gets a slice of the budget in proportion to its
+    ``share``. Time a task doesn't need (because it finished early) goes
+    to the others.
+
+    Example:
+        >>> self.thinking = AnytimeScheduler()
+        >>> self.field_task = self.thinking.add(AnytimeTask(build_field, inputs=...), share=2)
+        >>> self.shot_task = self.thinking.add(AnytimeTask(search_shot, inputs=...))
+        >>> # Every turn, in run():
+        >>> self.thinking.run(turn_budget_ms(self))
+    """
+
+    def __init__(self):
+        self.tasks = []
+
+    def add(self, task, share=1.0):
+        self.tasks.append((task, share))
+        return task
+
+    def run(self, budget_ms):
+        """Give the tasks at most budget_ms milliseconds in total"""
+        deadline = time.perf_counter() + budget_ms / 1000
+        waiting = [(task, share) for task, share in self.tasks if not task.done or task.inputs]
+        while waiting:
+            left = deadline - time.perf_counter()
+            if left <= 0:
+                break
+            total_share = sum(share for _, share in waiting)
+            task, share = waiting.pop(0)
+            task.step_until(time.perf_counter() + left * share / total_share)
+            if not task.done:  # Used its whole slice; let it go last with what remains
+                waiting.append((task, share))
@@ -1,16 +1,14 @@
 """
-Tank Utilities - Shared Helper Functions
-=========================================
+Tank Helpers - the first shared toolbox (Week 2 onwards)
 
-This module contains common helper functions used across multiple tank tutorials.
-Instead of copying the same code into every tank, we can import these functions!
-
-Think of this like a toolbox - you don't need to build a hammer for every project,
-you just grab the hammer from your toolbox when you need it!
+Distance, angles, predicting where a tank will be, aiming and wall checks.
+Only needs Python's math module, so it loads in well under a millisecond.
 """
 
 import math
 
+from .trig import normalize_angle
+
 
 class TankMath:
     """Mathematical helper functions for tank combat"""
@@ -103,11 +101,7 @@ class TankMath:
             >>> TankMath.normalize_angle(-270)
             90.0
         """
-        while angle > 180:
-            angle -= 360
-        while angle < -180:
-            angle += 360
-        return angle
+        return normalize_angle(angle)  # See trig.py for how the wrapping works
     
     @staticmethod
     def bullet_speed(power):
@@ -303,13 +297,3 @@ def quick_aim(bot, event, fire_power=2):
         fire_power
     )
     return aim_angle
-
-
-if __name__ == "__main__":
-    # Run some tests!
-    print("🧪 Testing TankMath...")
-    print(f"Distance (3,4,5 triangle): {TankMath.calculate_distance(0, 0, 3, 4)}")
-    print(f"Angle to (1,0): {TankMath.calculate_angle(0, 0, 1, 0)}°")
-    print(f"Bullet speed (power=2): {TankMath.bullet_speed(2)} px/tick")
-    print(f"Normalize 450°: {TankMath.normalize_angle(450)}°")
-    print("\n✅ Tank utilities loaded and ready to use!")
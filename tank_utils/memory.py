@@ -0,0 +1,135 @@
+"""
+Memory Reports - how much memory is your tank holding on to?
+
+Add @report_memory above a tank class (or use multi_bot_launcher.py
+--memory) and after every round it prints how much memory the tank's
+own code has allocated and not let go of yet, which lines hold the most,
+and how much that grew since the last round. Memory that keeps growing
+round after round is a leak: a list or dictionary that only ever gets
+new entries.
+
+It uses Python's tracemalloc module, which makes every allocation a
+little slower - use it while developing, not in a tournament.
+"""
+
+import os
+import sys
+import inspect
+import tracemalloc
+
+from .profiling import _after_round
+
+TRACE_FRAMES = 10   # How far up the call stack to look for the tank's own code
+
+
+def peak_rss_mb():
+    """Most memory this whole Python process has used so far, in MB"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class MemoryReport:
+    """
+    Memory allocated by one tank's files, measured with tracemalloc
+
+    An allocation counts for the tank when the tank's code is anywhere in
+    the call stack that made it - so numpy arrays or records made by
+    tank_utils on the tank's behalf count too, under the tank's line that
+    asked for them. Copies of the same tank class share one report.
+
+    Args:
+        name: Tank name for the report
+        files: The tank's .py files
+        top: How many lines to list
+    """
+
+    def __init__(self, name, files, top=5):
+        self.name = name
+        self.files = set(files)
+        self.top = top
+        self.round_number = 0
+        self.last_total = None
+        self.last_round = None      # Bot API round of the last report (copies share one)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+
+    def measure(self):
+        """
+        Returns:
+            (total bytes, {(file, line): (bytes, blocks)}) still allocated
+        """
+        total = 0
+        lines = {}
+        for trace in tracemalloc.take_snapshot().traces:
+            for frame in reversed(trace.traceback):  # Most recent call first
+                if frame.filename in self.files:
+                    key = (frame.filename, frame.lineno)
+                    size, blocks = lines.get(key, (0, 0))
+                    lines[key] = (size + trace.size, blocks + 1)
+                    total += trace.size
+                    break
+        return total, lines
+
+    def report(self):
+        """Measure now and describe it (including the growth since the last report)"""
+        self.round_number += 1
+        total, lines = self.measure()
+        growth = "" if self.last_total is None else f" ({(total - self.last_total) / 1024:+.1f} KB since last round)"
+        self.last_total = total
+        report = [f"🧠 Memory for {self.name} - round {self.round_number}",
+                  f"   Live: {total / 1024:.1f} KB{growth}   Whole process peak: {peak_rss_mb():.0f} MB"]
+        biggest = sorted(lines.items(), key=lambda item: item[1][0], reverse=True)[:self.top]
+        for (filename, lineno), (size, blocks) in biggest:
+            where = f"{os.path.basename(filename)}:{lineno}"
+            report.append(f"   {where:<30} {size / 1024:>9.1f} KB {blocks:>7} blocks")
+        return "\n".join(report)
+
+
+def _print_memory_report(bot):
+    report = bot.memory_report
+    try:
+        game_round = bot.round_number
+    except Exception:  # Not connected, or an API without this property
+        game_round = None
+    if game_round is not None and game_round == report.last_round:
+        return  # Another copy of this tank already reported this round
+    report.last_round = game_round
+    print(report.report(), flush=True)
+
+
+def report_memory(bot_class):
+    """
+    Print how much memory your tank holds at the end of every round (add it above your class)
+
+    Example:
+        >>> from tank_utils import report_memory
+        >>> @report_memory
+        ... class MyTank(Bot):
+        ...     ...
+
+    It works on a tank class you didn't write too:
+        >>> WatchedTank = report_memory(SpinBot)
+    """
+    files = set()
+    for klass in bot_class.__mro__:
+        if klass.__module__.startswith("robocode_tank_royale") or klass is object:
+            continue
+        try:
+            files.add(inspect.getfile(klass))
+        except TypeError:  # Built-in class
+            pass
+    report = MemoryReport(bot_class.__name__, files)  # Starts tracing now, before any tank is made
+
+    namespace = {
+        "memory_report": report,
+        "__module__": bot_class.__module__,
+        "__qualname__": bot_class.__qualname__,
+        "__doc__": bot_class.__doc__,
+    }
+    if hasattr(bot_class, "on_round_ended"):
+        namespace["on_round_ended"] = _after_round(bot_class.on_round_ended, _print_memory_report)
+    return type(bot_class.__name__, (bot_class,), namespace)
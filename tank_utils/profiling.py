@@ -0,0 +1,259 @@
+"""
+Turn Profiling - how long does your tank take each turn?
+
+Add @profile_turns above a tank class (or use multi_bot_launcher.py
+--profile) to get a table of turn and event handler timings every round.
+"""
+
+import time
+import bisect
+import inspect
+import functools
+
+
+class LatencyHistogram:
+    """
+    Counts how long something took, in buckets (like a bar chart)
+
+    Keeping every single timing would use more and more memory during a
+    long battle, so timings are counted in buckets that grow 26% each
+    (10 per power of ten, from 1 microsecond to 10 seconds). Percentiles
+    are read from the buckets, so they are accurate to about a quarter.
+    """
+
+    BOUNDS_NS = [int(1000 * 10 ** (i / 10)) for i in range(71)]
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS_NS) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns):
+        self.counts[bisect.bisect_left(self.BOUNDS_NS, ns)] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentile(self, p):
+        """
+        Time (in ms) that p percent of the calls stayed under
+
+        Example:
+            >>> histogram.percentile(99)   # 99 out of 100 calls were faster than this
+        """
+        if not self.count:
+            return 0.0
+        wanted = p / 100 * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= wanted:
+                ns = self.BOUNDS_NS[i] if i < len(self.BOUNDS_NS) else self.max_ns
+                return min(ns, self.max_ns) / 1e6
+        return self.max_ns / 1e6
+
+
+class TurnProfiler:
+    """
+    Measures how much time a tank spends on each turn
+
+    Tank Royale skips your turn if you don't call go() in time (the "turn
+    timeout", usually 30 ms). This keeps a LatencyHistogram for:
+
+    - "turn": everything your tank did in one turn
+    - "run loop": your run() code between two go() calls
+    - every event handler, like on_scanned_bot
+
+    ...and counts the skipped turns. You normally don't make one yourself,
+    @profile_turns does that (see below).
+    """
+
+    def __init__(self, name="Tank"):
+        self.name = name
+        self.histograms = {}
+        self.skipped_turns = 0
+        self.round_number = 0
+        self._handler_ns = 0
+        self._loop_ns = 0
+        self._last_go_ns = None
+
+    def record(self, what, ns):
+        histogram = self.histograms.get(what)
+        if histogram is None:
+            histogram = self.histograms[what] = LatencyHistogram()
+        histogram.record(ns)
+
+    def handler_done(self, what, ns):
+        self.record(what, ns)
+        self._handler_ns += ns
+
+    def go_called(self):
+        """Just before go(): the run loop's work for this turn is done"""
+        now = time.perf_counter_ns()
+        if self._last_go_ns is not None:
+            self.record("run loop", now - self._last_go_ns)
+            self._loop_ns = now - self._last_go_ns
+        else:
+            self._loop_ns = 0
+
+    def go_returned(self):
+        """Just after go(): the next turn starts"""
+        self.record("turn", self._loop_ns + self._handler_ns)
+        self._handler_ns = 0
+        self._last_go_ns = time.perf_counter_ns()
+
+    def reset(self):
+        self.histograms = {}
+        self.skipped_turns = 0
+        self._handler_ns = 0
+        self._last_go_ns = None
+
+    def report(self, turn_timeout_us=None):
+        """The profile as a table (times in milliseconds)"""
+        budget = f" (turn timeout {turn_timeout_us / 1000:.1f} ms)" if turn_timeout_us else ""
+        lines = [f"⏱️  Turn profile for {self.name} - round {self.round_number}{budget}",
+                 f"   {'What':<24} {'Calls':>7} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}"]
+        order = ["turn", "run loop"] + sorted(k for k in self.histograms if k not in ("turn", "run loop"))
+        for what in order:
+            histogram = self.histograms.get(what)
+            if histogram is None:
+                continue
+            p99 = histogram.percentile(99)
+            slow = " ⚠️" if turn_timeout_us and p99 * 1000 > turn_timeout_us / 2 else ""
+            lines.append(f"   {what:<24} {histogram.count:>7} {histogram.percentile(50):>8.3f} "
+                         f"{p99:>8.3f} {histogram.max_ns / 1e6:>8.3f}{slow}")
+        lines.append(f"   Skipped turns: {self.skipped_turns}")
+        return "\n".join(lines)
+
+
+def _timed(what, method):
+    """Wrap a handler so every call is timed (works for normal and async handlers)"""
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def timed(self, *args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                self.turn_profiler.handler_done(what, time.perf_counter_ns() - start)
+    else:
+        @functools.wraps(method)
+        def timed(self, *args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.turn_profiler.handler_done(what, time.perf_counter_ns() - start)
+    return timed
+
+
+def _timed_go(go):
+    if inspect.iscoroutinefunction(go):  # Older bot APIs: await self.go()
+        @functools.wraps(go)
+        async def timed_go(self):
+            self.turn_profiler.go_called()
+            try:
+                return await go(self)
+            finally:
+                self.turn_profiler.go_returned()
+    else:
+        @functools.wraps(go)
+        def timed_go(self):
+            self.turn_profiler.go_called()
+            try:
+                return go(self)
+            finally:
+                self.turn_profiler.go_returned()
+    return timed_go
+
+
+def _counting_skips(on_skipped_turn):
+    @functools.wraps(on_skipped_turn)
+    def on_skipped(self, event):
+        self.turn_profiler.skipped_turns += 1
+        return on_skipped_turn(self, event)
+    return on_skipped
+
+
+def _after_round(on_round_ended, after):
+    """Call after(bot) once the round's own on_round_ended handler is done"""
+    if inspect.iscoroutinefunction(on_round_ended):
+        @functools.wraps(on_round_ended)
+        async def on_round(self, event):
+            try:
+                return await on_round_ended(self, event)
+            finally:
+                after(self)
+    else:
+        @functools.wraps(on_round_ended)
+        def on_round(self, event):
+            try:
+                return on_round_ended(self, event)
+            finally:
+                after(self)
+    return on_round
+
+
+def _print_turn_profile(bot):
+    """Print (and start over) the profile"""
+    profiler = bot.turn_profiler
+    profiler.round_number += 1
+    try:
+        timeout = bot.turn_timeout
+    except Exception:  # Not connected, or an API without this property
+        timeout = None
+    print(profiler.report(timeout if isinstance(timeout, (int, float)) else None), flush=True)
+    profiler.reset()
+
+
+def profile_turns(bot_class):
+    """
+    Measure how long your tank takes each turn (add it above your class)
+
+    Times the run loop (between go() calls) and every event handler your
+    tank has, counts skipped turns, and prints a table at the end of each
+    round. Remove it again when you're done: timing costs a little time too
+    (a few microseconds per call - tiny next to a 30 ms turn).
+
+    Example:
+        >>> from tank_utils import profile_turns
+        >>> @profile_turns
+        ... class MyTank(Bot):
+        ...     def on_scanned_bot(self, event):
+        ...         ...
+
+    It works on a tank class you didn't write too:
+        >>> FastTank = profile_turns(SpinBot)
+    """
+    def defined_by_tank(name):
+        # Handlers the bot API provides do nothing; only time the tank's own ones
+        for klass in bot_class.__mro__:
+            if name in vars(klass):
+                return not klass.__module__.startswith("robocode_tank_royale")
+        return False
+
+    namespace = {}
+    for name in dir(bot_class):
+        if name.startswith("on_") and name not in ("on_skipped_turn", "on_round_ended") \
+                and callable(getattr(bot_class, name)) and defined_by_tank(name):
+            namespace[name] = _timed(name, getattr(bot_class, name))
+    if hasattr(bot_class, "go"):
+        namespace["go"] = _timed_go(bot_class.go)
+    if hasattr(bot_class, "on_skipped_turn"):
+        namespace["on_skipped_turn"] = _counting_skips(bot_class.on_skipped_turn)
+    if hasattr(bot_class, "on_round_ended"):
+        namespace["on_round_ended"] = _after_round(bot_class.on_round_ended, _print_turn_profile)
+
+    def turn_profiler(self):
+        profiler = self.__dict__.get("_turn_profiler")
+        if profiler is None:
+            profiler = self.__dict__["_turn_profiler"] = TurnProfiler(bot_class.__name__)
+        return profiler
+
+    namespace["turn_profiler"] = property(turn_profiler)
+    namespace["__module__"] = bot_class.__module__
+    namespace["__qualname__"] = bot_class.__qualname__
+    namespace["__doc__"] = bot_class.__doc__
+    return type(bot_class.__name__, (bot_class,), namespace)
@@ -0,0 +1,129 @@
+"""
+Compact Records - small objects for what a tank remembers
+
+Tanks often remember an enemy as a dictionary:
+
+    self.enemies[event.scanned_bot_id] = {'x': event.x, 'y': event.y, ...}
+
+That works, but a dictionary with 7 keys takes about 270 bytes, and a new
+one is made for every scan. The records here hold the same values in
+about 90 bytes, because they use ``__slots__`` (a fixed list of
+attributes instead of a dictionary) or are a NamedTuple:
+
+    ScanRecord      one scan, frozen (a NamedTuple - can't be changed)
+    EnemyRecord     the latest on one enemy, updated in place every scan
+    BulletWarning   an enemy bullet we think is on its way
+
+With many tanks in one Python (multi_bot_launcher.py, warm_bot_pool.py)
+that is the difference between a few MB and a few dozen.
+
+Example:
+    >>> from tank_utils import update_enemy
+    >>> def on_scanned_bot(self, event):
+    ...     enemy = update_enemy(self.enemies, event, self.x, self.y, self.turn_number)
+    ...     if enemy.distance < 200:
+    ...         ...
+"""
+
+import math
+from typing import NamedTuple
+
+
+class ScanRecord(NamedTuple):
+    """One scan of a tank, as it was at that moment"""
+    x: float
+    y: float
+    energy: float
+    speed: float
+    direction: float
+    distance: float
+    tick: int = 0
+
+    @classmethod
+    def from_event(cls, event, my_x, my_y, tick=0):
+        """Record a ScannedBotEvent, seen from (my_x, my_y)"""
+        return cls(event.x, event.y, event.energy, event.speed, event.direction,
+                   math.hypot(event.x - my_x, event.y - my_y), tick)
+
+
+class EnemyRecord:
+    """
+    What we know about one enemy (changed in place, never copied)
+
+    Attributes:
+        enemy_id, x, y, energy, speed, direction, distance (from us when
+        last seen) and last_seen (tick)
+    """
+
+    __slots__ = ('enemy_id', 'x', 'y', 'energy', 'speed', 'direction', 'distance', 'last_seen')
+
+    def __init__(self, enemy_id, x=0.0, y=0.0, energy=0.0, speed=0.0, direction=0.0,
+                 distance=0.0, last_seen=0):
+        self.enemy_id = enemy_id
+        self.x = x
+        self.y = y
+        self.energy = energy
+        self.speed = speed
+        self.direction = direction
+        self.distance = distance
+        self.last_seen = last_seen
+
+    def update(self, event, my_x, my_y, tick=0):
+        """Copy in a new ScannedBotEvent, seen from (my_x, my_y)"""
+        self.x = event.x
+        self.y = event.y
+        self.energy = event.energy
+        self.speed = event.speed
+        self.direction = event.direction
+        self.distance = math.hypot(event.x - my_x, event.y - my_y)
+        self.last_seen = tick
+        return self
+
+    def __repr__(self):
+        return (f"EnemyRecord({self.enemy_id!r}, x={self.x:.0f}, y={self.y:.0f}, "
+                f"energy={self.energy:.1f}, distance={self.distance:.0f})")
+
+
+def update_enemy(enemies, event, my_x, my_y, tick=0):
+    """
+    Update (or add) the scanned tank's EnemyRecord in a dictionary
+
+    Args:
+        enemies: Dictionary of scanned_bot_id -> EnemyRecord
+        event: The ScannedBotEvent
+        my_x, my_y: Where we are (for the distance)
+        tick: The current turn
+
+    Returns:
+        The tank's EnemyRecord
+    """
+    enemy = enemies.get(event.scanned_bot_id)
+    if enemy is None:
+        enemy = enemies[event.scanned_bot_id] = EnemyRecord(event.scanned_bot_id)
+    return enemy.update(event, my_x, my_y, tick)
+
+
+class BulletWarning:
+    """
+    An enemy bullet we think is flying at us (we saw the enemy's energy drop)
+
+    The direction's sin and cos are worked out once, not every turn.
+    """
+
+    __slots__ = ('power', 'origin_x', 'origin_y', 'angle', 'speed', 'sin_a', 'cos_a', 'age')
+
+    def __init__(self, power, origin_x, origin_y, angle):
+        self.power = power
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.angle = angle
+        self.speed = 20 - 3 * power
+        radians = math.radians(angle)
+        self.sin_a = math.sin(radians)
+        self.cos_a = math.cos(radians)
+        self.age = 0
+
+    def position(self):
+        """Where the bullet is now (after ``age`` ticks)"""
+        travelled = self.speed * self.age
+        return self.origin_x + travelled * self.sin_a, self.origin_y + travelled * self.cos_a
@@ -0,0 +1,139 @@
+"""
+Multi-Enemy Tracking - the Week 7 NumPy systems, shared
+
+TargetingSystem and EnemyTracker used to be copied into every melee tank.
+They live here now, so a tank can simply import them:
+
+    from tank_utils import EnemyTracker, TargetingSystem
+
+This is the only part of tank_utils that needs numpy. It is only loaded
+when a tank asks for one of these classes, so simple tanks never wait
+for numpy to load.
+"""
+
+import math
+
+import numpy as np
+
+
+class TargetingSystem:
+    """Distance, angle and prediction math - for one enemy or ALL of them at once"""
+
+    def calculate_distance(self, from_x, from_y, to_x, to_y):
+        """Distance to one point (Pythagorean theorem)"""
+        x_diff = to_x - from_x
+        y_diff = to_y - from_y
+        return math.sqrt(x_diff**2 + y_diff**2)
+
+    def calculate_distances(self, my_x, my_y, enemy_x, enemy_y):
+        """Distance to ALL enemies at once (vectorized)"""
+        x_diff = enemy_x - my_x
+        y_diff = enemy_y - my_y
+        return np.sqrt(x_diff**2 + y_diff**2)
+
+    def calculate_angle(self, from_x, from_y, to_x, to_y):
+        """Angle to one point (0° = North, 90° = East)"""
+        x_diff = to_x - from_x
+        y_diff = to_y - from_y
+        return math.degrees(math.atan2(x_diff, y_diff))
+
+    def calculate_angles(self, my_x, my_y, enemy_x, enemy_y):
+        """Angles to ALL enemies at once"""
+        x_diff = enemy_x - my_x
+        y_diff = enemy_y - my_y
+        return np.degrees(np.arctan2(x_diff, y_diff))
+
+    def predict_position(self, x, y, velocity, heading, time):
+        """Where one enemy will be after ``time`` ticks (straight-line guess)"""
+        heading_rad = math.radians(heading)
+        future_x = x + velocity * time * math.sin(heading_rad)
+        future_y = y + velocity * time * math.cos(heading_rad)
+        return future_x, future_y
+
+    def predict_positions(self, x, y, vx, vy, time):
+        """Where ALL enemies will be after ``time`` ticks"""
+        future_x = x + vx * time
+        future_y = y + vy * time
+        return future_x, future_y
+
+    def calculate_bullet_speed(self, power):
+        """Bullet speed for a fire power (20 - 3 * power)"""
+        return 20 - 3 * power
+
+
+class EnemyTracker:
+    """
+    Track many enemies in NumPy arrays (one column per enemy)
+
+    Like the Week 7 tracker, ``x``, ``y``, ``vx``, ``vy``, ``energy`` and
+    ``last_seen`` are arrays with one value per enemy, in the same order
+    as ``enemy_ids``. Two things are faster:
+    - The arrays are made once, big enough for max_enemies. A new enemy
+      fills the next free column instead of copying every array with
+      np.append()
+    - Each enemy's column is remembered in a dictionary, so finding it
+      doesn't search the whole enemy_ids list
+
+    The arrays are views of the current enemies: read them, or change
+    single values, but get fresh ones after update() or cleanup().
+    """
+
+    FIELDS = ('x', 'y', 'vx', 'vy', 'energy', 'last_seen')
+
+    def __init__(self, max_enemies=50):
+        self.max_enemies = max_enemies
+        self._data = np.zeros((len(self.FIELDS), max_enemies))
+        self.clear()
+
+    def clear(self):
+        """Forget every enemy"""
+        self.enemy_ids = []
+        self._columns = {}
+
+    def _field(row):
+        return property(lambda self: self._data[row, :len(self.enemy_ids)])
+
+    x = _field(0)
+    y = _field(1)
+    vx = _field(2)
+    vy = _field(3)
+    energy = _field(4)
+    last_seen = _field(5)
+    del _field
+
+    def index_of(self, enemy_id):
+        """Column of an enemy in the arrays, or None if we don't track it"""
+        return self._columns.get(enemy_id)
+
+    def update(self, enemy_id, x, y, vx, vy, energy, tick):
+        """Add or update an enemy (new enemies are ignored once max_enemies are tracked)"""
+        column = self._columns.get(enemy_id)
+        if column is None:
+            if len(self.enemy_ids) >= self.max_enemies:
+                return
+            column = self._columns[enemy_id] = len(self.enemy_ids)
+            self.enemy_ids.append(enemy_id)
+        self._data[:, column] = (x, y, vx, vy, energy, tick)
+
+    def cleanup(self, current_tick, max_age=200):
+        """
+        Forget enemies not seen for max_age ticks
+
+        Returns:
+            The ids of the enemies that were forgotten
+        """
+        if not self.enemy_ids:
+            return []
+        keep = (current_tick - self.last_seen) < max_age
+        if keep.all():
+            return []
+        removed = [enemy_id for enemy_id, kept in zip(self.enemy_ids, keep) if not kept]
+        kept_columns = np.flatnonzero(keep)
+        self._data[:, :len(kept_columns)] = self._data[:, kept_columns]
+        self.enemy_ids = [self.enemy_ids[i] for i in kept_columns]
+        self._columns = {enemy_id: column for column, enemy_id in enumerate(self.enemy_ids)}
+        return removed
+
+    def count(self):
+        """Number of tracked enemies"""
+        return len(self.enemy_ids)
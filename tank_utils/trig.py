@@ -0,0 +1,58 @@
+"""
+Trig Tables - sines and cosines worked out once, then looked up
+
+Lots of tanks check the same set of directions every turn: "every 15
+degrees around me, how safe is that spot?" That is 24 directions, each
+needing a sin() and a cos(), over and over, turn after turn.
+
+compass(15) works those out ONCE per Python process and hands back the
+same table every time after that - to every tank in the process (the
+multi-bot launcher and the warm bot pool run many tanks in one Python).
+
+Note: for a single angle, plain math.sin(math.radians(a)) is already as
+fast as anything we could look up in Python. The tables pay off when the
+same directions are used again and again.
+"""
+
+import math
+import functools
+
+
+def normalize_angle(angle):
+    """
+    Wrap any angle (in degrees) into -180 to 180
+
+    Uses % (remainder) instead of adding or taking away 360 in a loop,
+    so even an angle like 1,000,000° takes one step.
+
+    Example:
+        >>> normalize_angle(450)
+        90
+        >>> normalize_angle(-270)
+        90
+    """
+    angle %= 360              # Now 0 to 360
+    return angle - 360 if angle > 180 else angle
+
+
+@functools.lru_cache(maxsize=None)
+def compass(step=15):
+    """
+    Every direction around the tank, ``step`` degrees apart
+
+    Returns:
+        A tuple of (degrees, sin, cos) for 0, step, 2*step... below 360.
+        Built on the first call, shared by every later call (and tank).
+
+    Example:
+        >>> for angle, sin_a, cos_a in compass(15):
+        ...     test_x = my_x + distance * sin_a
+        ...     test_y = my_y + distance * cos_a
+    """
+    count = round(360 / step)
+    table = []
+    for i in range(count):
+        degrees = i * step
+        radians = math.radians(degrees)
+        table.append((degrees, math.sin(radians), math.cos(radians)))
+    return tuple(table)